@@ -378,6 +378,25 @@ class CrossFilter(object):
         filter_index = left_index * self.right_filter.num_bins + right_index
         return filter_index
 
+    def get_bin_indices(self, filter_bins):
+        """Returns the indices in the CrossFilter for a sequence of bins.
+
+        Parameters
+        ----------
+        filter_bins : Iterable of 2-tuple
+            The bins to find. Each bin takes the same form as for
+            :meth:`CrossFilter.get_bin_index`.
+
+        Returns
+        -------
+        numpy.ndarray
+             The indices in the Tally data array for the filter bins.
+
+        """
+
+        return np.array([self.get_bin_index(filter_bin)
+                         for filter_bin in filter_bins], dtype=int)
+
     def get_pandas_dataframe(self, data_size, summary=None):
         """Builds a Pandas DataFrame for the CrossFilter's bins.
 
@@ -753,6 +772,25 @@ class AggregateFilter(object):
         else:
             return self.bins.index(filter_bin)
 
+    def get_bin_indices(self, filter_bins):
+        """Returns the indices in the AggregateFilter for a sequence of bins.
+
+        Parameters
+        ----------
+        filter_bins : Iterable of tuple
+            The bins to find. Each bin takes the same form as for
+            :meth:`AggregateFilter.get_bin_index`.
+
+        Returns
+        -------
+        numpy.ndarray
+             The indices in the Tally data array for the filter bins.
+
+        """
+
+        return np.array([self.get_bin_index(filter_bin)
+                         for filter_bin in filter_bins], dtype=int)
+
     def get_pandas_dataframe(self, data_size, summary=None, **kwargs):
         """Builds a Pandas DataFrame for the AggregateFilter's bins.
 
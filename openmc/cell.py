@@ -12,7 +12,7 @@ import numpy as np
 import openmc
 import openmc.checkvalue as cv
 from openmc.surface import Halfspace
-from openmc.region import Region, Intersection, Complement
+from openmc.region import Region, Intersection, Complement, _RegionProgram
 from .mixin import IDManagerMixin
 
 
@@ -71,10 +71,11 @@ class Cell(IDManagerMixin):
     translation : Iterable of float
         If the cell is filled with a universe, this array specifies a vector
         that is used to translate (shift) the universe.
-    paths : list of str
+    paths : Sequence of str
         The paths traversed through the CSG tree to reach each cell
         instance. This property is initialized by calling the
-        :meth:`Geometry.determine_paths` method.
+        :meth:`Geometry.determine_paths` method. The paths are generated on
+        demand when they are accessed.
     num_instances : int
         The number of instances of this cell throughout the geometry.
     volume : float
@@ -87,12 +88,20 @@ class Cell(IDManagerMixin):
     next_id = 1
     used_ids = set()
 
+    # Number of times the fill of the cell has been changed
+    _version = 0
+
     def __init__(self, cell_id=None, name='', fill=None, region=None):
         # Initialize Cell class attributes
+        self._region_expression = None
+        self._fill_reader = None
         self.id = cell_id
         self.name = name
         self.fill = fill
-        self.region = region
+        if region is not None:
+            cv.check_type('cell region', region, Region)
+        self._region = region
+        self._region_program = None
         self._rotation = None
         self._rotation_matrix = None
         self._temperature = None
@@ -106,7 +115,34 @@ class Cell(IDManagerMixin):
         if self.region is None:
             return True
         else:
-            return point in self.region
+            return self._compiled_region().contains(point)
+
+    def contains_points(self, points):
+        """Check which of many points are contained in the cell.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array indicating whether each point is in the cell
+
+        """
+        if self.region is None:
+            return np.ones(len(points), dtype=bool)
+        else:
+            return self._compiled_region().contains_points(points)
+
+    def _compiled_region(self):
+        """Return the cell's region compiled into a flat program, compiling it
+        again if the region has been modified in place since."""
+        program = self._region_program
+        if program is None or not program.versions.is_current():
+            program = self._region_program = _RegionProgram(self.region)
+        return program
 
     def __eq__(self, other):
         if not isinstance(other, Cell):
@@ -164,6 +200,11 @@ class Cell(IDManagerMixin):
 
     @property
     def fill(self):
+        # Create a lattice that was read from a summary file only when needed
+        if self._fill_reader is not None:
+            reader = self._fill_reader
+            self._fill_reader = None
+            self._fill = reader()
         return self._fill
 
     @property
@@ -181,6 +222,11 @@ class Cell(IDManagerMixin):
 
     @property
     def region(self):
+        # Parse a region that was read from a summary file only when needed
+        if self._region_expression is not None:
+            expression, surfaces = self._region_expression
+            self._region_expression = None
+            self._region = Region.from_expression(expression, surfaces)
         return self._region
 
     @property
@@ -255,7 +301,12 @@ class Cell(IDManagerMixin):
                       'Universe fill "{1}"'.format(self._id, fill)
                 raise ValueError(msg)
 
+        # Record in-place changes of distributed materials
+        if isinstance(fill, list):
+            fill = openmc.geometry._track(fill, self)
         self._fill = fill
+        self._fill_reader = None
+        openmc.geometry._modified(self)
 
     @rotation.setter
     def rotation(self, rotation):
@@ -310,6 +361,9 @@ class Cell(IDManagerMixin):
         if region is not None:
             cv.check_type('cell region', region, Region)
         self._region = region
+        self._region_expression = None
+        self._region_program = None
+        Region._modifications += 1
 
     @volume.setter
     def volume(self, volume):
@@ -511,6 +565,12 @@ class Cell(IDManagerMixin):
 
         # If no nemoize'd clone exists, instantiate one
         if self not in memo:
+            # Parse any deferred region and create any deferred lattice so
+            # that they are not deep copied along with every surface and
+            # universe of the summary they were read from
+            region = self.region
+            fill = self.fill
+
             # Temporarily remove paths
             paths = self._paths
             self._paths = None
@@ -522,14 +582,14 @@ class Cell(IDManagerMixin):
             # Restore paths on original instance
             self._paths = paths
 
-            if self.region is not None:
-                clone.region = self.region.clone(memo)
-            if self.fill is not None:
+            if region is not None:
+                clone.region = region.clone(memo)
+            if fill is not None:
                 if self.fill_type == 'distribmat':
-                    clone.fill = [fill.clone(memo) if fill is not None else None
-                                  for fill in self.fill]
+                    clone.fill = [f.clone(memo) if f is not None else None
+                                  for f in fill]
                 else:
-                    clone.fill = self.fill.clone(memo)
+                    clone.fill = fill.clone(memo)
 
             # Memoize the clone
             memo[self] = clone
@@ -12,7 +12,7 @@ import io
 import re
 import os
 from math import pi
-from collections import OrderedDict, Iterable
+from collections import OrderedDict, Iterable, MutableMapping
 
 from six import string_types
 import numpy as np
@@ -72,6 +72,71 @@ def float_endf(s):
     return float(ENDF_FLOAT_RE.sub(r'\1e\2', s))
 
 
+def _read_fields(file_obj, n):
+    """Read the 11-character fields of a sequence of records.
+
+    Parameters
+    ----------
+    file_obj : file-like object
+        ENDF-6 file to read from
+    n : int
+        Number of fields to read. The fields are read six per line, so
+        ceil(n/6) lines are consumed.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of fields as byte strings of length 11
+
+    """
+    lines = [file_obj.readline() for i in range((n + 5)//6)]
+    text = ''.join([line.rstrip('\r\n')[:66].ljust(66) for line in lines])
+    return np.frombuffer(text.encode('ascii'), dtype='S11')[:n]
+
+
+def _fields_to_float(fields):
+    """Convert fixed-width fields in ENDF 'e-less' notation to floats.
+
+    Rather than converting each field separately with :func:`float_endf`, the
+    position of the exponent sign is found for all fields at once and an 'e'
+    is inserted in front of it before NumPy converts the fields in bulk.
+
+    Parameters
+    ----------
+    fields : numpy.ndarray
+        Array of fields as byte strings of length 11
+
+    Returns
+    -------
+    numpy.ndarray
+        Floating point values of the fields
+
+    """
+    n = fields.size
+    chars = fields.view(np.uint8).reshape(n, 11)
+
+    # The exponent sign is a sign that directly follows the mantissa
+    is_sign = (chars == ord('+')) | (chars == ord('-'))
+    previous = chars[:, :-1]
+    after_mantissa = (((previous >= ord('0')) & (previous <= ord('9'))) |
+                      (previous == ord('.')))
+    is_exponent = np.zeros_like(is_sign)
+    is_exponent[:, 1:] = is_sign[:, 1:] & after_mantissa
+    position = np.where(is_exponent.any(axis=1), is_exponent.argmax(axis=1),
+                        12)
+
+    # Shift the exponent one character to the right and insert an 'e'
+    column = np.arange(12)
+    source = column - (column > position[:, np.newaxis])
+    converted = np.where(source < 11,
+                         chars[np.arange(n)[:, np.newaxis],
+                               np.minimum(source, 10)],
+                         ord(' ')).astype(np.uint8)
+    converted[column == position[:, np.newaxis]] = ord('e')
+
+    return converted.view('S12').ravel().astype(float)
+
+
 def get_text_record(file_obj):
     """Return data from a TEXT record in an ENDF-6 file.
 
@@ -165,12 +230,7 @@ def get_list_record(file_obj):
     NPL = items[4]
 
     # read items
-    b = []
-    for i in range((NPL - 1)//6 + 1):
-        line = file_obj.readline()
-        n = min(6, NPL - 6*i)
-        for j in range(n):
-            b.append(float_endf(line[11*j:11*(j + 1)]))
+    b = _fields_to_float(_read_fields(file_obj, NPL)).tolist()
 
     return (items, b)
 
@@ -202,30 +262,14 @@ def get_tab1_record(file_obj):
     params = [C1, C2, L1, L2]
 
     # Read the interpolation region data, namely NBT and INT
-    breakpoints = np.zeros(n_regions, dtype=int)
-    interpolation = np.zeros(n_regions, dtype=int)
-    m = 0
-    for i in range((n_regions - 1)//3 + 1):
-        line = file_obj.readline()
-        to_read = min(3, n_regions - m)
-        for j in range(to_read):
-            breakpoints[m] = int(line[0:11])
-            interpolation[m] = int(line[11:22])
-            line = line[22:]
-            m += 1
+    regions = _read_fields(file_obj, 2*n_regions).astype(int)
+    breakpoints = regions[0::2]
+    interpolation = regions[1::2]
 
     # Read tabulated pairs x(n) and y(n)
-    x = np.zeros(n_pairs)
-    y = np.zeros(n_pairs)
-    m = 0
-    for i in range((n_pairs - 1)//3 + 1):
-        line = file_obj.readline()
-        to_read = min(3, n_pairs - m)
-        for j in range(to_read):
-            x[m] = float_endf(line[:11])
-            y[m] = float_endf(line[11:22])
-            line = line[22:]
-            m += 1
+    pairs = _fields_to_float(_read_fields(file_obj, 2*n_pairs))
+    x = pairs[0::2]
+    y = pairs[1::2]
 
     return params, Tabulated1D(x, y, breakpoints, interpolation)
 
@@ -236,20 +280,183 @@ def get_tab2_record(file_obj):
     n_regions = params[4]
 
     # Read the interpolation region data, namely NBT and INT
-    breakpoints = np.zeros(n_regions, dtype=int)
-    interpolation = np.zeros(n_regions, dtype=int)
-    m = 0
-    for i in range((n_regions - 1)//3 + 1):
-        line = file_obj.readline()
-        to_read = min(3, n_regions - m)
-        for j in range(to_read):
-            breakpoints[m] = int(line[0:11])
-            interpolation[m] = int(line[11:22])
-            line = line[22:]
-            m += 1
+    regions = _read_fields(file_obj, 2*n_regions).astype(int)
+    breakpoints = regions[0::2]
+    interpolation = regions[1::2]
 
     return params, Tabulated2D(breakpoints, interpolation)
 
+
+def _index_lines(data):
+    """Determine the position and MAT/MF/MT numbers of each line of ENDF data.
+
+    All lines are indexed at once by gathering the control fields in columns
+    67-75 into an array and decoding them with NumPy.
+
+    Parameters
+    ----------
+    data : bytes
+        Contents of an ENDF-6 file
+
+    Returns
+    -------
+    start, stop : numpy.ndarray
+        Offsets of the beginning and end (including the newline) of each line
+    MAT, MF, MT : numpy.ndarray
+        Material, file, and section numbers of each line. Lines that are too
+        short to hold the control fields are assigned a MAT number of -1.
+
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buf == ord('\n'))
+    start = np.concatenate(([0], newlines + 1))
+    stop = np.concatenate((newlines + 1, [buf.size]))
+    start, stop = start[start < buf.size], stop[start < buf.size]
+
+    # Gather columns 67-75 of each line, using blanks for short lines
+    valid = stop - start - (buf[stop - 1] == ord('\n')) >= 75
+    chars = buf[np.minimum(start[:, np.newaxis] + np.arange(66, 75),
+                           max(buf.size - 1, 0))]
+    chars[~valid] = ord(' ')
+
+    # Decode the right-justified integer fields digit by digit
+    digits = chars - ord('0')
+    digits[digits > 9] = 0
+    negative = chars == ord('-')
+    numbers = []
+    for first, last in ((0, 4), (4, 6), (6, 9)):
+        value = np.zeros(start.size, dtype=int)
+        for column in range(first, last):
+            value *= 10
+            value += digits[:, column]
+        value[negative[:, first:last].any(axis=1)] *= -1
+        numbers.append(value)
+    MAT, MF, MT = numbers
+    MAT[~valid] = -1
+
+    return start, stop, MAT, MF, MT
+
+
+def _material_bounds(MAT, MF):
+    """Determine which lines of ENDF data belong to each material.
+
+    Parameters
+    ----------
+    MAT, MF : numpy.ndarray
+        Material and file numbers of each line
+
+    Returns
+    -------
+    list of tuple
+        Index of the first line of each material and of its MEND record
+
+    """
+    bounds = []
+    first = 0
+    for mend in np.flatnonzero(MAT == 0):
+        # Skip the TPID record and any records preceding the material
+        records = np.flatnonzero((MF[first:mend] != 0) & (MAT[first:mend] > 0))
+        if records.size > 0:
+            bounds.append((first + records[0], mend))
+        first = mend + 1
+    return bounds
+
+
+def _read_material(file_obj):
+    """Read the records of the next material in an ENDF-6 file.
+
+    Parameters
+    ----------
+    file_obj : file-like object
+        ENDF-6 file positioned at the start of a material or the TPID record
+        preceding it
+
+    Returns
+    -------
+    data : bytes
+        Records of the material up to and including the MEND record
+    index : tuple of numpy.ndarray
+        Positions and MAT/MF/MT numbers of the lines in 'data' as returned by
+        :func:`_index_lines`
+
+    """
+    if (isinstance(file_obj, (io.BufferedIOBase, io.RawIOBase)) and
+            file_obj.seekable()):
+        # Binary files are read in blocks of doubling size until the MEND
+        # record is found, so that only about twice the length of the
+        # material is read and indexed, and then positioned after the material
+        position = file_obj.tell()
+        data = b''
+        size = 2**16
+        while True:
+            block = file_obj.read(size)
+            data += block
+            index = _index_lines(data)
+            bounds = _material_bounds(index[2], index[3])
+            if bounds or len(block) < size:
+                break
+            size *= 2
+        if not bounds:
+            return data, index
+        first, mend = bounds[0]
+        offset = index[0][first]
+        file_obj.seek(position + int(index[1][mend]))
+        start, stop, MAT, MF, MT = [x[first:mend + 1] for x in index]
+        return (data[offset:stop[-1]],
+                (start - offset, stop - offset, MAT, MF, MT))
+
+    lines = []
+    MF = 0
+    while True:
+        line = file_obj.readline()
+        if not line:
+            break
+        if not isinstance(line, bytes):
+            line = line.encode('utf-8')
+        if MF == 0:
+            MF = int(line[70:72])
+            if MF == 0:
+                continue
+        lines.append(line)
+        if int(line[66:70]) == 0:
+            break
+    data = b''.join(lines)
+    return data, _index_lines(data)
+
+
+class _Sections(MutableMapping):
+    """Mapping of (MF, MT) to the text of sections in an ENDF evaluation.
+
+    Each section is stored as the slice of bytes holding its records and is
+    only decoded once it is accessed.
+
+    """
+    def __init__(self):
+        self._sections = OrderedDict()
+
+    def __getitem__(self, key):
+        value = self._sections[key]
+        if isinstance(value, bytes):
+            value = value.decode('utf-8', 'replace').replace('\r\n', '\n')
+            self._sections[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._sections[key] = value
+
+    def __delitem__(self, key):
+        del self._sections[key]
+
+    def __iter__(self):
+        return iter(self._sections)
+
+    def __len__(self):
+        return len(self._sections)
+
+    def __contains__(self, key):
+        return key in self._sections
+
+
 def get_evaluations(filename):
     """Return a list of all evaluations within an ENDF file.
 
@@ -264,15 +471,15 @@ def get_evaluations(filename):
         A list of :class:`openmc.data.endf.Evaluation` instances.
 
     """
+    with open(filename, 'rb') as fh:
+        data = fh.read()
+
+    # Find all materials in a single pass before parsing each one
+    start, stop, MAT, MF, MT = _index_lines(data)
     evaluations = []
-    with open(filename, 'r') as fh:
-        while True:
-            pos = fh.tell()
-            line = fh.readline()
-            if line[66:70] == '  -1':
-                break
-            fh.seek(pos)
-            evaluations.append(Evaluation(fh))
+    for first, mend in _material_bounds(MAT, MF):
+        material = data[start[first]:stop[mend]]
+        evaluations.append(Evaluation(io.BytesIO(material)))
     return evaluations
 
 
@@ -298,53 +505,43 @@ class Evaluation(object):
         List of sections in the evaluation. The entries of the tuples are the
         file (MF), section (MT), number of records (NC), and modification
         indicator (MOD).
+    section : collections.MutableMapping
+        Text of each section in the evaluation keyed by (MF, MT). The records
+        of a section are only decoded the first time the section is accessed.
 
     """
     def __init__(self, filename_or_obj):
         if isinstance(filename_or_obj, string_types):
-            fh = open(filename_or_obj, 'r')
+            with open(filename_or_obj, 'rb') as fh:
+                data = fh.read()
+            index = _index_lines(data)
         else:
-            fh = filename_or_obj
-        self.section = {}
+            data, index = _read_material(filename_or_obj)
+        self.section = _Sections()
         self.info = {}
         self.target = {}
         self.projectile = {}
         self.reaction_list = []
 
-        # Determine MAT number for this evaluation
-        MF = 0
-        while MF == 0:
-            position = fh.tell()
-            line = fh.readline()
-            MF = int(line[70:72])
-        self.material = int(line[66:70])
-        fh.seek(position)
-
-        while True:
-            # Find next section
-            while True:
-                position = fh.tell()
-                line = fh.readline()
-                MAT = int(line[66:70])
-                MF = int(line[70:72])
-                MT = int(line[72:75])
-                if MT > 0 or MAT == 0:
-                    fh.seek(position)
-                    break
-
-            # If end of material reached, exit loop
-            if MAT == 0:
-                fh.readline()
-                break
-
-            section_data = ''
-            while True:
-                line = fh.readline()
-                if line[72:75] == '  0':
-                    break
-                else:
-                    section_data += line
-            self.section[MF, MT] = section_data
+        # Find the lines of the first material in the data
+        start, stop, MAT, MF, MT = index
+        bounds = _material_bounds(MAT, MF)
+        if not bounds:
+            raise ValueError('No complete material was found in the ENDF '
+                             'data.')
+        first, mend = bounds[0]
+        self.material = int(MAT[first])
+
+        # Sections are runs of consecutive records with the same MF/MT, MT > 0
+        lines = np.arange(first, mend)
+        in_section = MT[lines] > 0
+        changed = np.ones(lines.size + 1, dtype=bool)
+        changed[1:-1] = ((MF[lines[1:]] != MF[lines[:-1]]) |
+                         (MT[lines[1:]] != MT[lines[:-1]]))
+        begin = lines[changed[:-1] & in_section]
+        end = lines[changed[1:] & in_section]
+        for i, j in zip(begin, end):
+            self.section[int(MF[i]), int(MT[i])] = data[start[i]:stop[j]]
 
         self._read_header()
 
@@ -362,6 +362,52 @@ class Filter(IDManagerMixin):
 
         return np.where(self.bins == filter_bin)[0][0]
 
+    def get_bin_indices(self, filter_bins):
+        """Returns the indices in the Filter for a sequence of bins.
+
+        This is a vectorized equivalent of calling :meth:`Filter.get_bin_index`
+        for each bin which avoids per-bin overhead for filters with many bins.
+
+        Parameters
+        ----------
+        filter_bins : Iterable of Integral or Iterable of tuple
+            The bins to find. Each bin takes the same form as for
+            :meth:`Filter.get_bin_index`.
+
+        Returns
+        -------
+        numpy.ndarray
+             The indices in the Tally data array for the filter bins.
+
+        Raises
+        ------
+        ValueError
+            If any of the bins is not one of the filter's bins
+
+        See also
+        --------
+        Filter.get_bin_index()
+
+        """
+
+        filter_bins = np.ravel(filter_bins)
+        if filter_bins.size == 0:
+            return np.zeros(0, dtype=int)
+
+        # Search a stable sort of the bins so the first matching bin is found
+        order = np.argsort(self.bins, kind='mergesort')
+        sorted_bins = self.bins[order]
+        indices = np.searchsorted(sorted_bins, filter_bins)
+        indices[indices == len(sorted_bins)] = 0
+
+        found = sorted_bins[indices] == filter_bins
+        if not np.all(found):
+            msg = 'Unable to get the bin index for Filter since "{0}" ' \
+                  'is not one of the bins'.format(filter_bins[~found][0])
+            raise ValueError(msg)
+
+        return order[indices]
+
     def get_bin(self, bin_index):
         """Returns the filter bin for some filter bin index.
 
@@ -834,6 +880,18 @@ class MeshFilter(Filter):
 
         return val
 
+    def get_bin_indices(self, filter_bins):
+        filter_bins = np.array(filter_bins, dtype=int, ndmin=2)
+        if filter_bins.size == 0:
+            return np.zeros(0, dtype=int)
+
+        # Convert the (x,y,z) indices of all bins at once using the strides
+        # of each mesh dimension in the flattened filter bins
+        dimension = np.asarray(self.mesh.dimension, dtype=int)
+        ndim = len(dimension)
+        strides = np.append(np.cumprod(dimension[:0:-1])[::-1], 1)
+        return (filter_bins[:, :ndim] - 1).dot(strides)
+
     def get_bin(self, bin_index):
         cv.check_type('bin_index', bin_index, Integral)
         cv.check_greater_than('bin_index', bin_index, 0, equality=True)
@@ -1036,6 +1094,26 @@ class RealFilter(Filter):
         else:
             return i[0] - 1
 
+    def get_bin_indices(self, filter_bins):
+        filter_bins = np.asarray(filter_bins, dtype=float).reshape(-1, 2)
+        if filter_bins.size == 0:
+            return np.zeros(0, dtype=int)
+
+        # Bin edges are monotonically increasing so the first edge matching
+        # each upper bound can be found with a binary search
+        upper = filter_bins[:, 1]
+        i = np.searchsorted(self.bins, upper)
+        i[i == len(self.bins)] = 0
+
+        found = self.bins[i] == upper
+        if not np.all(found):
+            msg = 'Unable to get the bin index for Filter since "{0}" ' \
+                  'is not one of the bins'.format(
+                      tuple(filter_bins[~found][0]))
+            raise ValueError(msg)
+
+        return i - 1
+
     def get_bin(self, bin_index):
         cv.check_type('bin_index', bin_index, Integral)
         cv.check_greater_than('bin_index', bin_index, 0, equality=True)
@@ -1080,6 +1158,34 @@ class EnergyFilter(RealFilter):
                   'is not one of the bins'.format(filter_bin)
             raise ValueError(msg)
 
+    def get_bin_indices(self, filter_bins):
+        filter_bins = np.asarray(filter_bins, dtype=float).reshape(-1, 2)
+        if filter_bins.size == 0:
+            return np.zeros(0, dtype=int)
+
+        # The closest edge to each upper energy bound is one of the two
+        # edges which bracket it in the monotonically increasing grid
+        upper = filter_bins[:, 1]
+        i = np.searchsorted(self.bins, upper)
+        below = np.clip(i - 1, 0, len(self.bins) - 1)
+        above = np.clip(i, 0, len(self.bins) - 1)
+        below_deltas = np.abs(self.bins[below] - upper) / upper
+        above_deltas = np.abs(self.bins[above] - upper) / upper
+        nearest = np.where(above_deltas < below_deltas, above, below)
+
+        # Use the first of any repeated edges, as numpy.argmin would
+        nearest = np.searchsorted(self.bins, self.bins[nearest])
+        deltas = np.abs(self.bins[nearest] - upper) / upper
+
+        found = deltas < 1E-3
+        if not np.all(found):
+            msg = 'Unable to get the bin index for Filter since "{0}" ' \
+                  'is not one of the bins'.format(
+                      tuple(filter_bins[~found][0]))
+            raise ValueError(msg)
+
+        return nearest - 1
+
     def check_bins(self, bins):
         for edge in bins:
             if not isinstance(edge, Real):
@@ -1210,6 +1316,60 @@ def _path_to_levels(path):
     return path_items
 
 
+def _paths_to_columns(paths):
+    """Convert distribcell paths to columns of universe, cell and lattice IDs
+    and lattice indices for each level in the paths.
+
+    All paths are assumed to traverse the same kinds of levels as the first
+    path, which is the case for the instances of a distributed cell. The IDs
+    and indices in all of the paths are then parsed at once.
+
+    Parameters
+    ----------
+    paths : list of str
+        Distribcell paths
+
+    Returns
+    -------
+    collections.OrderedDict
+        Dictionary whose keys are Pandas Multi-index column keys, e.g.
+        ('level 1', 'univ', 'id') or ('level 2', 'lat', 'x'), and whose values
+        are NumPy arrays with one entry per path
+
+    """
+
+    num_paths = len(paths)
+    first = _path_to_levels(paths[0])
+
+    # Parse all of the integers in the paths into one row per path
+    text = ' '.join(paths)
+    for separator in ('->', 'u', 'c', 'l', '(', ')', ','):
+        text = text.replace(separator, ' ')
+    values = np.fromstring(text, dtype=int, sep=' ')
+    num_values = sum(2 if level[0] == 'universe' else 1 + len(level[2])
+                     for level in first)
+    if values.size != num_paths*num_values:
+        raise ValueError('Unable to construct distribcell paths since the '
+                         'paths do not all have the same number of levels')
+    values = np.reshape(values, (num_paths, num_values))
+
+    columns = OrderedDict()
+    j = 0
+    for i_level, level in enumerate(first):
+        level_key = 'level {}'.format(i_level + 1)
+        if level[0] == 'lattice':
+            columns[(level_key, 'lat', 'id')] = values[:, j]
+            for k, dim in enumerate('xyz'[:len(level[2])]):
+                columns[(level_key, 'lat', dim)] = values[:, j + k + 1]
+            j += 1 + len(level[2])
+        else:
+            columns[(level_key, 'univ', 'id')] = values[:, j]
+            columns[(level_key, 'cell', 'id')] = values[:, j + 1]
+            j += 2
+
+    return columns
+
+
 class DistribcellFilter(Filter):
     """Bins tally event locations on instances of repeated cells.
 
@@ -1240,6 +1400,7 @@ class DistribcellFilter(Filter):
 
     def __init__(self, cell, filter_id=None):
         self._paths = None
+        self._path_columns = None
         super(DistribcellFilter, self).__init__(cell, filter_id)
 
     @classmethod
@@ -1284,8 +1445,12 @@ class DistribcellFilter(Filter):
 
     @paths.setter
     def paths(self, paths):
-        cv.check_iterable_type('paths', paths, str)
+        # Paths generated from the instance tree of a geometry are not checked
+        # since that would form every path string
+        if not isinstance(paths, openmc.geometry._InstancePaths):
+            cv.check_iterable_type('paths', paths, str)
         self._paths = paths
+        self._path_columns = None
 
     def can_merge(self, other):
         # Distribcell filters cannot have more than one bin
@@ -1296,6 +1461,9 @@ class DistribcellFilter(Filter):
         # the Cell in the Geometry (consecutive integers starting at 0).
         return filter_bin
 
+    def get_bin_indices(self, filter_bins):
+        return np.ravel(np.asarray(filter_bins, dtype=int))
+
     def get_pandas_dataframe(self, data_size, **kwargs):
         """Builds a Pandas DataFrame for the Filter's bins.
 
@@ -1357,78 +1525,25 @@ class DistribcellFilter(Filter):
                       'the Summary is not linked to the StatePoint'
                 raise ValueError(msg)
 
-            # Make copy of array of distribcell paths to use in
-            # Pandas Multi-index column construction
-            num_offsets = len(self.paths)
-            paths = [_path_to_levels(p) for p in self.paths]
-
-            # Loop over CSG levels in the distribcell paths
-            num_levels = len(paths[0])
-            for i_level in range(num_levels):
-                # Use level key as first index in Pandas Multi-index column
-                level_key = 'level {}'.format(i_level + 1)
-
-                # Create a dictionary for this level for Pandas Multi-index
-                level_dict = OrderedDict()
-
-                # Use the first distribcell path to determine if level
-                # is a universe/cell or lattice level
-                path = paths[0]
-                if path[i_level][0] == 'lattice':
-                    # Initialize prefix Multi-index keys
-                    lat_id_key = (level_key, 'lat', 'id')
-                    lat_x_key = (level_key, 'lat', 'x')
-                    lat_y_key = (level_key, 'lat', 'y')
-                    lat_z_key = (level_key, 'lat', 'z')
-
-                    # Allocate NumPy arrays for each CSG level and
-                    # each Multi-index column in the DataFrame
-                    level_dict[lat_id_key] = np.empty(num_offsets)
-                    level_dict[lat_x_key] = np.empty(num_offsets)
-                    level_dict[lat_y_key] = np.empty(num_offsets)
-                    if len(path[i_level][2]) == 3:
-                        level_dict[lat_z_key] = np.empty(num_offsets)
-
+            # Determine the columns for each CSG level the first time they
+            # are needed. Paths from the instance tree of a geometry are
+            # expanded from its tables, which are shared by all filters of the
+            # geometry, while other paths are parsed.
+            if self._path_columns is None:
+                if isinstance(self.paths, openmc.geometry._InstancePaths):
+                    self._path_columns = self.paths.get_columns()
                 else:
-                    # Initialize prefix Multi-index keys
-                    univ_key = (level_key, 'univ', 'id')
-                    cell_key = (level_key, 'cell', 'id')
-
-                    # Allocate NumPy arrays for each CSG level and
-                    # each Multi-index column in the DataFrame
-                    level_dict[univ_key] = np.empty(num_offsets)
-                    level_dict[cell_key] = np.empty(num_offsets)
-
-                # Populate Multi-index arrays with all distribcell paths
-                for i, path in enumerate(paths):
-
-                    level = path[i_level]
-                    if level[0] == 'lattice':
-                        # Assign entry to Lattice Multi-index column
-                        level_dict[lat_id_key][i] = level[1]
-                        level_dict[lat_x_key][i] = level[2][0]
-                        level_dict[lat_y_key][i] = level[2][1]
-                        if len(level[2]) == 3:
-                            level_dict[lat_z_key][i] = level[2][2]
+                    self._path_columns = _paths_to_columns(self.paths)
 
-                    else:
-                        # Assign entry to Universe, Cell Multi-index columns
-                        level_dict[univ_key][i] = level[1]
-                        level_dict[cell_key][i] = level[2]
-
-                # Tile the Multi-index columns
-                for level_key, level_bins in level_dict.items():
-                    level_bins = np.repeat(level_bins, self.stride)
-                    tile_factor = data_size // len(level_bins)
-                    level_bins = np.tile(level_bins, tile_factor)
-                    level_dict[level_key] = level_bins
-
-                # Initialize a Pandas DataFrame from the level dictionary
-                if level_df is None:
-                    level_df = pd.DataFrame(level_dict)
-                else:
-                    level_df = pd.concat([level_df, pd.DataFrame(level_dict)],
-                                         axis=1)
+            # Tile the Multi-index columns
+            level_dict = OrderedDict()
+            for level_key, level_bins in self._path_columns.items():
+                level_bins = np.repeat(level_bins, self.stride)
+                tile_factor = data_size // len(level_bins)
+                level_dict[level_key] = np.tile(level_bins, tile_factor)
+
+            # Initialize a Pandas DataFrame from the level dictionary
+            level_df = pd.DataFrame(level_dict)
 
         # Create DataFrame column for distribcell instance IDs
         # NOTE: This is performed regardless of whether the user
@@ -1441,8 +1556,6 @@ class DistribcellFilter(Filter):
 
         # Concatenate with DataFrame of distribcell instance IDs
         if level_df is not None:
-            level_df = level_df.dropna(axis=1, how='all')
-            level_df = level_df.astype(np.int)
             df = pd.concat([level_df, df], axis=1)
 
         return df
@@ -2002,6 +2115,9 @@ class EnergyFunctionFilter(Filter):
         # This filter only has one bin.  Always return 0.
         return 0
 
+    def get_bin_indices(self, filter_bins):
+        return np.zeros(len(filter_bins), dtype=int)
+
     def get_bin(self, bin_index):
         """This function is invalid for EnergyFunctionFilters."""
         raise RuntimeError('EnergyFunctionFilters have no get_bin() method')
@@ -1,12 +1,24 @@
-from collections import OrderedDict, Iterable
+from collections import OrderedDict, Iterable, Sequence
 from copy import deepcopy
+from numbers import Integral, Real
+import multiprocessing
 from xml.etree import ElementTree as ET
 
 from six import string_types
+import numpy as np
 
 import openmc
 from openmc.clean_xml import sort_xml_elements, clean_xml_indentation
-from openmc.checkvalue import check_type
+from openmc.checkvalue import check_type, check_length, check_greater_than
+from openmc.region import Region, _RegionVersions
+
+
+# Number of sampled points classified at once by Geometry.check_overlaps
+_CHECK_CHUNK_SIZE = 2**16
+
+# Root universe checked and lattice tables computed by each worker process
+_check_universe = None
+_check_memo = None
 
 
 class Geometry(object):
@@ -27,9 +39,15 @@ class Geometry(object):
 
     """
 
+    # Number of times the cells of any universe or the fill of any cell or
+    # lattice have been changed. While it is unchanged, the versions of the
+    # objects traversed by a geometry need not be compared.
+    _modifications = 0
+
     def __init__(self, root_universe=None):
         self._root_universe = None
         self._offsets = {}
+        self._cache = {}
         if root_universe is not None:
             self.root_universe = root_universe
 
@@ -45,6 +63,40 @@ class Geometry(object):
     def root_universe(self, root_universe):
         check_type('root universe', root_universe, openmc.Universe)
         self._root_universe = root_universe
+        self._cache = {}
+
+    def _cached(self, key, func):
+        """Return a cached traversal of the geometry, computing it if it has
+        not been computed since the geometry was last modified.
+
+        The universes, cells and lattices of the geometry each carry a version
+        which is incremented whenever their cells or fill are changed,
+        including in-place changes to the universes of a lattice or the
+        materials of a cell filled with distributed materials. The versions
+        are only compared when some object has been modified since the cache
+        was last validated.
+
+        Parameters
+        ----------
+        key : str
+            Name of the cached quantity
+        func : callable
+            Function computing the quantity
+
+        """
+        modifications = Geometry._modifications
+        if self._cache.get('modifications') != modifications:
+            versions = self._cache.get('versions')
+            if versions is None or any(obj._version != version
+                                       for obj, version in versions):
+                cells = self.root_universe.get_all_cells()
+                self._cache = {'cells': cells, 'versions': [
+                    (obj, obj._version) for obj in
+                    _traversed_objects(self.root_universe, cells.values())]}
+            self._cache['modifications'] = modifications
+        if key not in self._cache:
+            self._cache[key] = func()
+        return self._cache[key]
 
     def add_volume_information(self, volume_calc):
         """Add volume information from a stochastic volume calculation.
@@ -106,6 +158,156 @@ class Geometry(object):
         """
         return self.root_universe.find(point)
 
+    def find_many(self, points):
+        """Find the cells, materials and cell instances containing many points
+
+        Parameters
+        ----------
+        points : Iterable of 3-tuple of float
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        cell_ids : numpy.ndarray
+            ID of the lowest-level cell containing each point, or -1 if the
+            point is not contained in any cell
+        material_ids : numpy.ndarray
+            ID of the material filling the cell containing each point, or -1
+            if the cell is void or the point is not contained in any cell
+        instances : numpy.ndarray
+            Instance of the cell containing each point, as used by
+            distribcell tally filters and distributed materials, or -1 if the
+            point is not contained in any cell
+
+        See Also
+        --------
+        openmc.Universe.find_many
+
+        """
+        return self.root_universe.find_many(points)
+
+    def check_overlaps(self, samples=100000, lower_left=None,
+                       upper_right=None, processes=1, seed=None):
+        """Check the geometry for overlapping cells and undefined regions
+
+        Points are sampled uniformly within a box and classified all at once
+        at every level of the geometry. A point contained in more than one
+        cell of a universe is reported as an overlap of the first cell
+        containing it with each of the others. A point contained in no cell
+        of a universe filling a cell, or in no element of a lattice without
+        an outer universe, is reported as a void. Points not contained in
+        any cell of the root universe are treated as being outside the
+        geometry and are not reported.
+
+        Since the check is based on sampling, small overlaps and voids may be
+        missed. It is meant to catch geometry errors quickly before running a
+        simulation with geometry debugging turned on.
+
+        Parameters
+        ----------
+        samples : int, optional
+            Number of points to sample. Defaults to 100000.
+        lower_left : Iterable of float, optional
+            Lower-left coordinates of the box in which points are sampled.
+            Defaults to the lower-left corner of the geometry's bounding box.
+        upper_right : Iterable of float, optional
+            Upper-right coordinates of the box in which points are sampled.
+            Defaults to the upper-right corner of the geometry's bounding
+            box.
+        processes : int or None, optional
+            Number of processes used to classify the points. If None, the
+            number of CPUs is used. Defaults to 1.
+        seed : int, optional
+            Seed for the random number generator used to sample the points
+
+        Returns
+        -------
+        overlaps : collections.OrderedDict
+            Dictionary whose keys are 2-tuples of overlapping
+            :class:`openmc.Cell` instances and values are arrays with shape
+            (N, 3) of the sampled points in both cells
+        voids : collections.OrderedDict
+            Dictionary whose keys are the :class:`openmc.Universe` or
+            :class:`openmc.Lattice` instances with undefined regions and
+            values are arrays with shape (N, 3) of the sampled points that
+            are not contained in any of their cells or elements
+
+        """
+        check_type('number of samples', samples, Integral)
+        check_greater_than('number of samples', samples, 0)
+        if processes is not None:
+            check_type('number of processes', processes, Integral)
+            check_greater_than('number of processes', processes, 0)
+
+        if lower_left is None or upper_right is None:
+            box = self.bounding_box
+            if lower_left is None:
+                lower_left = box[0]
+            if upper_right is None:
+                upper_right = box[1]
+        check_type('lower-left coordinates', lower_left, Iterable, Real)
+        check_length('lower-left coordinates', lower_left, 3)
+        check_type('upper-right coordinates', upper_right, Iterable, Real)
+        check_length('upper-right coordinates', upper_right, 3)
+        lower_left = np.asarray(lower_left, dtype=float)
+        upper_right = np.asarray(upper_right, dtype=float)
+        if not (np.all(np.isfinite(lower_left)) and
+                np.all(np.isfinite(upper_right))):
+            raise ValueError('The geometry has an infinite bounding box so '
+                             'the lower-left and upper-right coordinates of '
+                             'the box in which to sample must be given.')
+
+        prn = np.random.RandomState(seed)
+        points = lower_left + (upper_right - lower_left)*prn.random_sample(
+            (samples, 3))
+
+        chunks = [points[i:i + _CHECK_CHUNK_SIZE]
+                  for i in range(0, samples, _CHECK_CHUNK_SIZE)]
+        if processes == 1:
+            memo = {}
+            results = [_check_points(self.root_universe, chunk, memo)
+                       for chunk in chunks]
+        else:
+            pool = multiprocessing.Pool(processes, _init_check_worker,
+                                        (self.root_universe,))
+            try:
+                results = pool.map(_check_chunk, chunks)
+            finally:
+                pool.close()
+                pool.join()
+
+        # Gather the coordinates of the points found in each chunk
+        overlap_points = {}
+        void_points = {}
+        for chunk, (overlaps, voids) in zip(chunks, results):
+            for key, indices in overlaps.items():
+                overlap_points.setdefault(key, []).append(chunk[indices])
+            for key, indices in voids.items():
+                void_points.setdefault(key, []).append(chunk[indices])
+
+        # Points outside every cell of the root universe are outside the
+        # geometry rather than in an undefined region
+        void_points.pop(('universe', self.root_universe.id), None)
+
+        cells = self._get_all_cells()
+        universes = self._get_all_universes()
+        lattices = self._get_all_lattices()
+
+        overlaps = OrderedDict()
+        for key in sorted(overlap_points):
+            cell_pair = (cells[key[0]], cells[key[1]])
+            overlaps[cell_pair] = np.concatenate(overlap_points[key])
+
+        voids = OrderedDict()
+        for kind, fill_id in sorted(void_points):
+            if kind == 'universe':
+                fill = universes[fill_id]
+            else:
+                fill = lattices[fill_id]
+            voids[fill] = np.concatenate(void_points[kind, fill_id])
+
+        return overlaps, voids
+
     def get_instances(self, paths):
         """Return the instance number(s) for a cell/material in a geometry path.
 
@@ -132,24 +334,10 @@ class Geometry(object):
                        not isinstance(paths, string_types))
         path_list = paths if return_list else [paths]
 
-        indices = []
-        for p in path_list:
-            # Extract the cell id from the path
-            last_index = p.rfind('>')
-            last_path = p[last_index+1:]
-            uid = int(last_path[1:])
-
-            # Get corresponding cell/material
-            if last_path[0] == 'c':
-                obj = self.get_all_cells()[uid]
-            elif last_path[0] == 'm':
-                obj = self.get_all_materials()[uid]
-
-            # Determine index in paths array
-            try:
-                indices.append(obj.paths.index(p))
-            except ValueError:
-                indices.append(None)
+        # Resolve each path by following its levels through the instance tree
+        tree = self._cached('instance tree',
+                            lambda: _InstanceTree(self.root_universe))
+        indices = [tree.get_instance(p) for p in path_list]
 
         return indices if return_list else indices[0]
 
@@ -162,7 +350,10 @@ class Geometry(object):
             Dictionary mapping cell IDs to :class:`openmc.Cell` instances
 
         """
-        return self.root_universe.get_all_cells()
+        return OrderedDict(self._get_all_cells())
+
+    def _get_all_cells(self):
+        return self._cached('cells', self.root_universe.get_all_cells)
 
     def get_all_universes(self):
         """Return all universes in the geometry.
@@ -174,10 +365,15 @@ class Geometry(object):
             instances
 
         """
-        universes = OrderedDict()
-        universes[self.root_universe.id] = self.root_universe
-        universes.update(self.root_universe.get_all_universes())
-        return universes
+        return OrderedDict(self._get_all_universes())
+
+    def _get_all_universes(self):
+        def traverse():
+            universes = OrderedDict()
+            universes[self.root_universe.id] = self.root_universe
+            universes.update(self.root_universe.get_all_universes())
+            return universes
+        return self._cached('universes', traverse)
 
     def get_all_materials(self):
         """Return all materials within the geometry.
@@ -189,7 +385,10 @@ class Geometry(object):
             instances
 
         """
-        return self.root_universe.get_all_materials()
+        return OrderedDict(self._get_all_materials())
+
+    def _get_all_materials(self):
+        return self._cached('materials', self.root_universe.get_all_materials)
 
     def get_all_material_cells(self):
         """Return all cells filled by a material
@@ -201,14 +400,15 @@ class Geometry(object):
             are filled with materials or distributed materials.
 
         """
-        material_cells = OrderedDict()
+        def traverse():
+            material_cells = OrderedDict()
+            for cell in self._get_all_cells().values():
+                if cell.fill_type in ('material', 'distribmat'):
+                    if cell not in material_cells:
+                        material_cells[cell.id] = cell
+            return material_cells
 
-        for cell in self.get_all_cells().values():
-            if cell.fill_type in ('material', 'distribmat'):
-                if cell not in material_cells:
-                    material_cells[cell.id] = cell
-
-        return material_cells
+        return OrderedDict(self._cached('material cells', traverse))
 
     def get_all_material_universes(self):
         """Return all universes having at least one material-filled cell.
@@ -223,15 +423,16 @@ class Geometry(object):
             instances with at least one material-filled cell
 
         """
-        material_universes = OrderedDict()
-
-        for universe in self.get_all_universes().values():
-            for cell in universe.cells.values():
-                if cell.fill_type in ('material', 'distribmat', 'void'):
-                    if universe not in material_universes:
-                        material_universes[universe.id] = universe
+        def traverse():
+            material_universes = OrderedDict()
+            for universe in self._get_all_universes().values():
+                for cell in universe.cells.values():
+                    if cell.fill_type in ('material', 'distribmat', 'void'):
+                        if universe not in material_universes:
+                            material_universes[universe.id] = universe
+            return material_universes
 
-        return material_universes
+        return OrderedDict(self._cached('material universes', traverse))
 
     def get_all_lattices(self):
         """Return all lattices defined
@@ -242,14 +443,17 @@ class Geometry(object):
             Dictionary mapping lattice IDs to :class:`openmc.Lattice` instances
 
         """
-        lattices = OrderedDict()
-
-        for cell in self.get_all_cells().values():
-            if cell.fill_type == 'lattice':
-                if cell.fill not in lattices:
-                    lattices[cell.fill.id] = cell.fill
-
-        return lattices
+        return OrderedDict(self._get_all_lattices())
+
+    def _get_all_lattices(self):
+        def traverse():
+            lattices = OrderedDict()
+            for cell in self._get_all_cells().values():
+                if cell.fill_type == 'lattice':
+                    if cell.fill not in lattices:
+                        lattices[cell.fill.id] = cell.fill
+            return lattices
+        return self._cached('lattices', traverse)
 
     def get_all_surfaces(self):
         """
@@ -261,11 +465,25 @@ class Geometry(object):
             Dictionary mapping surface IDs to :class:`openmc.Surface` instances
 
         """
-        surfaces = OrderedDict()
-
-        for cell in self.get_all_cells().values():
-            surfaces = cell.region.get_surfaces(surfaces)
-        return surfaces
+        def traverse():
+            cells = list(self._get_all_cells().values())
+            regions = [cell.region for cell in cells]
+            surfaces = OrderedDict()
+            for region in regions:
+                if region is not None:
+                    surfaces = region.get_surfaces(surfaces)
+            return cells, regions, _RegionVersions(regions), surfaces
+
+        # The surfaces also depend on the regions of the cells, which may have
+        # been replaced or modified in place since they were cached
+        cells, regions, versions, surfaces = self._cached('surfaces', traverse)
+        if (versions.modifications != Region._modifications and
+                not (all(c.region is r for c, r in zip(cells, regions)) and
+                     versions.is_current())):
+            del self._cache['surfaces']
+            surfaces = self._cached('surfaces', traverse)[-1]
+
+        return OrderedDict(surfaces)
 
     def get_materials_by_name(self, name, case_sensitive=False, matching=False):
         """Return a list of materials with matching names.
@@ -290,7 +508,7 @@ class Geometry(object):
         if not case_sensitive:
             name = name.lower()
 
-        all_materials = self.get_all_materials().values()
+        all_materials = self._get_all_materials().values()
         materials = set()
 
         for material in all_materials:
@@ -330,7 +548,7 @@ class Geometry(object):
         if not case_sensitive:
             name = name.lower()
 
-        all_cells = self.get_all_cells().values()
+        all_cells = self._get_all_cells().values()
         cells = set()
 
         for cell in all_cells:
@@ -372,7 +590,7 @@ class Geometry(object):
 
         cells = set()
 
-        for cell in self.get_all_cells().values():
+        for cell in self._get_all_cells().values():
             names = []
             if cell.fill_type in ('material', 'universe', 'lattice'):
                 names.append(cell.fill.name)
@@ -417,7 +635,7 @@ class Geometry(object):
         if not case_sensitive:
             name = name.lower()
 
-        all_universes = self.get_all_universes().values()
+        all_universes = self._get_all_universes().values()
         universes = set()
 
         for universe in all_universes:
@@ -457,7 +675,7 @@ class Geometry(object):
         if not case_sensitive:
             name = name.lower()
 
-        all_lattices = self.get_all_lattices().values()
+        all_lattices = self._get_all_lattices().values()
         lattices = set()
 
         for lattice in all_lattices:
@@ -481,6 +699,12 @@ class Geometry(object):
         path that reaches every cell and material. The paths are stored in the
         :attr:`Cell.paths` and :attr:`Material.paths` attributes.
 
+        Rather than forming a string for every instance, the number of
+        instances of each cell within every universe and lattice element is
+        tabulated. The path strings are then generated on demand from these
+        tables, and the instance corresponding to a path is found by
+        following the levels of the path.
+
         Parameters
         ----------
         instances_only : bool, optional
@@ -488,16 +712,19 @@ class Geometry(object):
             each cell and material.
 
         """
-        # (Re-)initialize all cell instances to 0
-        for cell in self.get_all_cells().values():
-            cell._paths = []
-            cell._num_instances = 0
-        for material in self.get_all_materials().values():
-            material._paths = []
-            material._num_instances = 0
-
-        # Recursively traverse the CSG tree to count all cell instances
-        self.root_universe._determine_paths(instances_only=instances_only)
+        # Always traverse the geometry again so that paths can be refreshed
+        # explicitly after any kind of modification
+        self._cache = {}
+        tree = self._cached('instance tree',
+                            lambda: _InstanceTree(self.root_universe))
+
+        for cell in self._get_all_cells().values():
+            cell._num_instances = tree.num_instances(cell)
+            cell._paths = [] if instances_only else _InstancePaths(tree, cell)
+        for material in self._get_all_materials().values():
+            material._num_instances = tree.num_instances(material)
+            material._paths = ([] if instances_only else
+                               _InstancePaths(tree, material))
 
     def clone(self):
         """Create a copy of this geometry with new unique IDs for all of its
@@ -506,3 +733,642 @@ class Geometry(object):
         clone = deepcopy(self)
         clone.root_universe = self.root_universe.clone()
         return clone
+
+
+def _traversed_objects(root_universe, cells):
+    """Return the universes, cells and lattices whose versions determine
+    whether a traversal of the geometry is out of date"""
+    objects = [root_universe]
+    for cell in cells:
+        objects.append(cell)
+        if cell.fill_type == 'universe':
+            objects.append(cell.fill)
+        elif cell.fill_type == 'lattice':
+            lattice = cell.fill
+            objects.append(lattice)
+            objects.extend(lattice.get_unique_universes().values())
+            if lattice.outer is not None:
+                objects.append(lattice.outer)
+    return objects
+
+
+def _modified(obj):
+    """Record that the cells of a universe or the fill of a cell or lattice
+    have been changed"""
+    obj._version += 1
+    Geometry._modifications += 1
+
+
+def _track(container, owner):
+    """Return a copy of a list, possibly nested, or a view of an array which
+    records in-place changes as modifications of its owner"""
+    if isinstance(container, np.ndarray):
+        container = container.view(_TrackedArray)
+        container._owner = owner
+    elif isinstance(container, list):
+        container = _TrackedList([_track(item, owner) for item in container],
+                                 owner)
+    return container
+
+
+class _TrackedList(list):
+    """List which records in-place changes as modifications of its owner
+
+    Parameters
+    ----------
+    items : Iterable
+        Initial items of the list
+    owner : openmc.Cell or openmc.Lattice
+        Cell or lattice whose fill the list is part of
+
+    """
+
+    _owner = None
+
+    def __init__(self, items=(), owner=None):
+        super(_TrackedList, self).__init__(items)
+        self._owner = owner
+
+    def _modified(self):
+        if self._owner is not None:
+            _modified(self._owner)
+
+    def __setitem__(self, key, value):
+        super(_TrackedList, self).__setitem__(key, value)
+        self._modified()
+
+    def __delitem__(self, key):
+        super(_TrackedList, self).__delitem__(key)
+        self._modified()
+
+    def __setslice__(self, i, j, sequence):
+        super(_TrackedList, self).__setslice__(i, j, sequence)
+        self._modified()
+
+    def __delslice__(self, i, j):
+        super(_TrackedList, self).__delslice__(i, j)
+        self._modified()
+
+    def __iadd__(self, other):
+        result = super(_TrackedList, self).__iadd__(other)
+        self._modified()
+        return result
+
+    def __imul__(self, n):
+        result = super(_TrackedList, self).__imul__(n)
+        self._modified()
+        return result
+
+    def append(self, item):
+        super(_TrackedList, self).append(item)
+        self._modified()
+
+    def extend(self, items):
+        super(_TrackedList, self).extend(items)
+        self._modified()
+
+    def insert(self, index, item):
+        super(_TrackedList, self).insert(index, item)
+        self._modified()
+
+    def pop(self, index=-1):
+        item = super(_TrackedList, self).pop(index)
+        self._modified()
+        return item
+
+    def remove(self, item):
+        super(_TrackedList, self).remove(item)
+        self._modified()
+
+    def clear(self):
+        del self[:]
+
+    def reverse(self):
+        super(_TrackedList, self).reverse()
+        self._modified()
+
+    def sort(self, *args, **kwargs):
+        super(_TrackedList, self).sort(*args, **kwargs)
+        self._modified()
+
+
+class _TrackedArray(np.ndarray):
+    """Array which records in-place changes, including those made through
+    views of it, as modifications of its owner"""
+
+    _owner = None
+
+    def __array_finalize__(self, obj):
+        # Only views share the owner of the array they were created from
+        if self.base is not None:
+            self._owner = getattr(obj, '_owner', None)
+
+    def __deepcopy__(self, memo):
+        # A copy belongs to the copy of the owner, if it is being copied too
+        clone = super(_TrackedArray, self).__deepcopy__(memo)
+        clone._owner = memo.get(id(self._owner))
+        return clone
+
+    def __setitem__(self, key, value):
+        super(_TrackedArray, self).__setitem__(key, value)
+        if self._owner is not None:
+            _modified(self._owner)
+
+
+def _check_points(universe, points, memo):
+    """Find the sampled points in overlapping cells and undefined regions
+
+    Parameters
+    ----------
+    universe : openmc.Universe
+        Root universe of the geometry
+    points : numpy.ndarray
+        Cartesian coordinates of the sampled points with shape (N, 3)
+    memo : dict
+        Lattice element tables computed so far
+
+    Returns
+    -------
+    overlaps : dict
+        Indices of the points in each pair of overlapping cells, keyed by the
+        pair of cell IDs
+    voids : dict
+        Indices of the points not contained in any cell of a universe or
+        element of a lattice, keyed by the kind and ID of the universe or
+        lattice
+
+    """
+    overlaps, voids = {}, {}
+    universe._check_overlaps(points, np.arange(len(points)),
+                             (overlaps, voids), memo)
+    for results in (overlaps, voids):
+        for key, indices in results.items():
+            results[key] = np.concatenate(indices)
+    return overlaps, voids
+
+
+def _init_check_worker(universe):
+    global _check_universe, _check_memo
+    _check_universe = universe
+    _check_memo = {}
+
+
+def _check_chunk(points):
+    return _check_points(_check_universe, points, _check_memo)
+
+
+class _InstanceTree(object):
+    """Compact representation of all cell and material instances
+
+    The instances of a cell are numbered in the order in which the CSG tree
+    is traversed depth-first, visiting the cells of a universe in order and
+    the elements of a lattice in their natural order, with each cell counted
+    after the contents of its fill. For every universe and lattice, the
+    number of instances of each cell within each of its cells or elements is
+    tabulated along with the cumulative numbers of instances preceding each
+    cell or element. An instance is then identified by the position taken at
+    each level of its path, and its number is the sum of the cumulative
+    counts at those positions.
+
+    Parameters
+    ----------
+    root_universe : openmc.Universe
+        Root universe of the geometry
+
+    """
+
+    def __init__(self, root_universe):
+        self.root_universe = root_universe
+        self._memo = {}
+        self._cells = root_universe.get_all_cells()
+        self._materials = root_universe.get_all_materials()
+
+        # Cells filled with each material
+        self._material_cells = {}
+        for cell in self._cells.values():
+            if cell.fill_type == 'material':
+                fills = [cell.fill]
+            elif cell.fill_type == 'distribmat':
+                fills = cell.fill
+            else:
+                continue
+            for mat in fills:
+                if mat is not None:
+                    cells = self._material_cells.setdefault(mat.id, [])
+                    if cell not in cells:
+                        cells.append(cell)
+
+    def _counts(self, fill):
+        """Number of instances of each cell within each position"""
+        return fill._instance_counts(self._memo)
+
+    def _offsets(self, fill, cell_id):
+        """Cumulative number of instances of a cell, or of all cells if the
+        cell ID is None, preceding each position"""
+        key = ('offsets', id(fill), cell_id)
+        if key not in self._memo:
+            if cell_id is None:
+                counts = [sum(c.values()) for c in self._counts(fill)]
+            else:
+                counts = [c.get(cell_id, 0) for c in self._counts(fill)]
+            self._memo[key] = np.cumsum([0] + counts)
+        return self._memo[key]
+
+    def _positions(self, fill):
+        """Positions of the cells or lattice elements keyed by cell ID or
+        lattice element index, and the cells or universes at each position"""
+        key = ('positions', id(fill))
+        if key not in self._memo:
+            if isinstance(fill, openmc.Universe):
+                members = list(fill.cells.values())
+                keys = [cell.id for cell in members]
+            else:
+                keys = [tuple(int(i) for i in index)
+                        for index in fill._natural_indices]
+                members = [fill.get_universe(index) for index in keys]
+            self._memo[key] = ({k: i for i, k in enumerate(keys)}, keys,
+                               members)
+        return self._memo[key]
+
+    def _distribmat_offsets(self, cell, mat):
+        """Cumulative number of instances of a cell filled with a material"""
+        key = ('distribmat', id(cell), mat.id)
+        if key not in self._memo:
+            n = self.num_instances(cell)
+            filled = [cell.fill[i] is mat for i in range(n)]
+            self._memo[key] = np.cumsum([0] + filled)
+        return self._memo[key]
+
+    def num_instances(self, obj):
+        """Return the number of instances of a cell or material
+
+        Parameters
+        ----------
+        obj : openmc.Cell or openmc.Material
+            Cell or material
+
+        Returns
+        -------
+        int
+            Number of instances
+
+        """
+        if isinstance(obj, openmc.Cell):
+            return int(self._offsets(self.root_universe, obj.id)[-1])
+        else:
+            return self._material_instance(obj, None)
+
+    def _material_instance(self, mat, levels):
+        """Number of instances of a material preceding the position given by
+        a list of levels, or all instances if levels is None"""
+        n = 0
+        for cell in self._material_cells.get(mat.id, []):
+            if levels is None:
+                preceding = self.num_instances(cell)
+            else:
+                preceding = sum(int(self._offsets(fill, cell.id)[k])
+                                for fill, k in levels)
+            if cell.fill_type == 'distribmat':
+                n += int(self._distribmat_offsets(cell, mat)[preceding])
+            else:
+                n += preceding
+        return n
+
+    def _parse(self, path):
+        """Determine the position at each level of a path
+
+        Parameters
+        ----------
+        path : str
+            Path through the CSG tree to a cell or material instance
+
+        Returns
+        -------
+        levels : list of tuple
+            Universe or lattice and position taken at each level
+        obj : openmc.Cell or openmc.Material
+            Cell or material at the end of the path
+
+        """
+        tokens = path.split('->')
+        fill = None
+        levels = []
+        cell = None
+        if tokens[-1][0] != 'c' and tokens[-1][0] != 'm':
+            raise ValueError(path)
+        for i, token in enumerate(tokens):
+            kind = token[0]
+            if kind == 'u':
+                universe_id = int(token[1:])
+                if fill is None and i == 0:
+                    if universe_id != self.root_universe.id:
+                        raise ValueError(path)
+                    fill = self.root_universe
+                elif not (isinstance(fill, openmc.Universe) and
+                          fill.id == universe_id):
+                    raise ValueError(path)
+            elif kind == 'c':
+                index, keys, members = self._positions(fill)
+                k = index[int(token[1:])]
+                levels.append((fill, k))
+                cell = members[k]
+                fill = cell.fill if cell.fill_type in (
+                    'universe', 'lattice') else None
+            elif kind == 'l':
+                lattice_id, index = token[1:-1].split('(')
+                if not (isinstance(fill, openmc.Lattice) and
+                        fill.id == int(lattice_id)):
+                    raise ValueError(path)
+                index = tuple(int(x) for x in index.split(','))
+                positions, keys, members = self._positions(fill)
+                k = positions[index]
+                levels.append((fill, k))
+                fill = members[k]
+            elif kind == 'm' and i == len(tokens) - 1:
+                mat = self._materials[int(token[1:])]
+                if cell.fill_type == 'material':
+                    if cell.fill is not mat:
+                        raise ValueError(path)
+                elif cell.fill_type == 'distribmat':
+                    instance = sum(int(self._offsets(f, cell.id)[k])
+                                   for f, k in levels)
+                    if cell.fill[instance] is not mat:
+                        raise ValueError(path)
+                else:
+                    raise ValueError(path)
+                return levels, mat
+            else:
+                raise ValueError(path)
+
+        return levels, cell
+
+    def get_instance(self, path):
+        """Return the instance number for a path, or None if the path does not
+        exist in the geometry.
+
+        Parameters
+        ----------
+        path : str
+            Path through the CSG tree to a cell or material instance
+
+        Returns
+        -------
+        int or None
+            Instance of the cell or material
+
+        """
+        try:
+            levels, obj = self._parse(path)
+        except (ValueError, KeyError, IndexError, AttributeError, TypeError):
+            return None
+        if isinstance(obj, openmc.Cell):
+            return sum(int(self._offsets(fill, obj.id)[k])
+                       for fill, k in levels)
+        else:
+            return self._material_instance(obj, levels)
+
+    def _descend(self, cell, instance):
+        """Determine the position at each level of a cell instance and the
+        position of the instance in the traversal of all cells"""
+        levels = []
+        order = 0
+        fill = self.root_universe
+        while True:
+            offsets = self._offsets(fill, cell.id)
+            k = int(np.searchsorted(offsets, instance, side='right')) - 1
+            instance -= offsets[k]
+            order += int(self._offsets(fill, None)[k])
+            levels.append((fill, k))
+
+            positions, keys, members = self._positions(fill)
+            if isinstance(fill, openmc.Universe):
+                if members[k] is cell:
+                    return levels, order
+                fill = members[k].fill
+            else:
+                fill = members[k]
+
+    def _format(self, levels):
+        """Form the path string for a list of levels"""
+        path = 'u{}'.format(self.root_universe.id)
+        for i, (fill, k) in enumerate(levels):
+            positions, keys, members = self._positions(fill)
+            if isinstance(fill, openmc.Universe):
+                path += '->c{}'.format(keys[k])
+                if (isinstance(members[k].fill, openmc.Universe) and
+                        i < len(levels) - 1):
+                    path += '->u{}'.format(members[k].fill.id)
+            else:
+                path += '->l{}({})->u{}'.format(
+                    fill.id, ','.join(str(x) for x in keys[k]), members[k].id)
+        return path
+
+    def get_path(self, cell, instance):
+        """Return the path to an instance of a cell
+
+        Parameters
+        ----------
+        cell : openmc.Cell
+            Cell
+        instance : int
+            Instance of the cell
+
+        Returns
+        -------
+        str
+            Path through the CSG tree to the cell instance
+
+        """
+        levels, order = self._descend(cell, instance)
+        return self._format(levels)
+
+    def get_columns(self, cell):
+        """Return the IDs and lattice indices at each level of the paths to all
+        instances of a cell
+
+        The columns are built level by level from the instance counts of each
+        universe and lattice, without forming any path strings, and are
+        cached for the geometry.
+
+        Parameters
+        ----------
+        cell : openmc.Cell
+            Cell
+
+        Returns
+        -------
+        collections.OrderedDict
+            Dictionary whose keys are Pandas Multi-index column keys, e.g.
+            ('level 1', 'univ', 'id') or ('level 2', 'lat', 'x'), and whose
+            values are NumPy arrays with one entry per instance
+
+        Raises
+        ------
+        ValueError
+            If the paths to the instances do not all traverse the same kinds
+            of levels
+
+        """
+        key = ('columns', cell.id)
+        if key not in self._memo:
+            columns = OrderedDict()
+            levels = self._level_columns(self.root_universe, cell.id, {})
+            for i, level in enumerate(levels):
+                for name, values in level.items():
+                    columns[('level {}'.format(i + 1),) + name] = values
+            self._memo[key] = columns
+        return self._memo[key]
+
+    def _level_columns(self, fill, cell_id, memo):
+        """Columns for each level below a universe or lattice for all instances
+        of a cell within it"""
+        if id(fill) in memo:
+            return memo[id(fill)]
+
+        counts = np.diff(self._offsets(fill, cell_id))
+        positions, keys, members = self._positions(fill)
+        k = np.flatnonzero(counts)
+        n = counts[k]
+        total = int(n.sum())
+
+        # Columns for the level of this universe or lattice
+        level = OrderedDict()
+        if isinstance(fill, openmc.Universe):
+            level[('univ', 'id')] = np.full(total, fill.id, dtype=int)
+            level[('cell', 'id')] = np.repeat(np.array(keys, dtype=int)[k], n)
+        else:
+            level[('lat', 'id')] = np.full(total, fill.id, dtype=int)
+            indices = np.array(keys, dtype=int).reshape(len(keys), -1)[k]
+            for j, dim in enumerate('xyz'[:indices.shape[1]]):
+                level[('lat', dim)] = np.repeat(indices[:, j], n)
+
+        # Universes or lattices below each position, of which many positions
+        # typically share the same few
+        distinct = OrderedDict()
+        group = []
+        for i in k:
+            member = members[i]
+            if isinstance(fill, openmc.Universe):
+                below = None if member.id == cell_id else member.fill
+            else:
+                below = member
+            group.append(distinct.setdefault(id(below), (len(distinct),
+                                                         below))[0])
+
+        sublevels = []
+        for index, below in distinct.values():
+            sublevels.append([] if below is None else
+                             self._level_columns(below, cell_id, memo))
+        structure = set(tuple(tuple(level_below) for level_below in sub)
+                        for sub in sublevels)
+        if len(structure) > 1:
+            raise ValueError('Unable to construct distribcell paths since the '
+                             'paths do not all have the same number of '
+                             'levels')
+
+        # Gather the rows of the levels below for each position
+        levels = [level]
+        if sublevels and sublevels[0]:
+            sizes = [len(next(iter(sub[0].values()))) for sub in sublevels]
+            base = np.cumsum([0] + sizes)[:-1]
+            group = np.array(group, dtype=int)
+            rows = (np.repeat(base[group] - (np.cumsum(n) - n), n) +
+                    np.arange(total))
+            for i in range(len(sublevels[0])):
+                sublevel = OrderedDict()
+                for name in sublevels[0][i]:
+                    values = np.concatenate([sub[i][name]
+                                             for sub in sublevels])
+                    sublevel[name] = values[rows]
+                levels.append(sublevel)
+
+        memo[id(fill)] = levels
+        return levels
+
+    def get_material_paths(self, mat):
+        """Return the paths to all instances of a material
+
+        Parameters
+        ----------
+        mat : openmc.Material
+            Material
+
+        Returns
+        -------
+        list of str
+            Paths through the CSG tree to the material instances
+
+        """
+        instances = []
+        for cell in self._material_cells.get(mat.id, []):
+            for i in range(self.num_instances(cell)):
+                if cell.fill_type == 'distribmat' and cell.fill[i] is not mat:
+                    continue
+                levels, order = self._descend(cell, i)
+                instances.append((order, levels))
+        instances.sort(key=lambda x: x[0])
+        return ['{}->m{}'.format(self._format(levels), mat.id)
+                for order, levels in instances]
+
+
+class _InstancePaths(Sequence):
+    """Sequence of paths to the instances of a cell or material which are
+    generated on demand from an instance tree
+
+    Parameters
+    ----------
+    tree : _InstanceTree
+        Instance tree of the geometry
+    obj : openmc.Cell or openmc.Material
+        Cell or material
+
+    """
+
+    def __init__(self, tree, obj):
+        self._tree = tree
+        self._obj = obj
+        self._length = tree.num_instances(obj)
+        self._material_paths = None
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError('path index out of range')
+        if isinstance(self._obj, openmc.Cell):
+            return self._tree.get_path(self._obj, key)
+        else:
+            if self._material_paths is None:
+                self._material_paths = self._tree.get_material_paths(
+                    self._obj)
+            return self._material_paths[key]
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or len(self) != len(other):
+            return False
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def get_columns(self):
+        """Return the IDs and lattice indices at each level of the paths to all
+        instances of a cell as computed by :meth:`_InstanceTree.get_columns`
+        """
+        return self._tree.get_columns(self._obj)
+
+    def index(self, path):
+        instance = self._tree.get_instance(path)
+        ending = 'c{}'.format(self._obj.id) if isinstance(
+            self._obj, openmc.Cell) else 'm{}'.format(self._obj.id)
+        if instance is None or path.rsplit('->', 1)[-1] != ending:
+            raise ValueError('{} is not a path of this instance'.format(path))
+        return instance
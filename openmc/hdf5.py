@@ -0,0 +1,40 @@
+import h5py
+import numpy as np
+
+
+def read_datasets(group, names=None):
+    """Read every dataset in an HDF5 group in a single pass over its members.
+
+    The low-level HDF5 interface is used so that no high-level h5py object
+    has to be created for each dataset, which dominates the time needed to
+    read the many small groups describing a large geometry.
+
+    Parameters
+    ----------
+    group : h5py.Group or h5py.h5g.GroupID
+        Group in HDF5 file
+    names : Iterable of str, optional
+        Names of the datasets to read. If not given, all datasets in the group
+        are read.
+
+    Returns
+    -------
+    dict
+        Dictionary mapping dataset names to their values
+
+    """
+    data = {}
+    group_id = group.id if isinstance(group, h5py.Group) else group
+    if names is not None:
+        names = set(names)
+    for i in range(group_id.get_num_objs()):
+        if group_id.get_objtype_by_idx(i) != h5py.h5g.DATASET:
+            continue
+        name = group_id.get_objname_by_idx(i)
+        if names is not None and name.decode() not in names:
+            continue
+        dataset_id = h5py.h5d.open(group_id, name)
+        value = np.empty(dataset_id.shape, dtype=dataset_id.dtype)
+        dataset_id.read(h5py.h5s.ALL, h5py.h5s.ALL, value)
+        data[name.decode()] = value[()]
+    return data
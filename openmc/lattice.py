@@ -12,9 +12,16 @@ import numpy as np
 
 import openmc.checkvalue as cv
 import openmc
+from openmc.hdf5 import read_datasets
 from openmc.mixin import IDManagerMixin
 
 
+def _is_array(values):
+    """Return whether coordinates or indices are given for many points or
+    lattice elements as a two-dimensional array."""
+    return isinstance(values, np.ndarray) and values.ndim == 2
+
+
 @add_metaclass(ABCMeta)
 class Lattice(IDManagerMixin):
     """A repeating structure wherein each element is a universe.
@@ -46,6 +53,9 @@ class Lattice(IDManagerMixin):
     next_id = 1
     used_ids = openmc.Universe.used_ids
 
+    # Number of times the universes of the lattice have been changed
+    _version = 0
+
     def __init__(self, lattice_id=None, name=''):
         # Initialize Lattice class attributes
         self.id = lattice_id
@@ -101,6 +111,7 @@ class Lattice(IDManagerMixin):
     def outer(self, outer):
         cv.check_type('outer universe', outer, openmc.Universe)
         self._outer = outer
+        openmc.geometry._modified(self)
 
     @staticmethod
     def from_hdf5(group, universes):
@@ -121,15 +132,39 @@ class Lattice(IDManagerMixin):
 
         """
         lattice_id = int(group.name.split('/')[-1].lstrip('lattice '))
-        name = group['name'].value.decode() if 'name' in group else ''
-        lattice_type = group['type'].value.decode()
+        return Lattice._from_datasets(lattice_id, read_datasets(group),
+                                      universes)
+
+    @staticmethod
+    def _from_datasets(lattice_id, data, universes):
+        """Create lattice from the datasets of its HDF5 group
+
+        Parameters
+        ----------
+        lattice_id : int
+            Unique identifier for the lattice
+        data : dict
+            Dictionary mapping dataset names to their values as returned by
+            :func:`openmc.hdf5.read_datasets`
+        universes : dict
+            Dictionary mapping universe IDs to instances of
+            :class:`openmc.Universe`.
+
+        Returns
+        -------
+        openmc.Lattice
+            Instance of lattice subclass
+
+        """
+        name = data['name'].decode() if 'name' in data else ''
+        lattice_type = data['type'].decode()
 
         if lattice_type == 'rectangular':
-            dimension = group['dimension'][...]
-            lower_left = group['lower_left'][...]
-            pitch = group['pitch'][...]
-            outer = group['outer'].value
-            universe_ids = group['universes'][...]
+            dimension = data['dimension']
+            lower_left = data['lower_left']
+            pitch = data['pitch']
+            outer = data['outer']
+            universe_ids = data['universes']
 
             # Create the Lattice
             lattice = openmc.RectLattice(lattice_id, name)
@@ -157,13 +192,13 @@ class Lattice(IDManagerMixin):
             lattice.universes = uarray
 
         elif lattice_type == 'hexagonal':
-            n_rings = group['n_rings'].value
-            n_axial = group['n_axial'].value
-            center = group['center'][...]
-            pitch = group['pitch'][...]
-            outer = group['outer'].value
+            n_rings = data['n_rings']
+            n_axial = data['n_axial']
+            center = data['center']
+            pitch = data['pitch']
+            outer = data['outer']
 
-            universe_ids = group['universes'][...]
+            universe_ids = data['universes']
 
             # Create the Lattice
             lattice = openmc.HexLattice(lattice_id, name)
@@ -406,6 +441,179 @@ class Lattice(IDManagerMixin):
                 return []
         return [(self, idx)] + u.find(p)
 
+    def _find_many(self, points, indices, results, memo):
+        """Find the cells containing points in local coordinates
+
+        This is a helper method for :meth:`Universe.find_many` which is called
+        recursively for the universes and lattices filling cells.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points in the lattice's coordinate
+            system with shape (N, 3)
+        indices : numpy.ndarray
+            Indices of the points in the results arrays
+        results : 2-tuple of numpy.ndarray
+            Arrays of the cell IDs and instances of all points, which are
+            updated in place
+        memo : dict
+            Cells found and instance counts computed so far
+
+        """
+        idx, local = self.find_element(points)
+        universes, codes, positions, offset = self._element_table(memo)
+
+        # Determine the position of each element in the traversal order
+        idx = idx[:, :self.ndim] - offset
+        valid = np.all((idx >= 0) & (idx < positions.shape), axis=1)
+        pos = np.full(len(points), -1, dtype=int)
+        code = np.full(len(points), -1, dtype=int)
+        pos[valid] = positions[tuple(idx[valid].T)]
+        code[valid] = codes[tuple(idx[valid].T)]
+        code[pos == -1] = -1
+
+        for c in np.unique(code):
+            found = (code == c)
+            if c == -1:
+                if self.outer is not None:
+                    self.outer._find_many(local[found], indices[found],
+                                          results, memo)
+                continue
+
+            universes[c]._find_many(local[found], indices[found], results,
+                                    memo)
+            openmc.universe._add_instance_offsets(
+                self, pos[found], indices[found], results, memo)
+
+    def _check_overlaps(self, points, indices, results, memo):
+        """Find points contained in more than one cell or in no cell
+
+        This is a helper method for :meth:`Geometry.check_overlaps` which is
+        called recursively for the universes and lattices filling cells.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points in the lattice's coordinate
+            system with shape (N, 3)
+        indices : numpy.ndarray
+            Indices of the sampled points
+        results : 2-tuple of dict
+            Indices of the points found in each pair of overlapping cells and
+            of the points not contained in any cell, which are updated in
+            place
+        memo : dict
+            Lattice element tables computed so far
+
+        """
+        idx, local = self.find_element(points)
+        universes, codes, positions, offset = self._element_table(memo)
+
+        # Determine the universe filling the element containing each point
+        idx = idx[:, :self.ndim] - offset
+        valid = np.all((idx >= 0) & (idx < positions.shape), axis=1)
+        pos = np.full(len(points), -1, dtype=int)
+        code = np.full(len(points), -1, dtype=int)
+        pos[valid] = positions[tuple(idx[valid].T)]
+        code[valid] = codes[tuple(idx[valid].T)]
+        code[pos == -1] = -1
+
+        for c in np.unique(code):
+            found = (code == c)
+            if c == -1:
+                if self.outer is not None:
+                    self.outer._check_overlaps(local[found], indices[found],
+                                               results, memo)
+                else:
+                    voids = results[1]
+                    voids.setdefault(('lattice', self.id), []).append(
+                        indices[found])
+                continue
+
+            universes[c]._check_overlaps(local[found], indices[found],
+                                         results, memo)
+
+    def _element_table(self, memo):
+        """Tabulate the universes and traversal order of the lattice elements
+
+        Parameters
+        ----------
+        memo : dict
+            Tables computed so far
+
+        Returns
+        -------
+        universes : list of openmc.Universe
+            Unique universes filling the lattice
+        codes : numpy.ndarray
+            Index in the list of universes for each element
+        positions : numpy.ndarray
+            Position of each element in the traversal order, or -1 for
+            invalid elements
+        offset : numpy.ndarray
+            Lattice element index corresponding to the first entry of the
+            tables
+
+        """
+        key = ('table', id(self))
+        if key not in memo:
+            natural = np.array([tuple(i) for i in self._natural_indices],
+                               dtype=int)
+            offset = natural.min(axis=0)
+            shape = tuple(natural.max(axis=0) - offset + 1)
+
+            universes = []
+            codes = np.full(shape, -1, dtype=int)
+            positions = np.full(shape, -1, dtype=int)
+            for i, index in enumerate(natural):
+                univ = self.get_universe(tuple(index))
+                for c, u in enumerate(universes):
+                    if u is univ:
+                        break
+                else:
+                    c = len(universes)
+                    universes.append(univ)
+                codes[tuple(index - offset)] = c
+                positions[tuple(index - offset)] = i
+
+            memo[key] = (universes, codes, positions, offset)
+        return memo[key]
+
+    def _instance_counts(self, memo):
+        """Count the instances of each cell within the lattice
+
+        Parameters
+        ----------
+        memo : dict
+            Instance counts computed so far
+
+        Returns
+        -------
+        list of dict
+            Number of instances of each cell, keyed by cell ID, within each
+            lattice element in the traversal order
+
+        """
+        key = ('counts', id(self))
+        if key not in memo:
+            universes, codes, positions, offset = self._element_table(memo)
+
+            # Sum the counts over the cells in each unique universe once
+            totals = []
+            for univ in universes:
+                univ_counts = {}
+                for cell_counts in univ._instance_counts(memo):
+                    for cell_id, n in cell_counts.items():
+                        univ_counts[cell_id] = univ_counts.get(cell_id, 0) + n
+                totals.append(univ_counts)
+
+            order = np.argsort(positions, axis=None)
+            flat_codes = codes.ravel()[order]
+            valid = positions.ravel()[order] >= 0
+            memo[key] = [totals[c] for c in flat_codes[valid]]
+        return memo[key]
+
     def clone(self, memo=None):
         """Create a copy of this lattice with a new unique ID, and clones
         all universes within this lattice.
@@ -621,25 +829,36 @@ class RectLattice(Lattice):
     def universes(self, universes):
         cv.check_iterable_type('lattice universes', universes, openmc.Universe,
                                min_depth=2, max_depth=3)
-        self._universes = np.asarray(universes)
+        self._universes = openmc.geometry._track(np.asarray(universes), self)
+        openmc.geometry._modified(self)
 
     def find_element(self, point):
         """Determine index of lattice element and local coordinates for a point
 
         Parameters
         ----------
-        point : Iterable of float
-            Cartesian coordinates of point
+        point : Iterable of float or numpy.ndarray
+            Cartesian coordinates of point. The elements containing many
+            points can be determined at once by passing an array with shape
+            (N, 3).
 
         Returns
         -------
-        2- or 3-tuple of int
-            A tuple of the corresponding (x,y,z) lattice element indices
-        3-tuple of float
+        2- or 3-tuple of int or numpy.ndarray
+            A tuple of the corresponding (x,y,z) lattice element indices, or
+            an array of indices with shape (N, 2) or (N, 3) for many points
+        3-tuple of float or numpy.ndarray
             Carestian coordinates of the point in the corresponding lattice
-            element coordinate system
+            element coordinate system, or an array of coordinates with shape
+            (N, 3) for many points
 
         """
+        if _is_array(point):
+            n = self.ndim
+            idx = np.floor((point[:, :n] - self.lower_left) /
+                           self.pitch).astype(int)
+            return idx, self.get_local_coordinates(point, idx)
+
         ix = floor((point[0] - self.lower_left[0])/self.pitch[0])
         iy = floor((point[1] - self.lower_left[1])/self.pitch[1])
         if self.ndim == 2:
@@ -654,19 +873,28 @@ class RectLattice(Lattice):
 
         Parameters
         ----------
-        point : Iterable of float
-            Cartesian coordinates of point
-        idx : Iterable of int
+        point : Iterable of float or numpy.ndarray
+            Cartesian coordinates of point, or an array of coordinates of
+            many points with shape (N, 3)
+        idx : Iterable of int or numpy.ndarray
             (x,y,z) indices of lattice element. If the lattice is 2D, the z
-            index can be omitted.
+            index can be omitted. For many points, an array of indices with
+            shape (N, 2) or (N, 3).
 
         Returns
         -------
-        3-tuple of float
+        3-tuple of float or numpy.ndarray
             Cartesian coordinates of point in the lattice element coordinate
-            system
+            system, or an array of coordinates with shape (N, 3) for many
+            points
 
         """
+        if _is_array(point):
+            n = self.ndim
+            local = np.array(point, dtype=float)
+            local[:, :n] -= self.lower_left + (idx[:, :n] + 0.5)*self.pitch
+            return local
+
         x = point[0] - (self.lower_left[0] + (idx[0] + 0.5)*self.pitch[0])
         y = point[1] - (self.lower_left[1] + (idx[1] + 0.5)*self.pitch[1])
         if self.ndim == 2:
@@ -680,21 +908,26 @@ class RectLattice(Lattice):
 
         Parameters
         ----------
-        idx : Iterable of int
-            Lattice element indices in the :math:`(x,y,z)` coordinate system
+        idx : Iterable of int or numpy.ndarray
+            Lattice element indices in the :math:`(x,y,z)` coordinate system,
+            or an array of indices of many elements with shape (N, 2) or
+            (N, 3)
 
         Returns
         -------
-        2- or 3-tuple of int
-            Indices used when setting the :attr:`RectLattice.universes` property
+        2- or 3-tuple of int or numpy.ndarray
+            Indices used when setting the :attr:`RectLattice.universes`
+            property. For many elements, each entry of the tuple is an array.
 
         """
+        if _is_array(idx):
+            idx = idx.T
         max_y = self.shape[1] - 1
         if self.ndim == 2:
-            x, y = idx
+            x, y = idx[:2]
             return (max_y - y, x)
         else:
-            x, y, z = idx
+            x, y, z = idx[:3]
             return (z, max_y - y, x)
 
     def is_valid_index(self, idx):
@@ -702,15 +935,22 @@ class RectLattice(Lattice):
 
         Parameters
         ----------
-        idx : Iterable of int
-            Lattice element indices in the :math:`(x,y,z)` coordinate system
+        idx : Iterable of int or numpy.ndarray
+            Lattice element indices in the :math:`(x,y,z)` coordinate system,
+            or an array of indices of many elements with shape (N, 2) or
+            (N, 3)
 
         Returns
         -------
-        bool
-            Whether index is valid
+        bool or numpy.ndarray
+            Whether index is valid, or a boolean array for many elements
 
         """
+        if _is_array(idx):
+            n = self.ndim
+            return np.all((idx[:, :n] >= 0) & (idx[:, :n] < self.shape),
+                          axis=1)
+
         if self.ndim == 2:
             return (0 <= idx[0] < self.shape[0] and
                     0 <= idx[1] < self.shape[1])
@@ -981,7 +1221,8 @@ class HexLattice(Lattice):
     def universes(self, universes):
         cv.check_iterable_type('lattice universes', universes, openmc.Universe,
                                min_depth=2, max_depth=3)
-        self._universes = universes
+        self._universes = openmc.geometry._track(universes, self)
+        openmc.geometry._modified(self)
 
         # NOTE: This routine assumes that the user creates a "ragged" list of
         # lists, where each sub-list corresponds to one ring of Universes.
@@ -1052,19 +1293,25 @@ class HexLattice(Lattice):
 
         Parameters
         ----------
-        point : Iterable of float
-            Cartesian coordinates of point
+        point : Iterable of float or numpy.ndarray
+            Cartesian coordinates of point. The elements containing many
+            points can be determined at once by passing an array with shape
+            (N, 3).
 
         Returns
         -------
-        3-tuple of int
+        3-tuple of int or numpy.ndarray
             Indices of corresponding lattice element in :math:`(x,\alpha,z)`
-            bases
+            bases, or an array of indices with shape (N, 3) for many points
         numpy.ndarray
             Carestian coordinates of the point in the corresponding lattice
-            element coordinate system
+            element coordinate system, or an array of coordinates with shape
+            (N, 3) for many points
 
         """
+        if _is_array(point):
+            return self._find_elements(point)
+
         # Convert coordinates to skewed bases
         x = point[0] - self.center[0]
         y = point[1] - self.center[1]
@@ -1091,23 +1338,57 @@ class HexLattice(Lattice):
 
         return idx_min, p_min
 
+    def _find_elements(self, points):
+        """Determine lattice element indices and local coordinates for an
+        array of points with shape (N, 3)"""
+        # Convert coordinates to skewed bases
+        x = points[:, 0] - self.center[0]
+        y = points[:, 1] - self.center[1]
+        if self._num_axial is None:
+            iz = np.ones(len(points), dtype=int)
+        else:
+            z = points[:, 2] - self.center[2]
+            iz = np.floor(z/self.pitch[1] + 0.5*self.num_axial).astype(int)
+        alpha = y - x/sqrt(3.)
+        ix = np.floor(x/(sqrt(0.75) * self.pitch[0])).astype(int)
+        ia = np.floor(alpha/self.pitch[0]).astype(int)
+
+        # Check four lattice elements for every point to see which one is
+        # closest based on local coordinates
+        candidates = [np.column_stack((ix + dx, ia + da, iz))
+                      for dx, da in [(0, 0), (1, 0), (0, 1), (1, 1)]]
+        local = [self.get_local_coordinates(points, idx) for idx in candidates]
+        d = [p[:, 0]**2 + p[:, 1]**2 for p in local]
+        closest = np.argmin(d, axis=0)
+        rows = np.arange(len(points))
+        return (np.stack(candidates)[closest, rows],
+                np.stack(local)[closest, rows])
+
     def get_local_coordinates(self, point, idx):
         r"""Determine local coordinates of a point within a lattice element
 
         Parameters
         ----------
-        point : Iterable of float
-            Cartesian coordinates of point
-        idx : Iterable of int
-            Indices of lattice element in :math:`(x,\alpha,z)` bases
+        point : Iterable of float or numpy.ndarray
+            Cartesian coordinates of point, or an array of coordinates of
+            many points with shape (N, 3)
+        idx : Iterable of int or numpy.ndarray
+            Indices of lattice element in :math:`(x,\alpha,z)` bases, or an
+            array of indices with shape (N, 2) or (N, 3) for many points
 
         Returns
         -------
-        3-tuple of float
+        3-tuple of float or numpy.ndarray
             Cartesian coordinates of point in the lattice element coordinate
-            system
+            system, or an array of coordinates with shape (N, 3) for many
+            points
 
         """
+        many = _is_array(point)
+        if many:
+            point = point.T
+            idx = idx.T
+
         x = point[0] - (self.center[0] + sqrt(0.75)*self.pitch[0]*idx[0])
         y = point[1] - (self.center[1] + (0.5*idx[0] + idx[1])*self.pitch[0])
         if self._num_axial is None:
@@ -1115,6 +1396,8 @@ class HexLattice(Lattice):
         else:
             z = point[2] - (self.center[2] + (idx[2] + 0.5 - 0.5*self.num_axial)*
                             self.pitch[1])
+        if many:
+            return np.column_stack((x, y, z))
         return (x, y, z)
 
     def get_universe_index(self, idx):
@@ -1122,16 +1405,34 @@ class HexLattice(Lattice):
 
         Parameters
         ----------
-        idx : Iterable of int
+        idx : Iterable of int or numpy.ndarray
             Lattice element indices in the :math:`(x,\alpha,z)` coordinate
-            system
+            system, or an array of indices of many elements with shape (N, 2)
+            or (N, 3)
 
         Returns
         -------
-        2- or 3-tuple of int
-            Indices used when setting the :attr:`HexLattice.universes` property
+        2- or 3-tuple of int or numpy.ndarray
+            Indices used when setting the :attr:`HexLattice.universes`
+            property. For many elements, each entry of the tuple is an array.
 
         """
+        if _is_array(idx):
+            idx = idx.T
+
+            # Determine the ring and the position along the ring as below
+            x = idx[0]
+            a = idx[1]
+            z = -a - x
+            g = np.maximum(np.maximum(abs(x), abs(a)), abs(z))
+            i_ring = self._num_rings - 1 - g
+            i_within = np.select([(x >= 0) & (a >= 0), x >= 0, a <= 0],
+                                 [x, 2*g + z, 3*g - x], 5*g - z)
+
+            if self.num_axial is None:
+                return (i_ring, i_within)
+            else:
+                return (idx[2], i_ring, i_within)
 
         # First we determine which ring the index corresponds to.
         x = idx[0]
@@ -1162,16 +1463,28 @@ class HexLattice(Lattice):
 
         Parameters
         ----------
-        idx : Iterable of int
+        idx : Iterable of int or numpy.ndarray
             Lattice element indices in the :math:`(x,\alpha,z)` coordinate
-            system
+            system, or an array of indices of many elements with shape (N, 2)
+            or (N, 3)
 
         Returns
         -------
-        bool
-            Whether index is valid
+        bool or numpy.ndarray
+            Whether index is valid, or a boolean array for many elements
 
         """
+        if _is_array(idx):
+            x = idx[:, 0]
+            y = idx[:, 1]
+            z = 0 - y - x
+            g = np.maximum(np.maximum(abs(x), abs(y)), abs(z))
+            if self.num_axial is None:
+                return g < self.num_rings
+            else:
+                return ((g < self.num_rings) & (0 <= idx[:, 2]) &
+                        (idx[:, 2] < self.num_axial))
+
         x = idx[0]
         y = idx[1]
         z = 0 - y - x
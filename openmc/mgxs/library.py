@@ -91,7 +91,7 @@ class Library(object):
         Name of the multi-group cross section library. Used as a label to
         identify tallies in OpenMC 'tallies.xml' file.
     sparse : bool
-        Whether or not the Library's tallies use SciPy's LIL sparse matrix
+        Whether or not the Library's tallies use SciPy's CSR sparse matrix
         format for compressed data storage
 
     """
@@ -449,11 +449,11 @@ class Library(object):
 
     @sparse.setter
     def sparse(self, sparse):
-        """Convert tally data from NumPy arrays to SciPy list of lists (LIL)
-        sparse matrices, and vice versa.
+        """Convert tally data from NumPy arrays to SciPy compressed sparse row
+        (CSR) matrices, and vice versa.
 
         This property may be used to reduce the amount of data in memory during
-        tally data processing. The tally data will be stored as SciPy LIL
+        tally data processing. The tally data will be stored as SciPy CSR
         matrices internally within the Tally object. All tally data access
         properties and methods will return data as a dense NumPy array.
 
@@ -119,7 +119,7 @@ class MDGXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -997,7 +997,7 @@ class ChiDelayed(MDGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -1511,7 +1511,7 @@ class DelayedNuFissionXS(MDGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -1647,7 +1647,7 @@ class Beta(MDGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -1831,7 +1831,7 @@ class DecayRate(MDGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -2007,7 +2007,7 @@ class MatrixMDGXS(MDGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -2600,7 +2600,7 @@ class DelayedNuFissionMatrixXS(MatrixMDGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
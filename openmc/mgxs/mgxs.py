@@ -200,7 +200,7 @@ class MGXS(object):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -642,11 +642,11 @@ class MGXS(object):
 
     @sparse.setter
     def sparse(self, sparse):
-        """Convert tally data from NumPy arrays to SciPy list of lists (LIL)
-        sparse matrices, and vice versa.
+        """Convert tally data from NumPy arrays to SciPy compressed sparse row
+        (CSR) matrices, and vice versa.
 
         This property may be used to reduce the amount of data in memory during
-        tally data processing. The tally data will be stored as SciPy LIL
+        tally data processing. The tally data will be stored as SciPy CSR
         matrices internally within the Tally object. All tally data access
         properties and methods will return data as a dense NumPy array.
 
@@ -2064,7 +2064,7 @@ class MatrixMGXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -2559,7 +2559,7 @@ class TotalXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -2696,7 +2696,7 @@ class TransportXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -2906,7 +2906,7 @@ class AbsorptionXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -3033,7 +3033,7 @@ class CaptureXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -3187,7 +3187,7 @@ class FissionXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -3356,7 +3356,7 @@ class KappaFissionXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -3488,7 +3488,7 @@ class ScatterXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -3705,7 +3705,7 @@ class ScatterMatrixXS(MatrixMGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -4796,7 +4796,7 @@ class MultiplicityMatrixXS(MatrixMGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -4962,7 +4962,7 @@ class ScatterProbabilityMatrix(MatrixMGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -5135,7 +5135,7 @@ class NuFissionMatrixXS(MatrixMGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -5292,7 +5292,7 @@ class Chi(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -5871,7 +5871,7 @@ class InverseVelocity(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -2,9 +2,8 @@ from __future__ import division
 import copy
 import warnings
 import itertools
-import random
 from collections import Iterable, defaultdict
-from numbers import Real
+from numbers import Integral, Real
 from random import uniform, gauss
 from heapq import heappush, heappop
 from math import pi, sin, cos, floor, log10, sqrt
@@ -21,6 +20,15 @@ except ImportError:
 import openmc
 import openmc.checkvalue as cv
 
+# Minimum and maximum number of candidate particle centers sampled at once in
+# random sequential packing
+_RSP_MIN_BATCH = 64
+_RSP_MAX_BATCH = 2**14
+
+# Number of particles whose nearest neighbors are found at once when creating
+# the rod list in close random packing
+_CRP_CHUNK_SIZE = 2**12
+
 
 class TRISO(openmc.Cell):
     """Tristructural-isotopic (TRISO) micro fuel particle
@@ -217,6 +225,26 @@ class _Domain(object):
         """
         pass
 
+    @abstractmethod
+    def random_points(self, size, prn):
+        """Generate Cartesian coordinates of centers of many particles that
+        are contained entirely within the domain with uniform probability.
+
+        Parameters
+        ----------
+        size : int
+            Number of points to generate.
+        prn : numpy.random.RandomState
+            Random number generator.
+
+        Returns
+        -------
+        numpy.ndarray
+            Cartesian coordinates of particle centers with shape (size, 3).
+
+        """
+        pass
+
 
 class _CubicDomain(_Domain):
     """Cubic container in which to pack particles.
@@ -294,6 +322,9 @@ class _CubicDomain(_Domain):
                 uniform(self.limits[0][1], self.limits[1][1]),
                 uniform(self.limits[0][2], self.limits[1][2])]
 
+    def random_points(self, size, prn):
+        return prn.uniform(self.limits[0], self.limits[1], (size, 3))
+
 
 class _CylindricalDomain(_Domain):
     """Cylindrical container in which to pack particles.
@@ -388,6 +419,14 @@ class _CylindricalDomain(_Domain):
         return [r*cos(t) + self.center[0], r*sin(t) + self.center[1],
                 uniform(self.limits[0][2], self.limits[1][2])]
 
+    def random_points(self, size, prn):
+        r = np.sqrt(prn.uniform(0, (self.radius - self.particle_radius)**2,
+                                size))
+        t = prn.uniform(0, 2*pi, size)
+        z = prn.uniform(self.limits[0][2], self.limits[1][2], size)
+        return np.column_stack((r*np.cos(t) + self.center[0],
+                                r*np.sin(t) + self.center[1], z))
+
 
 class _SphericalDomain(_Domain):
     """Spherical container in which to pack particles.
@@ -464,6 +503,12 @@ class _SphericalDomain(_Domain):
              sqrt(x[0]**2 + x[1]**2 + x[2]**2))
         return [r*x[i] + self.center[i] for i in range(3)]
 
+    def random_points(self, size, prn):
+        x = prn.normal(0, 1, (size, 3))
+        r = (prn.uniform(0, (self.radius - self.particle_radius)**3,
+                         size)**(1/3) / np.sqrt((x**2).sum(axis=1)))
+        return r[:, None]*x + self.center
+
 
 def create_triso_lattice(trisos, lower_left, pitch, shape, background):
     """Create a lattice containing TRISO particles for optimized tracking.
@@ -493,25 +538,81 @@ def create_triso_lattice(trisos, lower_left, pitch, shape, background):
     lattice.lower_left = lower_left
     lattice.pitch = pitch
 
-    indices = list(np.broadcast(*np.ogrid[:shape[2], :shape[1], :shape[0]]))
-    triso_locations = {idx: [] for idx in indices}
-    for t in trisos:
-        for idx in t.classify(lattice):
-            if idx in sorted(triso_locations):
-                # Create copy of TRISO particle with materials preserved and
-                # different cell/surface IDs
-                t_copy = copy.deepcopy(t)
-                t_copy.id = None
-                t_copy.fill = t.fill
-                t_copy._surface.id = None
-                triso_locations[idx].append(t_copy)
-            else:
-                warnings.warn('TRISO particle is partially or completely '
-                              'outside of the lattice.')
+    ndim = len(shape)
+    lower_left = np.asarray(lower_left, dtype=float)[:ndim]
+    pitch = np.asarray(pitch, dtype=float)[:ndim]
+    shape = np.asarray(shape, dtype=int)
+
+    # Determine the range of lattice elements overlapped by the bounding box
+    # of each particle
+    centers = np.array([t.center for t in trisos], dtype=float).reshape(-1, 3)
+    radii = np.array([t._surface.r for t in trisos], dtype=float)[:, None]
+    lower = np.floor((centers[:, :ndim] - radii - lower_left)/pitch)
+    upper = np.floor((centers[:, :ndim] + radii - lower_left)/pitch)
+    lower = lower.astype(int)
+    upper = upper.astype(int)
+
+    # Pair each particle with every lattice element in its range
+    particle_ids = []
+    element_ids = []
+    if len(trisos) > 0:
+        span = (upper - lower).max(axis=0) + 1
+    else:
+        span = np.zeros(ndim, dtype=int)
+    for offset in itertools.product(*(range(n) for n in span)):
+        idx = lower + offset
+        overlaps = np.all(idx <= upper, axis=1)
+        particle_ids.append(np.flatnonzero(overlaps))
+        element_ids.append(idx[overlaps])
+    if particle_ids:
+        particle_ids = np.concatenate(particle_ids)
+        element_ids = np.concatenate(element_ids)
+    else:
+        particle_ids = np.empty(0, dtype=int)
+        element_ids = np.empty((0, ndim), dtype=int)
+
+    inside = np.all((element_ids >= 0) & (element_ids < shape), axis=1)
+    if not np.all(inside):
+        warnings.warn('TRISO particle is partially or completely outside of '
+                      'the lattice.')
+    particle_ids = particle_ids[inside]
+    element_ids = element_ids[inside]
+
+    # Index of each element when the elements are ordered by (z,y,x) indices
+    flat_ids = np.ravel_multi_index(element_ids[:, ::-1].T, shape[::-1])
+
+    # Create copies of the TRISO particles, particle by particle, with
+    # materials preserved, different cell/surface IDs and centers in the local
+    # coordinates of the lattice element. Only the surface and region of each
+    # copy are new objects; its fill universe is shared with the original.
+    order = np.lexsort((flat_ids, particle_ids))
+    particle_ids = particle_ids[order]
+    element_ids = element_ids[order]
+    flat_ids = flat_ids[order]
+    local = centers[particle_ids]
+    local[:, :ndim] -= lower_left + (element_ids + 0.5)*pitch
+
+    triso_copies = []
+    for i, center in zip(particle_ids, local):
+        t = trisos[i]
+        t_copy = copy.copy(t)
+        t_copy.id = None
+        t_copy._surface = openmc.Sphere(x0=center[0], y0=center[1],
+                                        z0=center[2], R=t._surface.r)
+        t_copy.region = -t_copy._surface
+        t_copy._center = center
+        t_copy._translation = center
+        triso_copies.append(t_copy)
+
+    # Group the copies by lattice element, preserving the order of particles
+    by_element = np.argsort(flat_ids, kind='mergesort')
+    bounds = np.searchsorted(flat_ids[by_element], np.arange(shape.prod() + 1))
 
     # Create universes
     universes = np.empty(shape[::-1], dtype=openmc.Universe)
-    for idx, triso_list in sorted(triso_locations.items()):
+    for i, idx in enumerate(np.ndindex(*shape[::-1])):
+        triso_list = [triso_copies[j]
+                      for j in by_element[bounds[i]:bounds[i + 1]]]
         if len(triso_list) > 0:
             outside_trisos = openmc.Intersection(~t.region for t in triso_list)
             background_cell = openmc.Cell(fill=background, region=outside_trisos)
@@ -522,10 +623,8 @@ def create_triso_lattice(trisos, lower_left, pitch, shape, background):
         u.add_cell(background_cell)
         for t in triso_list:
             u.add_cell(t)
-            iz, iy, ix = idx
-            t.center = lattice.get_local_coordinates(t.center, (ix, iy, iz))
 
-        if len(shape) == 2:
+        if ndim == 2:
             universes[-1 - idx[0], idx[1]] = u
         else:
             universes[idx[0], -1 - idx[1], idx[2]] = u
@@ -538,15 +637,295 @@ def create_triso_lattice(trisos, lower_left, pitch, shape, background):
     return lattice
 
 
-def _random_sequential_pack(domain, n_particles):
+class _CellList(object):
+    """Array-backed lists of the particles whose centers fall in each cell of a
+    uniform mesh, used to find the neighbors of particles.
+
+    The mesh cells are at least as wide as the given interaction distance, so
+    the particles within that distance of a point are all in the mesh cell
+    containing the point or in one of the 26 cells around it. The mesh is
+    surrounded by a layer of empty cells so that the cells around any cell
+    containing a particle can be found by adding fixed offsets to its index.
+
+    Parameters
+    ----------
+    lower_left : Iterable of float
+        Lower-left coordinates of the region containing the particle centers.
+    upper_right : Iterable of float
+        Upper-right coordinates of the region containing the particle centers.
+    distance : float
+        Interaction distance, i.e. the minimum width of the mesh cells.
+    n_particles : int
+        Maximum number of particles in the lists.
+
+    Attributes
+    ----------
+    shape : numpy.ndarray
+        Number of mesh cells in the x-, y-, and z-directions, including the
+        surrounding layer of empty cells.
+    members : numpy.ndarray
+        Indices of the particles in each mesh cell, padded with -1, with
+        shape (number of mesh cells, capacity).
+    counts : numpy.ndarray
+        Number of particles in each mesh cell.
+    cells : numpy.ndarray
+        Mesh cell of each particle, or -1 for particles not in the lists.
+
+    """
+
+    def __init__(self, lower_left, upper_right, distance, n_particles):
+        self._lower_left = np.asarray(lower_left, dtype=float)
+        extent = np.asarray(upper_right, dtype=float) - self._lower_left
+        n = np.maximum((extent // distance).astype(int), 1)
+        self._width = np.maximum(extent / n, distance)
+        self.shape = n + 2
+
+        n_cells = self.shape.prod()
+        self.members = np.full((n_cells, 4), -1, dtype=int)
+        self.counts = np.zeros(n_cells, dtype=int)
+        self.cells = np.full(n_particles, -1, dtype=int)
+        self._slots = np.full(n_particles, -1, dtype=int)
+
+        # Offsets of the flat indices of a mesh cell and the 26 cells around
+        # it, nearest first
+        offsets = np.array(list(itertools.product((-1, 0, 1), repeat=3)))
+        offsets = offsets[np.argsort(np.abs(offsets).sum(axis=1),
+                                     kind='mergesort')]
+        strides = np.array([self.shape[1]*self.shape[2], self.shape[2], 1])
+        self._offsets = offsets.dot(strides)
+
+    def find_cells(self, points):
+        """Determine the mesh cell containing each point.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of points with shape (N, 3).
+
+        Returns
+        -------
+        numpy.ndarray
+            Flat index of the mesh cell containing each point.
+
+        """
+        idx = np.floor((points - self._lower_left) / self._width).astype(int)
+        idx = np.clip(idx, 0, self.shape - 3) + 1
+        return np.ravel_multi_index(idx.T, self.shape)
+
+    def neighbor_cells(self, cells):
+        """Determine the mesh cells around each of many mesh cells.
+
+        Parameters
+        ----------
+        cells : numpy.ndarray
+            Flat indices of mesh cells containing points.
+
+        Returns
+        -------
+        numpy.ndarray
+            Flat indices of each mesh cell and the cells around it with shape
+            (N, 27).
+
+        """
+        return cells[:, None] + self._offsets
+
+    def overlapping(self, points, cells, positions, distance):
+        """Determine which points are closer than a given distance to any
+        particle in the lists.
+
+        The mesh cells around the points are searched one at a time, starting
+        with the cells containing the points, and only the points not yet
+        found to be close to a particle are checked against the next cell.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of points with shape (N, 3).
+        cells : numpy.ndarray
+            Flat index of the mesh cell containing each point.
+        positions : numpy.ndarray
+            Cartesian coordinates of the centers of all particles.
+        distance : float
+            Distance within which a point overlaps a particle.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array indicating whether each point overlaps a particle.
+
+        """
+        overlapping = np.zeros(len(points), dtype=bool)
+        remaining = np.arange(len(points))
+        for offset in self._offsets:
+            if remaining.size == 0:
+                break
+            cell = cells[remaining] + offset
+            members = self.members[cell, :self.counts[cell].max()]
+            if members.size == 0:
+                continue
+            d2 = ((positions[members] - points[remaining, None, :])**2).sum(
+                axis=2)
+            close = np.any((members >= 0) & (d2 < distance**2), axis=1)
+            overlapping[remaining[close]] = True
+            remaining = remaining[~close]
+        return overlapping
+
+    def nearest(self, indices, positions, distance):
+        """Find the nearest neighbor of each of many particles in the lists.
+
+        Parameters
+        ----------
+        indices : numpy.ndarray
+            Indices of the particles.
+        positions : numpy.ndarray
+            Cartesian coordinates of the centers of all particles.
+        distance : float
+            Distance within which neighbors are searched for.
+
+        Returns
+        -------
+        numpy.ndarray
+            Index of the nearest neighbor of each particle, or -1 if there is
+            no other particle within the given distance.
+        numpy.ndarray
+            Distance between each particle and its nearest neighbor, or
+            infinity if there is no other particle within the given distance.
+
+        """
+        if len(indices) == 0:
+            return np.empty(0, dtype=int), np.empty(0)
+
+        neighbors = self.neighbor_cells(self.cells[indices])
+        members = self.members[neighbors, :self.counts[neighbors].max()]
+        members = members.reshape(len(indices), -1)
+        d2 = ((positions[members] - positions[indices, None, :])**2).sum(
+            axis=2)
+        d2[(members < 0) | (members == indices[:, None]) |
+           (d2 >= distance**2)] = np.inf
+
+        rows = np.arange(len(indices))
+        k = d2.argmin(axis=1)
+        d = np.sqrt(d2[rows, k])
+        return np.where(np.isinf(d), -1, members[rows, k]), d
+
+    def add(self, indices, cells):
+        """Add particles to the lists of the mesh cells containing them.
+
+        Parameters
+        ----------
+        indices : numpy.ndarray
+            Indices of the particles.
+        cells : numpy.ndarray
+            Flat index of the mesh cell containing each particle.
+
+        """
+        # Number each particle among those added to the same mesh cell
+        order = np.argsort(cells, kind='mergesort')
+        sorted_cells = cells[order]
+        first = np.searchsorted(sorted_cells, sorted_cells)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order)) - first
+
+        slots = self.counts[cells] + rank
+        if slots.size > 0 and slots.max() >= self.members.shape[1]:
+            capacity = max(2*self.members.shape[1], slots.max() + 1)
+            members = np.full((len(self.counts), capacity), -1, dtype=int)
+            members[:, :self.members.shape[1]] = self.members
+            self.members = members
+
+        self.members[cells, slots] = indices
+        self.counts += np.bincount(cells, minlength=len(self.counts))
+        self.cells[indices] = cells
+        self._slots[indices] = slots
+
+    def remove(self, i):
+        """Remove a particle from the list of the mesh cell containing it.
+
+        Parameters
+        ----------
+        i : int
+            Index of the particle.
+
+        """
+        cell = self.cells[i]
+        slot = self._slots[i]
+        last = self.counts[cell] - 1
+
+        # Move the last particle in the mesh cell into the vacated slot
+        j = self.members[cell, last]
+        self.members[cell, slot] = j
+        self._slots[j] = slot
+        self.members[cell, last] = -1
+        self.counts[cell] = last
+        self.cells[i] = -1
+        self._slots[i] = -1
+
+
+def _close_pairs(points, cells, cell_list, distance):
+    """Find the pairs of points closer to each other than a given distance.
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        Cartesian coordinates of points with shape (N, 3).
+    cells : numpy.ndarray
+        Flat index of the mesh cell containing each point.
+    cell_list : openmc.model.triso._CellList
+        Cell list whose mesh is used to find the neighbors of the points.
+    distance : float
+        Distance within which pairs of points are found.
+
+    Returns
+    -------
+    numpy.ndarray
+        Index of the first point of each pair.
+    numpy.ndarray
+        Index of the second point of each pair, which is always greater than
+        the index of the first point.
+
+    """
+    # Sort the points by mesh cell to find the points in each cell by bisection
+    order = np.argsort(cells, kind='mergesort')
+    sorted_cells = cells[order]
+    neighbors = cell_list.neighbor_cells(cells)
+    start = np.searchsorted(sorted_cells, neighbors, 'left')
+    count = np.searchsorted(sorted_cells, neighbors, 'right') - start
+
+    first = []
+    second = []
+    for k in range(count.max() if count.size > 0 else 0):
+        i, n = np.nonzero(count > k)
+        j = order[start[i, n] + k]
+        close = (j > i)
+        i, j = i[close], j[close]
+        close = ((points[i] - points[j])**2).sum(axis=1) < distance**2
+        first.append(i[close])
+        second.append(j[close])
+
+    if first:
+        return np.concatenate(first), np.concatenate(second)
+    else:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+
+
+def _random_sequential_pack(domain, n_particles, seed=None):
     """Random sequential packing of particles within a container.
 
+    Candidate particle centers are sampled in batches. Candidates overlapping
+    a particle that has already been placed are rejected all at once using a
+    cell list. The remaining candidates of a batch are then accepted in the
+    order in which they were sampled unless they overlap an earlier accepted
+    candidate, which gives exactly the configuration that placing the
+    candidates one at a time would.
+
     Parameters
     ----------
     domain : openmc.model._Domain
         Container in which to pack particles.
     n_particles : int
         Number of particles to pack.
+    seed : int, optional
+        RNG seed.
 
     Returns
     ------
@@ -555,29 +934,56 @@ def _random_sequential_pack(domain, n_particles):
 
     """
 
-    sqd = (2*domain.particle_radius)**2
-    particles = []
-    mesh = defaultdict(list)
+    prn = np.random.RandomState(seed)
+    diameter = 2*domain.particle_radius
 
-    for i in range(n_particles):
-        # Randomly sample new center coordinates while there are any overlaps
+    particles = np.zeros((n_particles, 3))
+    cell_list = _CellList(domain.limits[0], domain.limits[1], diameter,
+                          n_particles)
+
+    n_placed = 0
+    acceptance = 1.
+    while n_placed < n_particles:
+        # Sample enough candidates to place the remaining particles given the
+        # fraction of candidates accepted in the last batch
+        n_remaining = n_particles - n_placed
+        size = int(min(max(n_remaining/acceptance, _RSP_MIN_BATCH),
+                       _RSP_MAX_BATCH))
+        points = domain.random_points(size, prn)
+        cells = cell_list.find_cells(points)
+
+        # Reject candidates overlapping particles that have been placed
+        free = ~cell_list.overlapping(points, cells, particles, diameter)
+        points = points[free]
+        cells = cells[free]
+
+        # Accept candidates in order unless they overlap an earlier accepted
+        # candidate. A candidate is decided once all of the earlier candidates
+        # it overlaps have been decided.
+        first, second = _close_pairs(points, cells, cell_list, diameter)
+        status = np.zeros(len(points), dtype=int)
         while True:
-            p = domain.random_point()
-            idx = domain.mesh_cell(p)
-            if any((p[0]-q[0])**2 + (p[1]-q[1])**2 + (p[2]-q[2])**2 < sqd
-                   for q in mesh[idx]):
-                continue
-            else:
+            undecided = (status == 0)
+            blocked = np.bincount(second, (status[first] == 1),
+                                  len(points)) > 0
+            waiting = np.bincount(second, (status[first] == 0),
+                                  len(points)) > 0
+            status[undecided & blocked] = -1
+            status[undecided & ~blocked & ~waiting] = 1
+            if not np.any(status == 0):
                 break
-        particles.append(p)
+        accepted = np.flatnonzero(status == 1)[:n_remaining]
 
-        for idx in domain.nearby_mesh_cells(p):
-            mesh[idx].append(p)
+        indices = np.arange(n_placed, n_placed + len(accepted))
+        particles[indices] = points[accepted]
+        cell_list.add(indices, cells[accepted])
+        n_placed += len(accepted)
+        acceptance = max(len(accepted)/size, 1/_RSP_MAX_BATCH)
 
-    return np.array(particles)
+    return particles
 
 
-def _close_random_pack(domain, particles, contraction_rate):
+def _close_random_pack(domain, particles, contraction_rate, callback=None):
     """Close random packing of particles using the Jodrey-Tory algorithm.
 
     Parameters
@@ -588,6 +994,10 @@ def _close_random_pack(domain, particles, contraction_rate):
         Initial Cartesian coordinates of centers of particles.
     contraction_rate : float
         Contraction rate of outer diameter.
+    callback : callable, optional
+        Function called after each elimination of overlaps with the number
+        of overlaps eliminated so far, the current inner and outer diameters
+        and the number of rods in the priority queue.
 
     """
 
@@ -864,6 +1274,7 @@ def _close_random_pack(domain, particles, contraction_rate):
             mesh[idx].add(i)
             mesh_map[i].add(idx)
 
+    n_eliminated = 0
     while True:
         create_rod_list()
         if inner_diameter[0] >= diameter:
@@ -873,14 +1284,319 @@ def _close_random_pack(domain, particles, contraction_rate):
             reduce_outer_diameter()
             repel_particles(i, j, d)
             update_rod_list(i, j)
+            n_eliminated += 1
+            if callback is not None:
+                callback(n_eliminated, inner_diameter[0], outer_diameter[0],
+                         len(rods_map)//2)
             if inner_diameter[0] >= diameter or not rods:
                 break
 
 
+def _close_random_pack_grid(domain, particles, contraction_rate,
+                            batch_size, callback=None):
+    """Close random packing of particles using the Jodrey-Tory algorithm with
+    array-backed neighbor searches.
+
+    The rods, i.e. the pairs of particles that are each other's nearest
+    neighbors, are kept in a priority queue, while the rod containing each
+    particle is tracked in arrays so that rods can be invalidated without
+    searching the queue. Nearest neighbors are found with a cell list whose
+    mesh cells are one particle diameter wide, so only particles closer than
+    one diameter are considered neighbors. Particles without such neighbors
+    already satisfy the final packing.
+
+    Up to 'batch_size' of the shortest rods that are far enough apart not to
+    interact are eliminated at once, moving their particles and updating
+    their neighbors with a single set of array operations.
+
+    Parameters
+    ----------
+    domain : openmc.model._Domain
+        Container in which to pack particles.
+    particles : numpy.ndarray
+        Initial Cartesian coordinates of centers of particles.
+    contraction_rate : float
+        Contraction rate of outer diameter.
+    batch_size : int
+        Maximum number of overlaps eliminated at once.
+    callback : callable, optional
+        Function called after each elimination of overlaps with the number
+        of overlaps eliminated so far, the current inner and outer diameters
+        and the number of rods in the priority queue.
+
+    """
+
+    def add_rods(d, i, j):
+        """Add new rods to the priority queue.
+
+        Parameters
+        ----------
+        d : numpy.ndarray
+            Distance between centers of particles i and j.
+        i, j : numpy.ndarray
+            Index of particles in particles array.
+
+        """
+
+        for rod in zip(d.tolist(), i.tolist(), j.tolist()):
+            rod_id[0] += 1
+            rod_of[rod[1]] = rod_of[rod[2]] = rod_id[0]
+            partner[rod[1]] = rod[2]
+            partner[rod[2]] = rod[1]
+            heappush(rods, rod + (rod_id[0],))
+
+    def remove_rods(i):
+        """Mark the rods containing particles i as removed.
+
+        Parameters
+        ----------
+        i : numpy.ndarray
+            Index of particles in particles array.
+
+        """
+
+        i = i[partner[i] >= 0]
+        j = partner[i]
+        rod_of[i] = rod_of[j] = 0
+        partner[i] = partner[j] = -1
+
+    def pop_rod():
+        """Remove and return the shortest rod, skipping removed rods.
+
+        Returns
+        -------
+        tuple or None
+            Distance between the particle centers, indices of the particles
+            and ID of the rod, or None if the queue is empty
+
+        """
+
+        while rods:
+            rod = heappop(rods)
+            d, i, j, r = rod
+            if rod_of[i] == r and rod_of[j] == r:
+                rod_of[i] = rod_of[j] = 0
+                partner[i] = partner[j] = -1
+                return rod
+
+    def shortest_rod():
+        """Return the length of the shortest rod, or None if there are no
+        rods."""
+
+        while rods:
+            d, i, j, r = rods[0]
+            if rod_of[i] == r and rod_of[j] == r:
+                return d
+            heappop(rods)
+
+    def create_rod_list():
+        """Generate the priority queue of rods from the nearest neighbors of
+        all particles."""
+
+        del rods[:]
+        rod_of[:] = 0
+        partner[:] = -1
+        for start in range(0, n_particles, _CRP_CHUNK_SIZE):
+            i = np.arange(start, min(start + _CRP_CHUNK_SIZE, n_particles))
+            nearest[i], distance[i] = cell_list.nearest(i, particles,
+                                                        diameter)
+
+        # Rods join particles that are each other's nearest neighbors
+        i = np.flatnonzero(nearest >= 0)
+        j = nearest[i]
+        mutual = (nearest[j] == i) & (i < j)
+        add_rods(distance[i[mutual]], i[mutual], j[mutual])
+
+    def select_batch():
+        """Pop the shortest rods that are far enough apart to be eliminated
+        at once.
+
+        Returns
+        -------
+        list of tuple
+            Rods to eliminate
+
+        """
+
+        candidates = []
+        while len(candidates) < batch_size:
+            rod = pop_rod()
+            if rod is None:
+                break
+            candidates.append(rod)
+        if len(candidates) <= 1:
+            return candidates
+
+        # Rods are eliminated together if their particles cannot move within
+        # one diameter of each other's particles
+        i = [rod[1] for rod in candidates] + [rod[2] for rod in candidates]
+        n = len(candidates)
+        d = cdist(particles[i], particles[i]).reshape(2, n, 2, n).min(
+            axis=(0, 2))
+        conflicts = d < outer_diameter[0] + 2*diameter
+
+        # The shortest rod is always eliminated, followed by each rod not
+        # conflicting with the rods selected before it
+        selected = []
+        for k, row in enumerate(conflicts.tolist()):
+            if not any(row[m] for m in selected):
+                selected.append(k)
+        selected = set(selected)
+
+        batch = []
+        for k, rod in enumerate(candidates):
+            if k in selected:
+                batch.append(rod)
+            else:
+                d, i, j, r = rod
+                rod_of[i] = rod_of[j] = r
+                partner[i] = j
+                partner[j] = i
+                heappush(rods, rod)
+        return batch
+
+    def reduce_outer_diameter():
+        """Reduce the outer diameter so that at the (i+1)-st iteration it is:
+
+            d_out^(i+1) = d_out^(i) - (1/2)^(j) * d_out0 * k / n,
+
+        where k is the contraction rate, n is the number of particles, and
+
+            j = floor(-log10(pf_out - pf_in)).
+
+        """
+
+        inner_pf = (4/3 * pi * (inner_diameter[0]/2)**3 * n_particles /
+                    domain.volume)
+        outer_pf = (4/3 * pi * (outer_diameter[0]/2)**3 * n_particles /
+                    domain.volume)
+
+        j = floor(-log10(outer_pf - inner_pf))
+        outer_diameter[0] = (outer_diameter[0] - 0.5**j * contraction_rate *
+                             initial_outer_diameter / n_particles)
+
+    def repel_particles(batch):
+        """Move the particles of each rod apart so that their distance is
+        equal to the outer diameter at the time the rod is eliminated,
+        accounting for reflective boundary conditions on the domain.
+
+        Parameters
+        ----------
+        batch : list of tuple
+            Rods to eliminate
+
+        Returns
+        -------
+        numpy.ndarray
+            Indices of the moved particles
+
+        """
+
+        outer = []
+        for rod in batch:
+            reduce_outer_diameter()
+            outer.append(outer_diameter[0])
+        d, i, j, _ = (np.array(x) for x in zip(*batch))
+
+        r = ((np.array(outer) - d)/2)[:, None]
+        v = (particles[i] - particles[j])/d[:, None]
+        particles[i] = (particles[i] + r*v).clip(*domain.limits)
+        particles[j] = (particles[j] - r*v).clip(*domain.limits)
+
+        moved = np.concatenate((i, j))
+        for k in moved.tolist():
+            cell_list.remove(k)
+        cell_list.add(moved, cell_list.find_cells(particles[moved]))
+        return moved
+
+    def update_rod_list(moved):
+        """Update the rod list with the new nearest neighbors of the moved
+        particles since their overlap was eliminated.
+
+        Parameters
+        ----------
+        moved : numpy.ndarray
+            Indices of the moved particles
+
+        """
+
+        # If the nearest neighbor k of a moved particle i has no nearer
+        # neighbors, remove the rod currently containing k from the rod list
+        # and add rod k-i, keeping the rod list sorted
+        is_moved = np.zeros(n_particles, dtype=bool)
+        is_moved[moved] = True
+        k, d_ik = cell_list.nearest(moved, particles, diameter)
+        i = moved[k >= 0]
+        d_ik = d_ik[k >= 0]
+        k = k[k >= 0]
+        l, _ = cell_list.nearest(k, particles, diameter)
+        mutual = (l == i)
+        i, k, d_ik = i[mutual], k[mutual], d_ik[mutual]
+
+        # Each pair of moved particles that are each other's nearest
+        # neighbors forms only one rod
+        unique = (~is_moved[k] | (i < k))
+        remove_rods(np.concatenate((i, k)))
+        add_rods(d_ik[unique], i[unique], k[unique])
+
+        # Set inner diameter to the shortest distance between two particle
+        # centers
+        d = shortest_rod()
+        if d is not None:
+            inner_diameter[0] = d
+
+    if not _SCIPY_AVAILABLE:
+        raise ImportError('SciPy must be installed to perform '
+                          'close random packing.')
+    cdist = scipy.spatial.distance.cdist
+
+    n_particles = len(particles)
+    diameter = 2*domain.particle_radius
+
+    # Outer diameter initially set to arbitrary value that yields pf of 1
+    initial_outer_diameter = 2*(domain.volume/(n_particles*4/3*pi))**(1/3)
+
+    # Inner and outer diameter of particles will change during packing
+    outer_diameter = [initial_outer_diameter]
+    inner_diameter = [0]
+
+    rods = []
+    rod_id = [0]
+    rod_of = np.zeros(n_particles, dtype=int)
+    partner = np.full(n_particles, -1, dtype=int)
+    nearest = np.empty(n_particles, dtype=int)
+    distance = np.empty(n_particles)
+
+    cell_list = _CellList(domain.limits[0], domain.limits[1], diameter,
+                          n_particles)
+    cell_list.add(np.arange(n_particles), cell_list.find_cells(particles))
+
+    n_eliminated = 0
+    while True:
+        create_rod_list()
+        d = shortest_rod()
+        if d is None or d >= diameter:
+            break
+        inner_diameter[0] = d
+        while True:
+            batch = select_batch()
+            if not batch:
+                break
+            moved = repel_particles(batch)
+            update_rod_list(moved)
+            n_eliminated += len(batch)
+            if callback is not None:
+                callback(n_eliminated, inner_diameter[0], outer_diameter[0],
+                         np.count_nonzero(partner >= 0)//2)
+            if inner_diameter[0] >= diameter or shortest_rod() is None:
+                break
+
+
 def pack_trisos(radius, fill, domain_shape='cylinder', domain_length=None,
                 domain_radius=None, domain_center=[0., 0., 0.],
                 n_particles=None, packing_fraction=None,
-                initial_packing_fraction=0.3, contraction_rate=1/400, seed=1):
+                initial_packing_fraction=0.3, contraction_rate=1/400, seed=1,
+                method='grid', batch_size=64, callback=None):
     """Generate a random, non-overlapping configuration of TRISO particles
     within a container.
 
@@ -916,6 +1632,21 @@ def pack_trisos(radius, fill, domain_shape='cylinder', domain_length=None,
         close random packing algorithm. Default value is 1/400.
     seed : int, optional
         RNG seed.
+    method : {'grid', 'mesh'}, optional
+        Implementation of close random packing. The 'grid' method finds
+        nearest neighbors with array-backed cell lists and can eliminate
+        several distant overlaps at once. The 'mesh' method is the original
+        implementation eliminating one overlap at a time. Default is 'grid'.
+    batch_size : int, optional
+        Maximum number of non-interacting overlaps eliminated at once in close
+        random packing with the 'grid' method. With a batch size of 1, the
+        overlaps are eliminated strictly one at a time. Default is 64.
+    callback : callable, optional
+        Function used to report the progress of close random packing. It is
+        called after each elimination of overlaps as ``callback(iteration,
+        inner_diameter, outer_diameter, n_rods)``, where 'iteration' is the
+        number of overlaps eliminated so far and 'n_rods' is the number of
+        rods, i.e. pairs of nearest neighbors, in the priority queue.
 
     Returns
     -------
@@ -939,9 +1670,11 @@ def pack_trisos(radius, fill, domain_shape='cylinder', domain_length=None,
 
     In RSP, particle centers are placed one by one at random, and placement
     attempts for a particle are made until the particle is not overlapping any
-    others. This implementation of the algorithm uses a mesh over the domain
-    to speed up the nearest neighbor search by only searching for a particle's
-    neighbors within that mesh cell.
+    others. This implementation of the algorithm samples placement attempts
+    in batches and checks them against the particles already placed all at
+    once. A mesh over the domain is used to speed up the nearest neighbor
+    search by only searching for a particle's neighbors within the mesh cells
+    adjacent to it.
 
     In CRP, each particle is assigned two diameters, and inner and an outer,
     which approach each other during the simulation. The inner diameter,
@@ -949,7 +1682,9 @@ def pack_trisos(radius, fill, domain_shape='cylinder', domain_length=None,
     the particles and defines the pf. At each iteration the worst overlap
     between particles based on outer diameter is eliminated by moving the
     particles apart along the line joining their centers. Iterations continue
-    until the two diameters converge or until the desired pf is reached.
+    until the two diameters converge or until the desired pf is reached. With
+    the 'grid' method, the worst overlaps that are far enough apart not to
+    affect each other are eliminated in the same iteration.
 
     References
     ----------
@@ -958,6 +1693,11 @@ def pack_trisos(radius, fill, domain_shape='cylinder', domain_length=None,
 
     """
 
+    # Check for valid packing method
+    cv.check_value('close random packing method', method, ('grid', 'mesh'))
+    cv.check_type('close random packing batch size', batch_size, Integral)
+    cv.check_greater_than('close random packing batch size', batch_size, 0)
+
     # Check for valid container geometry and dimensions
     if domain_shape not in ['cube', 'cylinder', 'sphere']:
         raise ValueError('Unable to set domain_shape to "{}". Only "cube", '
@@ -1007,8 +1747,6 @@ def pack_trisos(radius, fill, domain_shape='cylinder', domain_length=None,
         if packing_fraction > 0.3:
             initial_packing_fraction = 0.3
 
-    random.seed(seed)
-
     # Calculate the particle radius used in the initial random sequential
     # packing from the initial packing fraction
     initial_radius = (3/4 * initial_packing_fraction * domain.volume /
@@ -1023,14 +1761,18 @@ def pack_trisos(radius, fill, domain_shape='cylinder', domain_length=None,
 
     # Generate non-overlapping particles for an initial inner radius using
     # random sequential packing algorithm
-    particles = _random_sequential_pack(domain, n_particles)
+    particles = _random_sequential_pack(domain, n_particles, seed)
 
     # Use the particle configuration produced in random sequential packing as a
     # starting point for close random pack with the desired final particle
     # radius
     if initial_packing_fraction != packing_fraction:
         domain.particle_radius = radius
-        _close_random_pack(domain, particles, contraction_rate)
+        if method == 'grid':
+            _close_random_pack_grid(domain, particles, contraction_rate,
+                                    batch_size, callback)
+        else:
+            _close_random_pack(domain, particles, contraction_rate, callback)
 
     trisos = []
     for p in particles:
@@ -1,6 +1,7 @@
 from abc import ABCMeta, abstractmethod
 from collections import Iterable, OrderedDict, MutableSequence
 from copy import deepcopy
+from operator import attrgetter
 
 from six import add_metaclass
 import numpy as np
@@ -19,6 +20,16 @@ class Region(object):
     created through operators of the Surface and Region classes.
 
     """
+
+    # Number of times the region has been modified in place, which is used to
+    # detect when a compiled region program or search grid is out of date
+    _version = 0
+
+    # Number of in-place modifications of any region, including replacing the
+    # region of a cell. While it is unchanged, the versions of individual
+    # nodes need not be compared.
+    _modifications = 0
+
     def __and__(self, other):
         return Intersection((self, other))
 
@@ -32,6 +43,10 @@ class Region(object):
     def __contains__(self, point):
         pass
 
+    @abstractmethod
+    def contains_points(self, points):
+        pass
+
     @abstractmethod
     def __str__(self):
         pass
@@ -151,20 +166,20 @@ class Region(object):
             if operator == ' ':
                 r1 = output.pop()
                 if isinstance(r1, Intersection):
-                    r1 &= r2
+                    _combine(r1, r2)
                     output.append(r1)
                 elif isinstance(r2, Intersection) and can_be_combined(r1):
-                    r2.insert(0, r1)
+                    r2._nodes.insert(0, r1)
                     output.append(r2)
                 else:
                     output.append(r1 & r2)
             elif operator == '|':
                 r1 = output.pop()
                 if isinstance(r1, Union):
-                    r1 |= r2
+                    _combine(r1, r2)
                     output.append(r1)
                 elif isinstance(r2, Union) and can_be_combined(r1):
-                    r2.insert(0, r1)
+                    r2._nodes.insert(0, r1)
                     output.append(r2)
                 else:
                     output.append(r1 | r2)
@@ -276,7 +291,7 @@ class Intersection(Region, MutableSequence):
 
     def __and__(self, other):
         new = Intersection(self)
-        new &= other
+        _combine(new, other)
         return new
 
     def __iand__(self, other):
@@ -292,15 +307,21 @@ class Intersection(Region, MutableSequence):
 
     def __setitem__(self, key, value):
         self._nodes[key] = value
+        self._version += 1
+        Region._modifications += 1
 
     def __delitem__(self, key):
         del self._nodes[key]
+        self._version += 1
+        Region._modifications += 1
 
     def __len__(self):
         return len(self._nodes)
 
     def insert(self, index, value):
         self._nodes.insert(index, value)
+        self._version += 1
+        Region._modifications += 1
 
     def __contains__(self, point):
         """Check whether a point is contained in the region.
@@ -318,6 +339,26 @@ class Intersection(Region, MutableSequence):
         """
         return all(point in n for n in self)
 
+    def contains_points(self, points):
+        """Check which of many points are contained in the region.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array indicating whether each point is in the region
+
+        """
+        points = np.asarray(points, dtype=float)
+        mask = np.ones(len(points), dtype=bool)
+        for n in self:
+            mask &= n.contains_points(points)
+        return mask
+
     def __str__(self):
         return '(' + ' '.join(map(str, self)) + ')'
 
@@ -352,7 +393,7 @@ class Intersection(Region, MutableSequence):
             memo = {}
 
         clone = deepcopy(self)
-        clone[:] = [n.clone(memo) for n in self]
+        clone._nodes = [n.clone(memo) for n in self]
         return clone
 
 
@@ -388,7 +429,7 @@ class Union(Region, MutableSequence):
 
     def __or__(self, other):
         new = Union(self)
-        new |= other
+        _combine(new, other)
         return new
 
     def __ior__(self, other):
@@ -404,15 +445,21 @@ class Union(Region, MutableSequence):
 
     def __setitem__(self, key, value):
         self._nodes[key] = value
+        self._version += 1
+        Region._modifications += 1
 
     def __delitem__(self, key):
         del self._nodes[key]
+        self._version += 1
+        Region._modifications += 1
 
     def __len__(self):
         return len(self._nodes)
 
     def insert(self, index, value):
         self._nodes.insert(index, value)
+        self._version += 1
+        Region._modifications += 1
 
     def __contains__(self, point):
         """Check whether a point is contained in the region.
@@ -430,6 +477,26 @@ class Union(Region, MutableSequence):
         """
         return any(point in n for n in self)
 
+    def contains_points(self, points):
+        """Check which of many points are contained in the region.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array indicating whether each point is in the region
+
+        """
+        points = np.asarray(points, dtype=float)
+        mask = np.zeros(len(points), dtype=bool)
+        for n in self:
+            mask |= n.contains_points(points)
+        return mask
+
     def __str__(self):
         return '(' + ' | '.join(map(str, self)) + ')'
 
@@ -464,7 +531,7 @@ class Union(Region, MutableSequence):
             memo = {}
 
         clone = copy.deepcopy(self)
-        clone[:] = [n.clone(memo) for n in self]
+        clone._nodes = [n.clone(memo) for n in self]
         return clone
 
 
@@ -498,7 +565,8 @@ class Complement(Region):
     """
 
     def __init__(self, node):
-        self.node = node
+        check_type('node', node, Region)
+        self._node = node
 
     def __contains__(self, point):
         """Check whether a point is contained in the region.
@@ -516,6 +584,22 @@ class Complement(Region):
         """
         return point not in self.node
 
+    def contains_points(self, points):
+        """Check which of many points are contained in the region.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array indicating whether each point is in the region
+
+        """
+        return ~self.node.contains_points(points)
+
     def __str__(self):
         return '~' + str(self.node)
 
@@ -527,6 +611,8 @@ class Complement(Region):
     def node(self, node):
         check_type('node', node, Region)
         self._node = node
+        self._version += 1
+        Region._modifications += 1
 
     @property
     def bounding_box(self):
@@ -585,5 +671,228 @@ class Complement(Region):
             memo = {}
 
         clone = copy.deepcopy(self)
-        clone.node = self.node.clone(memo)
+        clone._node = self.node.clone(memo)
         return clone
+
+
+_get_version = attrgetter('_version')
+
+
+def _combine(new, other):
+    """Add the operand of a binary operator to a newly created Intersection or
+    Union without counting it as an in-place modification."""
+    if isinstance(other, type(new)):
+        new._nodes.extend(other)
+    else:
+        new._nodes.append(other)
+
+
+class _RegionVersions(object):
+    """Versions of all nodes of one or more region trees
+
+    Parameters
+    ----------
+    regions : Iterable of openmc.Region or None
+        Regions whose nodes are recorded
+
+    Attributes
+    ----------
+    modifications : int
+        Value of :attr:`Region._modifications` when the nodes were last found
+        to be unchanged
+
+    """
+
+    def __init__(self, regions):
+        self._nodes = []
+        stack = [r for r in regions if r is not None]
+        while stack:
+            region = stack.pop()
+            self._nodes.append(region)
+            if isinstance(region, (Intersection, Union)):
+                stack.extend(region)
+            elif isinstance(region, Complement):
+                stack.append(region.node)
+        self._versions = list(map(_get_version, self._nodes))
+        self.modifications = Region._modifications
+
+    def is_current(self):
+        """Return whether none of the nodes has been modified in place since
+        the versions were recorded."""
+        if self.modifications == Region._modifications:
+            return True
+        if list(map(_get_version, self._nodes)) != self._versions:
+            return False
+        self.modifications = Region._modifications
+        return True
+
+
+# Opcodes of compiled region programs
+_TEST, _JUMP_IF_FALSE, _JUMP_IF_TRUE, _NOT, _CONST = range(5)
+
+
+class _RegionProgram(object):
+    """Region compiled into a flat program with short-circuit evaluation.
+
+    The region tree is flattened into a sequence of instructions operating on
+    a single boolean result, in postfix order: the operand of a complement
+    precedes the instruction that negates it, and each operand of an
+    intersection (union) is followed by a jump past the remaining operands
+    if the result is already known to be false (true). Evaluating a program
+    thus needs neither recursion nor the creation of generators, and the
+    surfaces of the remaining operands are not evaluated once the result is
+    known.
+
+    Parameters
+    ----------
+    region : openmc.Region
+        Region to compile
+
+    Attributes
+    ----------
+    instructions : list of tuple
+        Sequence of (opcode, argument, side) instructions
+    surfaces : list of openmc.Surface
+        Unique surfaces referenced by the instructions
+    versions : openmc.region._RegionVersions
+        Versions of the nodes of the region when the program was compiled
+
+    """
+
+    def __init__(self, region):
+        self.instructions = []
+        self.surfaces = []
+        self.versions = _RegionVersions([region])
+        self._surface_indices = {}
+        self._compile(region)
+        del self._surface_indices
+
+    def _compile(self, region):
+        if isinstance(region, (Intersection, Union)):
+            if len(region) == 0:
+                self.instructions.append(
+                    (_CONST, isinstance(region, Intersection), None))
+                return
+
+            jump = (_JUMP_IF_FALSE if isinstance(region, Intersection)
+                    else _JUMP_IF_TRUE)
+            jumps = []
+            for i, node in enumerate(region):
+                self._compile(node)
+                if i < len(region) - 1:
+                    jumps.append(len(self.instructions))
+                    self.instructions.append(None)
+
+            # Jump past the remaining operands once the result is known
+            end = len(self.instructions)
+            for i in jumps:
+                self.instructions[i] = (jump, end, None)
+
+        elif isinstance(region, Complement):
+            self._compile(region.node)
+            self.instructions.append((_NOT, None, None))
+
+        else:
+            surface = region.surface
+            if id(surface) not in self._surface_indices:
+                self._surface_indices[id(surface)] = len(self.surfaces)
+                self.surfaces.append(surface)
+            self.instructions.append((_TEST, self._surface_indices[
+                id(surface)], region.side == '+'))
+
+    def contains(self, point):
+        """Check whether a point is contained in the region.
+
+        Parameters
+        ----------
+        point : 3-tuple of float
+            Cartesian coordinates, :math:`(x',y',z')`, of the point
+
+        Returns
+        -------
+        bool
+            Whether the point is in the region
+
+        """
+        instructions = self.instructions
+        surfaces = self.surfaces
+        result = True
+        pc = 0
+        n = len(instructions)
+        while pc < n:
+            op, arg, positive = instructions[pc]
+            pc += 1
+            if op == _TEST:
+                val = surfaces[arg].evaluate(point)
+                result = val >= 0. if positive else val < 0.
+            elif op == _JUMP_IF_FALSE:
+                if not result:
+                    pc = arg
+            elif op == _JUMP_IF_TRUE:
+                if result:
+                    pc = arg
+            elif op == _NOT:
+                result = not result
+            else:
+                result = arg
+        return bool(result)
+
+    def contains_points(self, points):
+        """Check which of many points are contained in the region.
+
+        Points for which the result is known after an operand of an
+        intersection or union are suspended until the end of that
+        intersection or union. Once most points are suspended, half-spaces
+        are only tested for the points whose result is still undetermined.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array indicating whether each point is in the region
+
+        """
+        points = np.asarray(points, dtype=float)
+        n = len(points)
+        result = np.ones(n, dtype=bool)
+        active = np.ones(n, dtype=bool)
+        num_active = n
+        suspended = {}
+        for pc, (op, arg, positive) in enumerate(self.instructions):
+            if pc in suspended:
+                active |= suspended.pop(pc)
+                num_active = np.count_nonzero(active)
+            if num_active == 0:
+                continue
+
+            if op == _TEST:
+                if num_active > n // 4:
+                    val = self.surfaces[arg].evaluate(points)
+                    inside = val >= 0. if positive else val < 0.
+                    np.copyto(result, inside, where=active)
+                else:
+                    indices = np.flatnonzero(active)
+                    val = self.surfaces[arg].evaluate(points[indices])
+                    result[indices] = val >= 0. if positive else val < 0.
+            elif op in (_JUMP_IF_FALSE, _JUMP_IF_TRUE):
+                if op == _JUMP_IF_FALSE:
+                    known = active & ~result
+                else:
+                    known = active & result
+                num_known = np.count_nonzero(known)
+                if num_known > 0:
+                    if arg in suspended:
+                        suspended[arg] |= known
+                    else:
+                        suspended[arg] = known
+                    active &= ~known
+                    num_active -= num_known
+            elif op == _NOT:
+                np.logical_not(result, out=result, where=active)
+            else:
+                result[active] = arg
+        return result
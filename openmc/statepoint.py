@@ -1,17 +1,222 @@
+from collections import Iterable, Mapping, OrderedDict, deque
+import copy
 import re
 import os
 import warnings
 import glob
+import multiprocessing
+from numbers import Integral
+import shutil
 
+from six import string_types
 import numpy as np
 import h5py
 
 import openmc
 import openmc.checkvalue as cv
+from openmc.hdf5 import read_datasets
 
 _VERSION_STATEPOINT = 17
 
 
+class _TallyDict(Mapping):
+    """Dictionary of tallies in a statepoint which are created on demand.
+
+    The metadata for all tallies is read up front, but each Tally object is
+    only constructed the first time it is accessed.
+
+    Parameters
+    ----------
+    statepoint : openmc.StatePoint
+        Statepoint which the tallies are read from
+    headers : OrderedDict
+        Dictionary whose keys are tally IDs and whose values are dictionaries
+        of the metadata for each tally
+
+    """
+
+    def __init__(self, statepoint, headers):
+        self._statepoint = statepoint
+        self._headers = headers
+        self._tallies = {}
+
+    def __getitem__(self, tally_id):
+        if tally_id not in self._tallies:
+            if tally_id not in self._headers:
+                raise KeyError(tally_id)
+            self._tallies[tally_id] = \
+                self._statepoint._create_tally(self._headers[tally_id])
+        return self._tallies[tally_id]
+
+    def __contains__(self, tally_id):
+        return tally_id in self._headers
+
+    def __iter__(self):
+        return iter(self._headers)
+
+    def __len__(self):
+        return len(self._headers)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    @property
+    def headers(self):
+        return self._headers
+
+    def loaded(self):
+        """Return the tallies which have already been created.
+
+        Returns
+        -------
+        list of openmc.Tally
+            Tallies which have been accessed
+
+        """
+        return list(self._tallies.values())
+
+
+class _TallyIndex(object):
+    """Inverted index of the tallies in a statepoint used by
+    :meth:`StatePoint.get_tally`.
+
+    Each tally is referred to by its position in the statepoint. The index maps
+    the name, estimator, scores, nuclides and filters of the tallies, as well
+    as the number of scores, nuclides and filters in each tally, to the set of
+    positions of the tallies which have them. A query intersects these sets to
+    find the tallies which may satisfy it, so that only those few tallies need
+    to be created and compared in full.
+
+    Parameters
+    ----------
+    headers : OrderedDict
+        Dictionary whose keys are tally IDs and whose values are dictionaries
+        of the metadata for each tally
+    filters : dict
+        Dictionary whose keys are filter IDs and whose values are Filter
+        objects
+
+    """
+
+    def __init__(self, headers, filters):
+        self._ids = list(headers)
+        self._positions = {tally_id: i for i, tally_id in enumerate(self._ids)}
+        self._all = set(range(len(self._ids)))
+
+        self._names = {}
+        self._estimators = {}
+        self._scores = {}
+        self._nuclides = {}
+        self._filter_types = {}
+        self._filter_bins = {}
+        self._num_scores = {}
+        self._num_nuclides = {}
+        self._num_filters = {}
+
+        for i, header in enumerate(headers.values()):
+            self._names.setdefault(header['name'], set()).add(i)
+            self._estimators.setdefault(header['estimator'], set()).add(i)
+            self._num_scores.setdefault(len(header['scores']), set()).add(i)
+            self._num_nuclides.setdefault(
+                len(header['nuclides']), set()).add(i)
+            self._num_filters.setdefault(len(header['filters']), set()).add(i)
+
+            for score in header['scores']:
+                self._scores.setdefault(score, set()).add(i)
+            for nuclide in header['nuclides']:
+                self._nuclides.setdefault(nuclide, set()).add(i)
+
+            for filter_id in header['filters']:
+                f = filters[filter_id]
+                self._filter_types.setdefault(type(f), set()).add(i)
+                for key in self._filter_keys(f) or []:
+                    self._filter_bins.setdefault(key, set()).add(i)
+
+    @staticmethod
+    def _filter_keys(f):
+        """Return the keys for each of the bins in a filter.
+
+        Bins are only indexed for filters which use the default
+        :meth:`Filter.is_subset` on a one-dimensional array of hashable bins.
+        Other filters are only indexed by their type.
+
+        """
+
+        if type(f).is_subset is not openmc.Filter.is_subset:
+            return None
+
+        try:
+            bins = f.bins
+            if np.ndim(bins) != 1:
+                return None
+            return [(type(f), b) for b in bins]
+        except (RuntimeError, TypeError):
+            return None
+
+    def query(self, scores=[], filters=[], nuclides=[], name=None, id=None,
+              estimator=None, exact_filters=False, exact_nuclides=False,
+              exact_scores=False):
+        """Return the IDs of the tallies which may satisfy a query.
+
+        The parameters are the same as those of :meth:`StatePoint.get_tally`.
+        Each of the returned tallies must still be compared with the query in
+        full, but a tally which is not returned cannot satisfy it.
+
+        Returns
+        -------
+        list of Integral
+            IDs of the candidate tallies in the order they appear in the
+            statepoint
+
+        """
+
+        candidates = []
+
+        if name:
+            candidates.append(self._names.get(name, set()))
+        if id:
+            position = self._positions.get(id)
+            candidates.append(set() if position is None else {position})
+        if estimator:
+            candidates.append(self._estimators.get(estimator, set()))
+
+        if exact_scores:
+            candidates.append(self._num_scores.get(len(scores), set()))
+        if exact_nuclides:
+            candidates.append(self._num_nuclides.get(len(nuclides), set()))
+        if exact_filters:
+            candidates.append(self._num_filters.get(len(filters), set()))
+
+        for score in scores:
+            candidates.append(self._scores.get(score, set()))
+
+        for nuclide in nuclides:
+            if isinstance(nuclide, openmc.Nuclide):
+                candidates.append(self._nuclides.get(nuclide.name, set()))
+            elif isinstance(nuclide, string_types):
+                candidates.append(self._nuclides.get(nuclide, set()))
+
+        for f in filters:
+            candidates.append(self._filter_types.get(type(f), set()))
+            keys = self._filter_keys(f)
+            if keys is not None:
+                for key in keys:
+                    candidates.append(self._filter_bins.get(key, set()))
+
+        if not candidates:
+            positions = self._all
+        else:
+            # Intersect the smallest sets first
+            candidates.sort(key=len)
+            positions = set(candidates[0])
+            for other in candidates[1:]:
+                if not positions:
+                    break
+                positions &= other
+
+        return [self._ids[i] for i in sorted(positions)]
+
+
 class StatePoint(object):
     """State information on a simulation at a certain point in time (at the end
     of a given batch). Statepoints can be used to analyze tally results as well
@@ -95,10 +300,12 @@ class StatePoint(object):
     source_present : bool
         Indicate whether source sites are present
     sparse : bool
-        Whether or not the tallies uses SciPy's LIL sparse matrix format for
+        Whether or not the tallies uses SciPy's CSR sparse matrix format for
         compressed data storage
-    tallies : dict
-        Dictionary whose keys are tally IDs and whose values are Tally objects
+    tallies : collections.Mapping
+        Dictionary whose keys are tally IDs and whose values are Tally objects.
+        The metadata for all tallies is read at once, but each Tally object is
+        only created when it is first accessed.
     tallies_present : bool
         Indicate whether user-defined tallies are present
     tally_derivatives : dict
@@ -116,6 +323,7 @@ class StatePoint(object):
         self._meshes = {}
         self._filters = {}
         self._tallies = {}
+        self._tally_index = None
         self._derivs = {}
 
         # Check filetype and version
@@ -201,10 +409,15 @@ class StatePoint(object):
         if not self._filters_read:
             filters_group = self._f['tallies/filters']
 
-            # Iterate over all Filters
-            for group in filters_group.values():
-                new_filter = openmc.Filter.from_hdf5(group, meshes=self.meshes)
-                self._filters[new_filter.id] = new_filter
+            # Ignore warnings about duplicate IDs
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', openmc.IDWarning)
+
+                # Iterate over all Filters
+                for group in filters_group.values():
+                    new_filter = openmc.Filter.from_hdf5(group,
+                                                         meshes=self.meshes)
+                    self._filters[new_filter.id] = new_filter
 
             self._filters_read = True
 
@@ -345,83 +558,7 @@ class StatePoint(object):
     @property
     def tallies(self):
         if self.tallies_present and not self._tallies_read:
-            # Read the number of tallies
-            tallies_group = self._f['tallies']
-            n_tallies = tallies_group.attrs['n_tallies']
-
-            # Read a list of the IDs for each Tally
-            if n_tallies > 0:
-                # Tally user-defined IDs
-                tally_ids = tallies_group.attrs['ids']
-            else:
-                tally_ids = []
-
-            # Ignore warnings about duplicate IDs
-            with warnings.catch_warnings():
-                warnings.simplefilter('ignore', openmc.IDWarning)
-
-                # Iterate over all tallies
-                for tally_id in tally_ids:
-                    group = tallies_group['tally {}'.format(tally_id)]
-
-                    # Read the number of realizations
-                    n_realizations = group['n_realizations'].value
-
-                    # Create Tally object and assign basic properties
-                    tally = openmc.Tally(tally_id)
-                    tally._sp_filename = self._f.filename
-                    tally.name = group['name'].value.decode() if 'name' in group else ''
-                    tally.estimator = group['estimator'].value.decode()
-                    tally.num_realizations = n_realizations
-
-                    # Read derivative information.
-                    if 'derivative' in group:
-                        deriv_id = group['derivative'].value
-                        tally.derivative = self.tally_derivatives[deriv_id]
-
-                    # Read all filters
-                    n_filters = group['n_filters'].value
-                    if n_filters > 0:
-                        filter_ids = group['filters'].value
-                        filters_group = self._f['tallies/filters']
-                        for filter_id in filter_ids:
-                            filter_group = filters_group['filter {}'.format(
-                                filter_id)]
-                            new_filter = openmc.Filter.from_hdf5(
-                                filter_group, meshes=self.meshes)
-                            tally.filters.append(new_filter)
-
-                    # Read nuclide bins
-                    nuclide_names = group['nuclides'].value
-
-                    # Add all nuclides to the Tally
-                    for name in nuclide_names:
-                        nuclide = openmc.Nuclide(name.decode().strip())
-                        tally.nuclides.append(nuclide)
-
-                    scores = group['score_bins'].value
-                    n_score_bins = group['n_score_bins'].value
-
-                    # Read scattering moment order strings (e.g., P3, Y1,2, etc.)
-                    moments = group['moment_orders'].value
-
-                    # Add the scores to the Tally
-                    for j, score in enumerate(scores):
-                        score = score.decode()
-
-                        # If this is a moment, use generic moment order
-                        pattern = r'-n$|-pn$|-yn$'
-                        score = re.sub(pattern, '-' + moments[j].decode(), score)
-
-                        tally.scores.append(score)
-
-                    # Compute and set the filter strides
-                    tally._update_filter_strides()
-
-                    # Add Tally to the global dictionary of all Tallies
-                    tally.sparse = self.sparse
-                    self._tallies[tally_id] = tally
-
+            self._tallies = _TallyDict(self, self._read_tally_headers())
             self._tallies_read = True
 
         return self._tallies
@@ -468,11 +605,11 @@ class StatePoint(object):
 
     @sparse.setter
     def sparse(self, sparse):
-        """Convert tally data from NumPy arrays to SciPy list of lists (LIL)
-        sparse matrices, and vice versa.
+        """Convert tally data from NumPy arrays to SciPy compressed sparse row
+        (CSR) matrices, and vice versa.
 
         This property may be used to reduce the amount of data in memory during
-        tally data processing. The tally data will be stored as SciPy LIL
+        tally data processing. The tally data will be stored as SciPy CSR
         matrices internally within each Tally object. All tally data access
         properties and methods will return data as a dense NumPy array.
 
@@ -481,10 +618,126 @@ class StatePoint(object):
         cv.check_type('sparse', sparse, bool)
         self._sparse = sparse
 
-        # Update tally sparsities
+        # Update sparsities of tallies which have already been created
         if self._tallies_read:
-            for tally_id in self.tallies:
-                self.tallies[tally_id].sparse = self.sparse
+            for tally in self._tallies.loaded():
+                tally.sparse = self.sparse
+
+    def _read_tally_headers(self):
+        """Read the metadata for all tallies in a single pass over the file.
+
+        Returns
+        -------
+        OrderedDict
+            Dictionary whose keys are tally IDs and whose values are
+            dictionaries of the metadata needed to create each Tally
+
+        """
+
+        tallies_group = self._f['tallies']
+        n_tallies = tallies_group.attrs['n_tallies']
+
+        # Read a list of the IDs for each Tally
+        if n_tallies > 0:
+            tally_ids = tallies_group.attrs['ids']
+        else:
+            tally_ids = []
+
+        # Regular expression for generic moment order scores
+        pattern = re.compile(r'-n$|-pn$|-yn$')
+
+        # Only the small metadata datasets of each tally group are read, using
+        # the low-level HDF5 interface to avoid creating h5py objects for them
+        names = ('name', 'estimator', 'n_realizations', 'derivative',
+                 'n_filters', 'filters', 'nuclides', 'moment_orders',
+                 'score_bins')
+
+        headers = OrderedDict()
+        tallies_id = tallies_group.id
+        for tally_id in tally_ids:
+            group_name = 'tally {}'.format(tally_id).encode()
+            data = read_datasets(h5py.h5g.open(tallies_id, group_name), names)
+
+            header = {'id': int(tally_id)}
+            header['name'] = data['name'].decode() if 'name' in data else ''
+            header['estimator'] = data['estimator'].decode()
+            header['n_realizations'] = data['n_realizations']
+            header['derivative'] = data.get('derivative')
+            header['filters'] = data['filters'] \
+                if data['n_filters'] > 0 else []
+            header['nuclides'] = [name.decode().strip()
+                                  for name in data['nuclides']]
+
+            # Use the scattering moment order strings (e.g., P3, Y1,2, etc.)
+            # in place of generic moment orders in the scores
+            moments = data['moment_orders']
+            header['scores'] = [
+                pattern.sub('-' + moments[j].decode(), score.decode())
+                for j, score in enumerate(data['score_bins'])]
+
+            headers[int(tally_id)] = header
+
+        return headers
+
+    def _create_tally(self, header):
+        """Create a Tally from the metadata read from the statepoint.
+
+        Filters are copied from the statepoint's filters so that filters and
+        meshes shared by several tallies are only read from the file once.
+        Each tally gets independent copies of the filter bins, but meshes are
+        shared between the filters of all tallies.
+
+        Parameters
+        ----------
+        header : dict
+            Metadata for the tally as read by
+            :meth:`StatePoint._read_tally_headers`
+
+        Returns
+        -------
+        openmc.Tally
+            Tally without results, which are read from the file on demand
+
+        """
+
+        # Ignore warnings about duplicate IDs
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', openmc.IDWarning)
+
+            # Create Tally object and assign basic properties
+            tally = openmc.Tally(header['id'])
+            tally._sp_filename = self._f.filename
+            tally.name = header['name']
+            tally.estimator = header['estimator']
+            tally.num_realizations = header['n_realizations']
+
+            # Read derivative information.
+            if header['derivative'] is not None:
+                tally.derivative = self.tally_derivatives[header['derivative']]
+
+            # Each tally needs its own copy of a filter since the filter
+            # strides depend on the tally. The bins are copied as well so that
+            # tallies do not share mutable arrays, while meshes are shared as
+            # they are when filters are read with Filter.from_hdf5.
+            memo = {id(mesh): mesh for mesh in self.meshes.values()}
+            for filter_id in header['filters']:
+                tally.filters.append(copy.deepcopy(self.filters[filter_id],
+                                                   memo))
+
+            # Add all nuclides to the Tally
+            for name in header['nuclides']:
+                tally.nuclides.append(openmc.Nuclide(name))
+
+            # Add the scores to the Tally
+            for score in header['scores']:
+                tally.scores.append(score)
+
+            # Compute and set the filter strides
+            tally._update_filter_strides()
+
+            tally.sparse = self.sparse
+
+        return tally
 
     def add_volume_information(self, volume_calc):
         """Add volume information to the geometry within the file
@@ -504,7 +757,10 @@ class StatePoint(object):
         """Finds and returns a Tally object with certain properties.
 
         This routine searches the list of Tallies and returns the first Tally
-        found which satisfies all of the input parameters.
+        found which satisfies all of the input parameters. An index of the
+        scores, filters, nuclides and estimators of all Tallies is built the
+        first time this method is called, so that only the Tallies which may
+        satisfy the parameters are created and compared with them.
 
         NOTE: If any of the "exact" parameters are False (default), the input
         parameters do not need to match the complete Tally specification and
@@ -554,8 +810,20 @@ class StatePoint(object):
 
         tally = None
 
-        # Iterate over all tallies to find the appropriate one
-        for test_tally in self.tallies.values():
+        # Build the index of tallies if it has not been built yet
+        if self._tally_index is None and self.tallies_present:
+            self._tally_index = _TallyIndex(self.tallies.headers, self.filters)
+
+        if self._tally_index is not None:
+            tally_ids = self._tally_index.query(
+                scores, filters, nuclides, name, id, estimator,
+                exact_filters, exact_nuclides, exact_scores)
+        else:
+            tally_ids = []
+
+        # Iterate over the candidate tallies to find the appropriate one
+        for tally_id in tally_ids:
+            test_tally = self.tallies[tally_id]
 
             # Determine if Tally has queried name
             if name and name != test_tally.name:
@@ -681,3 +949,334 @@ class StatePoint(object):
                     tally_filter.paths = cell.paths
 
         self._summary = summary
+
+
+def _combined_keff(k_sum, k_sum_sq, k_cross, n):
+    """Combine the collision, absorption and tracklength estimates of
+    k-effective as done at the end of a simulation.
+
+    The estimates are combined following T. Urbatsch et al., "Estimation and
+    interpretation of keff confidence intervals in MCNP," Nucl. Technol., 111,
+    169-182 (1995).
+
+    Parameters
+    ----------
+    k_sum : numpy.ndarray
+        Sums of the collision, absorption and tracklength estimates
+    k_sum_sq : numpy.ndarray
+        Sums of squares of the collision, absorption and tracklength estimates
+    k_cross : numpy.ndarray
+        Sums of the collision-absorption, collision-tracklength and
+        absorption-tracklength cross-products
+    n : Integral
+        Number of realizations
+
+    Returns
+    -------
+    numpy.ndarray
+        Combined estimate of k-effective and its standard deviation
+
+    """
+
+    k_combined = np.zeros(2)
+
+    # At least four realizations are needed since there is a N-3 term below
+    if n <= 3:
+        return k_combined
+    n = float(n)
+
+    # Estimates of k-effective and their sample covariance matrix
+    kv = k_sum / n
+    cov = np.empty((3, 3))
+    for i in range(3):
+        cov[i, i] = (k_sum_sq[i] - n*kv[i]*kv[i]) / (n - 1.)
+    for (i, j), cross in zip([(0, 1), (0, 2), (1, 2)], k_cross):
+        cov[i, j] = cov[j, i] = (cross - n*kv[i]*kv[j]) / (n - 1.)
+
+    # Check to see if two estimators are the same, in which case only the two
+    # distinct estimators are combined
+    def same(i, j):
+        return (abs(kv[i] - kv[j]) / kv[i] < 1.e-5 and
+                abs(cov[i, i] - cov[j, j]) / cov[i, i] < 1.e-5)
+
+    if same(0, 1):
+        pair = (0, 2)
+    elif same(0, 2) or same(1, 2):
+        pair = (0, 1)
+    else:
+        pair = None
+
+    if pair is None:
+        # Use three estimators as derived in the paper by Urbatsch
+        g = 0.
+        S = np.zeros(3)
+        for l, (i, j, k) in enumerate([(0, 1, 2), (1, 2, 0), (2, 0, 1)]):
+            f = (cov[j, j]*(cov[k, k] - cov[i, k]) - cov[k, k]*cov[i, j] +
+                 cov[j, k]*(cov[i, j] + cov[i, k] - cov[j, k]))
+
+            S[0] += f*cov[0, l]
+            S[1] += (cov[j, j] + cov[k, k] - 2.*cov[j, k])*kv[l]*kv[l]
+            S[2] += (cov[k, k] + cov[i, j] - cov[j, k] - cov[i, k])*kv[l]*kv[j]
+
+            k_combined[0] += f*kv[l]
+            g += f
+
+        S *= (n - 1.)
+        S[0] *= (n - 1.)**2
+
+        k_combined[0] /= g
+        g *= (n - 1.)**2
+        k_combined[1] = np.sqrt(S[0] / (g*n*(n - 3.)) *
+                                (1. + n*((S[1] - 2.*S[2]) / g)))
+
+    else:
+        # Use only two estimators
+        i, j = pair
+        f = kv[i] - kv[j]
+        g = cov[i, i] + cov[j, j] - 2.*cov[i, j]
+
+        k_combined[0] = kv[i] - (cov[i, i] - cov[i, j]) / g * f
+        k_combined[1] = np.sqrt((cov[i, i]*cov[j, j] - cov[i, j]*cov[i, j]) *
+                                (g + n*f*f) / (n*(n - 2.)*g*g))
+
+    return k_combined
+
+
+def _same_datasets(data, other):
+    """Return whether two dictionaries of HDF5 dataset values are equal."""
+    if other is None or set(data) != set(other):
+        return False
+    return all(np.array_equal(data[name], other[name]) for name in data)
+
+
+def _sum_results(args):
+    """Sum a slice of the results of a tally over several statepoint files.
+
+    Parameters
+    ----------
+    args : tuple
+        Filenames of the statepoints, path of the tally results dataset within
+        each file, and first and last filter bins of the slice
+
+    Returns
+    -------
+    tuple
+        Path of the dataset, first filter bin and the summed slice
+
+    """
+
+    filenames, path, start, stop = args
+
+    total = None
+    for filename in filenames:
+        with h5py.File(filename, 'r') as f:
+            dataset = f[path]
+            if total is None:
+                total = np.empty((stop - start,) + dataset.shape[1:])
+                dataset.read_direct(total, np.s_[start:stop])
+                chunk = np.empty_like(total)
+            else:
+                dataset.read_direct(chunk, np.s_[start:stop])
+                total += chunk
+
+    return path, start, total
+
+
+def merge_statepoints(filenames, path='statepoint.merged.h5',
+                      chunk_size=2**20, processes=None):
+    """Combine the tally results of several independent simulations.
+
+    The statepoints must have been produced by simulations of the same model
+    with the same tallies, e.g. with different random number seeds. The sums
+    and sums of squares of all tallies and of the global tallies are added
+    together and the numbers of realizations are updated accordingly, so that
+    the means and standard deviations computed from the merged statepoint are
+    those of the pooled realizations. The combined estimate of k-effective is
+    recomputed for eigenvalue simulations. All other datasets, e.g. batch-wise
+    k-effective, entropy and the source bank, are copied from the first
+    statepoint.
+
+    The tally results are read and summed in slices of filter bins by a pool
+    of worker processes. Each worker holds at most one chunk of results at a
+    time, split between the running sum and the slice being read, and no
+    more slices are handed to the pool than there are workers, so summed
+    slices cannot pile up while they wait to be written.
+
+    Parameters
+    ----------
+    filenames : Iterable of str
+        Paths to the statepoint files to merge
+    path : str, optional
+        Path to the merged statepoint file to create. Defaults to
+        'statepoint.merged.h5'.
+    chunk_size : Integral, optional
+        Approximate number of tally results, i.e. sum and sum of squares
+        pairs, held in memory by each worker at once. Half of them form the
+        running sum of a slice and the other half the slice read from the
+        next file. Defaults to 2**20.
+    processes : Integral or None, optional
+        Number of worker processes. If None, the number of CPUs is used. If 1,
+        the results are summed in the calling process.
+
+    Returns
+    -------
+    openmc.StatePoint
+        The merged statepoint
+
+    Raises
+    ------
+    ValueError
+        If the statepoints do not have the same run mode, tallies and filters,
+        or if the merged statepoint would overwrite one of them.
+
+    """
+
+    filenames = list(filenames)
+    cv.check_type('filenames', filenames, Iterable, string_types)
+    if not filenames:
+        raise ValueError('Unable to merge an empty list of statepoints')
+    cv.check_type('path', path, string_types)
+    cv.check_type('chunk_size', chunk_size, Integral)
+    cv.check_greater_than('chunk_size', chunk_size, 0)
+    if processes is not None:
+        cv.check_type('processes', processes, Integral)
+        cv.check_greater_than('processes', processes, 0)
+    if os.path.realpath(path) in map(os.path.realpath, filenames):
+        raise ValueError('Unable to write the merged statepoint to "{}" '
+                         'which is one of the statepoints being merged'
+                         .format(path))
+
+    # Read the quantities which are added together from each file and make
+    # sure that the tallies in all of the statepoints are consistent
+    n_realizations = 0
+    global_tallies = 0.
+    k_cross = np.zeros(3)
+    tally_realizations = OrderedDict()
+    shapes = OrderedDict()
+    tally_bins = {}
+    filter_bins = {}
+    for i, filename in enumerate(filenames):
+        with h5py.File(filename, 'r') as f:
+            cv.check_filetype_version(f, 'statepoint', _VERSION_STATEPOINT)
+
+            if i == 0:
+                run_mode = f['run_mode'].value
+                tallies_present = f.attrs['tallies_present'] > 0
+            elif f['run_mode'].value != run_mode or \
+                 (f.attrs['tallies_present'] > 0) != tallies_present:
+                raise ValueError('Unable to merge statepoint "{}" whose run '
+                                 'mode or tallies differ from those of "{}"'
+                                 .format(filename, filenames[0]))
+
+            n_realizations += f['n_realizations'].value
+            global_tallies = global_tallies + f['global_tallies'].value
+            if run_mode == b'eigenvalue':
+                k_cross += [f['k_col_abs'].value, f['k_col_tra'].value,
+                            f['k_abs_tra'].value]
+
+            if not tallies_present:
+                continue
+
+            tallies_group = f['tallies']
+            tally_ids = tallies_group.attrs['ids'] \
+                if tallies_group.attrs['n_tallies'] > 0 else []
+            if i > 0 and list(tally_ids) != list(shapes):
+                raise ValueError('Unable to merge statepoint "{}" whose tally '
+                                 'IDs differ from those of "{}"'
+                                 .format(filename, filenames[0]))
+
+            # Filters must have the same types and bins in every statepoint
+            for name, group in tallies_group['filters'].items():
+                data = read_datasets(group)
+                if i == 0:
+                    filter_bins[name] = data
+                elif not _same_datasets(data, filter_bins.get(name)):
+                    raise ValueError('Unable to merge {} in statepoint "{}" '
+                                     'which differs from that in "{}"'.format(
+                                         name, filename, filenames[0]))
+
+            for tally_id in tally_ids:
+                group = tallies_group['tally {}'.format(tally_id)]
+                shape = group['results'].shape
+                data = read_datasets(group, ('filters', 'nuclides',
+                                             'score_bins', 'moment_orders'))
+                if i == 0:
+                    shapes[tally_id] = shape
+                    tally_bins[tally_id] = data
+                    tally_realizations[tally_id] = 0
+                elif shape != shapes[tally_id]:
+                    raise ValueError('Unable to merge tally {} in statepoint '
+                                     '"{}" whose results differ in shape from '
+                                     'those in "{}"'.format(
+                                         tally_id, filename, filenames[0]))
+                elif not _same_datasets(data, tally_bins[tally_id]):
+                    raise ValueError('Unable to merge tally {} in statepoint '
+                                     '"{}" whose filters, nuclides or scores '
+                                     'differ from those in "{}"'.format(
+                                         tally_id, filename, filenames[0]))
+                tally_realizations[tally_id] += group['n_realizations'].value
+
+    # Divide the results of each tally into slices of filter bins
+    tasks = []
+    for tally_id, shape in shapes.items():
+        results_path = 'tallies/tally {}/results'.format(tally_id)
+        step = max(1, chunk_size // (2*max(1, shape[1])))
+        for start in range(0, shape[0], step):
+            tasks.append((filenames, results_path, start,
+                          min(start + step, shape[0])))
+
+    # The merged statepoint starts out as a copy of the first statepoint
+    shutil.copyfile(filenames[0], path)
+
+    f = h5py.File(path, 'r+')
+    try:
+        def write(results_path, start, total):
+            f[results_path].write_direct(
+                total, dest_sel=np.s_[start:start + total.shape[0]])
+
+        if processes == 1:
+            for task in tasks:
+                write(*_sum_results(task))
+        else:
+            # Keep no more tasks in flight than there are workers so that
+            # summed slices do not accumulate when writing is slower than
+            # reading
+            pool = multiprocessing.Pool(processes)
+            n_workers = processes or multiprocessing.cpu_count()
+            pending = deque()
+            try:
+                for task in tasks:
+                    if len(pending) == n_workers:
+                        write(*pending.popleft().get())
+                    pending.append(pool.apply_async(_sum_results, (task,)))
+                while pending:
+                    write(*pending.popleft().get())
+            finally:
+                pool.close()
+                pool.join()
+
+        for tally_id, n in tally_realizations.items():
+            f['tallies/tally {}/n_realizations'.format(tally_id)][()] = n
+
+        # Update the global tallies, leaving the values accumulated during the
+        # last batch of the first simulation in place
+        data = f['global_tallies'][()]
+        data[:, 1:] = global_tallies[:, 1:]
+        f['global_tallies'][()] = data
+        f['n_realizations'][()] = n_realizations
+
+        if run_mode == b'eigenvalue':
+            for name, cross in zip(['k_col_abs', 'k_col_tra', 'k_abs_tra'],
+                                   k_cross):
+                f[name][()] = cross
+            f['k_combined'][()] = _combined_keff(
+                global_tallies[:3, 1], global_tallies[:3, 2], k_cross,
+                n_realizations)
+    except Exception:
+        # Do not leave a partially merged statepoint behind
+        f.close()
+        os.remove(path)
+        raise
+    f.close()
+
+    return StatePoint(path, autolink=False)
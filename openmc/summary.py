@@ -1,4 +1,5 @@
 from collections import Iterable
+from functools import partial
 import re
 import warnings
 
@@ -7,6 +8,7 @@ import h5py
 
 import openmc
 import openmc.checkvalue as cv
+from openmc.hdf5 import read_datasets
 from openmc.region import Region
 
 _VERSION_SUMMARY = 5
@@ -15,6 +17,17 @@ _VERSION_SUMMARY = 5
 class Summary(object):
     """Summary of geometry, materials, and tallies used in a simulation.
 
+    Parameters
+    ----------
+    filename : str
+        Path to the HDF5 summary file
+    lazy : bool, optional
+        If True, the geometry is only reconstructed once it is first accessed,
+        the region of each cell is only parsed once that region is used and
+        each lattice is only created once a cell filled with it is used. This
+        makes opening the summary of a large model fast when only the
+        materials or nuclides are needed. Defaults to False.
+
     Attributes
     ----------
     date_and_time : str
@@ -31,7 +44,7 @@ class Summary(object):
 
     """
 
-    def __init__(self, filename):
+    def __init__(self, filename, lazy=False):
         if not filename.endswith(('.h5', '.hdf5')):
             msg = 'Unable to open "{0}" which is not an HDF5 summary file'
             raise ValueError(msg)
@@ -39,21 +52,25 @@ class Summary(object):
         self._f = h5py.File(filename, 'r')
         cv.check_filetype_version(self._f, 'summary', _VERSION_SUMMARY)
 
-        self._geometry = openmc.Geometry()
+        self._geometry = None
 
         self._fast_materials = {}
         self._fast_surfaces = {}
         self._fast_cells = {}
         self._fast_universes  = {}
         self._fast_lattices = {}
+        self._lattice_datasets = {}
 
         self._materials = openmc.Materials()
         self._nuclides = {}
+        self._lazy = lazy
 
         self._read_nuclides()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", openmc.IDWarning)
-            self._read_geometry()
+            self._read_materials()
+            if not lazy:
+                self._read_geometry()
 
     @property
     def date_and_time(self):
@@ -61,6 +78,10 @@ class Summary(object):
 
     @property
     def geometry(self):
+        if self._geometry is None:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", openmc.IDWarning)
+                self._read_geometry()
         return self._geometry
 
     @property
@@ -82,8 +103,8 @@ class Summary(object):
             self._nuclides[name.decode()] = awr
 
     def _read_geometry(self):
-        # Read in and initialize the Materials and Geometry
-        self._read_materials()
+        # Read in and initialize the Geometry
+        self._geometry = openmc.Geometry()
         self._read_surfaces()
         cell_fills = self._read_cells()
         self._read_universes()
@@ -112,41 +133,47 @@ class Summary(object):
 
         for key, group in self._f['geometry/cells'].items():
             cell_id = int(key.lstrip('cell '))
-            name = group['name'].value.decode() if 'name' in group else ''
-            fill_type = group['fill_type'].value.decode()
+            data = read_datasets(group)
+            name = data['name'].decode() if 'name' in data else ''
+            fill_type = data['fill_type'].decode()
 
             if fill_type == 'material':
-                fill = group['material'].value
+                fill = data['material']
             elif fill_type == 'universe':
-                fill = group['fill'].value
+                fill = data['fill']
             else:
-                fill = group['lattice'].value
+                fill = data['lattice']
 
-            region = group['region'].value.decode() if 'region' in group else ''
+            region = data['region'].decode() if 'region' in data else ''
 
             # Create this Cell
             cell = openmc.Cell(cell_id=cell_id, name=name)
 
             if fill_type == 'universe':
-                if 'translation' in group:
-                    translation = group['translation'][...]
+                if 'translation' in data:
+                    translation = data['translation']
                     translation = np.asarray(translation, dtype=np.float64)
                     cell.translation = translation
 
-                if 'rotation' in group:
-                    rotation = group['rotation'][...]
+                if 'rotation' in data:
+                    rotation = data['rotation']
                     rotation = np.asarray(rotation, dtype=np.int)
                     cell._rotation = rotation
 
             elif fill_type == 'material':
-                cell.temperature = group['temperature'][...]
+                cell.temperature = data['temperature']
 
             # Store Cell fill information for after Universe/Lattice creation
             cell_fills[cell.id] = (fill_type, fill)
 
-            # Generate Region object given infix expression
+            # Generate Region object given infix expression. For a lazy
+            # summary, the expression is only parsed once the region is used.
             if region:
-                cell.region = Region.from_expression(region, self._fast_surfaces)
+                if self._lazy:
+                    cell._region_expression = (region, self._fast_surfaces)
+                else:
+                    cell.region = Region.from_expression(
+                        region, self._fast_surfaces)
 
             # Add the Cell to the global dictionary of all Cells
             self._fast_cells[cell.id] = cell
@@ -159,9 +186,15 @@ class Summary(object):
             self._fast_universes[universe.id] = universe
 
     def _read_lattices(self):
-        for group in self._f['geometry/lattices'].values():
-            lattice = openmc.Lattice.from_hdf5(group, self._fast_universes)
-            self._fast_lattices[lattice.id] = lattice
+        for key, group in self._f['geometry/lattices'].items():
+            # For a lazy summary, each lattice is only created once a cell
+            # filled with it is used
+            if self._lazy:
+                lattice_id = int(key.lstrip('lattice '))
+                self._lattice_datasets[lattice_id] = read_datasets(group)
+            else:
+                lattice = openmc.Lattice.from_hdf5(group, self._fast_universes)
+                self._fast_lattices[lattice.id] = lattice
 
     def _finalize_geometry(self, cell_fills):
 
@@ -182,6 +215,14 @@ class Summary(object):
             elif fill_type == 'universe':
                 fill = self._fast_universes[fill_id]
                 fill_univ_ids.add(fill_id)
+            elif self._lazy:
+                data = self._lattice_datasets[fill_id]
+                ids = np.append(data['universes'], data['outer'])
+                fill_univ_ids.update(ids[ids >= 0].tolist())
+                self._fast_cells[cell_id]._fill_reader = partial(
+                    _create_lattice, fill_id, data, self._fast_universes,
+                    self._fast_lattices)
+                continue
             else:
                 fill = self._fast_lattices[fill_id]
                 for idx in fill._natural_indices:
@@ -196,7 +237,7 @@ class Summary(object):
         # Determine root universe for geometry
         non_fill = set(self._fast_universes.keys()) - fill_univ_ids
 
-        self.geometry.root_universe = self._fast_universes[non_fill.pop()]
+        self._geometry.root_universe = self._fast_universes[non_fill.pop()]
 
     def add_volume_information(self, volume_calc):
         """Add volume information to the geometry within the summary file
@@ -208,3 +249,35 @@ class Summary(object):
 
         """
         self.geometry.add_volume_information(volume_calc)
+
+
+def _create_lattice(lattice_id, data, universes, lattices):
+    """Create a lattice read from a lazy summary, unless another cell filled
+    with it has already been used
+
+    Parameters
+    ----------
+    lattice_id : int
+        Unique identifier for the lattice
+    data : dict
+        Dictionary mapping the names of the datasets of the lattice's HDF5
+        group to their values
+    universes : dict
+        Dictionary mapping universe IDs to instances of
+        :class:`openmc.Universe`
+    lattices : dict
+        Dictionary mapping lattice IDs to the lattices created so far, which
+        is updated in place
+
+    Returns
+    -------
+    openmc.Lattice
+        The lattice
+
+    """
+    if lattice_id not in lattices:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", openmc.IDWarning)
+            lattices[lattice_id] = openmc.Lattice._from_datasets(
+                lattice_id, data, universes)
+    return lattices[lattice_id]
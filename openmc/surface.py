@@ -21,6 +21,14 @@ AUTO_SURFACE_ID = 10000
 _BOUNDARY_TYPES = ['transmission', 'vacuum', 'reflective', 'periodic']
 
 
+def _coordinates(point):
+    """Return the coordinates of a point or of an (N, 3) array of points in a
+    form that can be indexed or unpacked as x, y, and z."""
+    if isinstance(point, np.ndarray) and point.ndim == 2:
+        return point.T
+    return point
+
+
 class Surface(IDManagerMixin):
     """An implicit surface with an associated boundary condition.
 
@@ -392,22 +400,22 @@ class Plane(Surface):
         periodic_surface._periodic_surface = self
 
     def evaluate(self, point):
-        """Evaluate the surface equation at a given point.
+        """Evaluate the surface equation at a given point or array of points.
 
         Parameters
         ----------
-        point : 3-tuple of float
+        point : 3-tuple of float or numpy.ndarray
             The Cartesian coordinates, :math:`(x',y',z')`, at which the surface
-            equation should be evaluated.
+            equation should be evaluated. Many points can be evaluated at once
+            by passing an array with shape (N, 3).
 
         Returns
         -------
-        float
+        float or numpy.ndarray
             :math:`Ax' + By' + Cz' - d`
 
         """
-
-        x, y, z = point
+        x, y, z = _coordinates(point)
         return self.a*x + self.b*y + self.c*z - self.d
 
     def to_xml_element(self):
@@ -516,20 +524,22 @@ class XPlane(Plane):
                     np.array([np.inf, np.inf, np.inf]))
 
     def evaluate(self, point):
-        """Evaluate the surface equation at a given point.
+        """Evaluate the surface equation at a given point or array of points.
 
         Parameters
         ----------
-        point : 3-tuple of float
+        point : 3-tuple of float or numpy.ndarray
             The Cartesian coordinates, :math:`(x',y',z')`, at which the surface
-            equation should be evaluated.
+            equation should be evaluated. Many points can be evaluated at once
+            by passing an array with shape (N, 3).
 
         Returns
         -------
-        float
+        float or numpy.ndarray
             :math:`x' - x_0`
 
         """
+        point = _coordinates(point)
         return point[0] - self.x0
 
 
@@ -622,20 +632,22 @@ class YPlane(Plane):
                     np.array([np.inf, np.inf, np.inf]))
 
     def evaluate(self, point):
-        """Evaluate the surface equation at a given point.
+        """Evaluate the surface equation at a given point or array of points.
 
         Parameters
         ----------
-        point : 3-tuple of float
+        point : 3-tuple of float or numpy.ndarray
             The Cartesian coordinates, :math:`(x',y',z')`, at which the surface
-            equation should be evaluated.
+            equation should be evaluated. Many points can be evaluated at once
+            by passing an array with shape (N, 3).
 
         Returns
         -------
-        float
+        float or numpy.ndarray
             :math:`y' - y_0`
 
         """
+        point = _coordinates(point)
         return point[1] - self.y0
 
 
@@ -728,20 +740,22 @@ class ZPlane(Plane):
                     np.array([np.inf, np.inf, np.inf]))
 
     def evaluate(self, point):
-        """Evaluate the surface equation at a given point.
+        """Evaluate the surface equation at a given point or array of points.
 
         Parameters
         ----------
-        point : 3-tuple of float
+        point : 3-tuple of float or numpy.ndarray
             The Cartesian coordinates, :math:`(x',y',z')`, at which the surface
-            equation should be evaluated.
+            equation should be evaluated. Many points can be evaluated at once
+            by passing an array with shape (N, 3).
 
         Returns
         -------
-        float
+        float or numpy.ndarray
             :math:`z' - z_0`
 
         """
+        point = _coordinates(point)
         return point[2] - self.z0
 
 
@@ -901,20 +915,22 @@ class XCylinder(Cylinder):
                     np.array([np.inf, np.inf, np.inf]))
 
     def evaluate(self, point):
-        """Evaluate the surface equation at a given point.
+        """Evaluate the surface equation at a given point or array of points.
 
         Parameters
         ----------
-        point : 3-tuple of float
+        point : 3-tuple of float or numpy.ndarray
             The Cartesian coordinates, :math:`(x',y',z')`, at which the surface
-            equation should be evaluated.
+            equation should be evaluated. Many points can be evaluated at once
+            by passing an array with shape (N, 3).
 
         Returns
         -------
-        float
+        float or numpy.ndarray
             :math:`(y' - y_0)^2 + (z' - z_0)^2 - R^2`
 
         """
+        point = _coordinates(point)
         y = point[1] - self.y0
         z = point[2] - self.z0
         return y**2 + z**2 - self.r**2
@@ -1023,20 +1039,22 @@ class YCylinder(Cylinder):
                     np.array([np.inf, np.inf, np.inf]))
 
     def evaluate(self, point):
-        """Evaluate the surface equation at a given point.
+        """Evaluate the surface equation at a given point or array of points.
 
         Parameters
         ----------
-        point : 3-tuple of float
+        point : 3-tuple of float or numpy.ndarray
             The Cartesian coordinates, :math:`(x',y',z')`, at which the surface
-            equation should be evaluated.
+            equation should be evaluated. Many points can be evaluated at once
+            by passing an array with shape (N, 3).
 
         Returns
         -------
-        float
+        float or numpy.ndarray
             :math:`(x' - x_0)^2 + (z' - z_0)^2 - R^2`
 
         """
+        point = _coordinates(point)
         x = point[0] - self.x0
         z = point[2] - self.z0
         return x**2 + z**2 - self.r**2
@@ -1145,20 +1163,22 @@ class ZCylinder(Cylinder):
                     np.array([np.inf, np.inf, np.inf]))
 
     def evaluate(self, point):
-        """Evaluate the surface equation at a given point.
+        """Evaluate the surface equation at a given point or array of points.
 
         Parameters
         ----------
-        point : 3-tuple of float
+        point : 3-tuple of float or numpy.ndarray
             The Cartesian coordinates, :math:`(x',y',z')`, at which the surface
-            equation should be evaluated.
+            equation should be evaluated. Many points can be evaluated at once
+            by passing an array with shape (N, 3).
 
         Returns
         -------
-        float
+        float or numpy.ndarray
             :math:`(x' - x_0)^2 + (y' - y_0)^2 - R^2`
 
         """
+        point = _coordinates(point)
         x = point[0] - self.x0
         y = point[1] - self.y0
         return x**2 + y**2 - self.r**2
@@ -1292,20 +1312,22 @@ class Sphere(Surface):
                     np.array([np.inf, np.inf, np.inf]))
 
     def evaluate(self, point):
-        """Evaluate the surface equation at a given point.
+        """Evaluate the surface equation at a given point or array of points.
 
         Parameters
         ----------
-        point : 3-tuple of float
+        point : 3-tuple of float or numpy.ndarray
             The Cartesian coordinates, :math:`(x',y',z')`, at which the surface
-            equation should be evaluated.
+            equation should be evaluated. Many points can be evaluated at once
+            by passing an array with shape (N, 3).
 
         Returns
         -------
-        float
+        float or numpy.ndarray
             :math:`(x' - x_0)^2 + (y' - y_0)^2 + (z' - z_0)^2 - R^2`
 
         """
+        point = _coordinates(point)
         x = point[0] - self.x0
         y = point[1] - self.y0
         z = point[2] - self.z0
@@ -1383,7 +1405,7 @@ class Cone(Surface):
 
     @property
     def r2(self):
-        return self.coefficients['r2']
+        return self.coefficients['R2']
 
     @x0.setter
     def x0(self, x0):
@@ -1462,20 +1484,22 @@ class XCone(Cone):
         self._type = 'x-cone'
 
     def evaluate(self, point):
-        """Evaluate the surface equation at a given point.
+        """Evaluate the surface equation at a given point or array of points.
 
         Parameters
         ----------
-        point : 3-tuple of float
+        point : 3-tuple of float or numpy.ndarray
             The Cartesian coordinates, :math:`(x',y',z')`, at which the surface
-            equation should be evaluated.
+            equation should be evaluated. Many points can be evaluated at once
+            by passing an array with shape (N, 3).
 
         Returns
         -------
-        float
+        float or numpy.ndarray
             :math:`(y' - y_0)^2 + (z' - z_0)^2 - R^2(x' - x_0)^2`
 
         """
+        point = _coordinates(point)
         x = point[0] - self.x0
         y = point[1] - self.y0
         z = point[2] - self.z0
@@ -1538,20 +1562,22 @@ class YCone(Cone):
         self._type = 'y-cone'
 
     def evaluate(self, point):
-        """Evaluate the surface equation at a given point.
+        """Evaluate the surface equation at a given point or array of points.
 
         Parameters
         ----------
-        point : 3-tuple of float
+        point : 3-tuple of float or numpy.ndarray
             The Cartesian coordinates, :math:`(x',y',z')`, at which the surface
-            equation should be evaluated.
+            equation should be evaluated. Many points can be evaluated at once
+            by passing an array with shape (N, 3).
 
         Returns
         -------
-        float
+        float or numpy.ndarray
             :math:`(x' - x_0)^2 + (z' - z_0)^2 - R^2(y' - y_0)^2`
 
         """
+        point = _coordinates(point)
         x = point[0] - self.x0
         y = point[1] - self.y0
         z = point[2] - self.z0
@@ -1614,20 +1640,22 @@ class ZCone(Cone):
         self._type = 'z-cone'
 
     def evaluate(self, point):
-        """Evaluate the surface equation at a given point.
+        """Evaluate the surface equation at a given point or array of points.
 
         Parameters
         ----------
-        point : 3-tuple of float
+        point : 3-tuple of float or numpy.ndarray
             The Cartesian coordinates, :math:`(x',y',z')`, at which the surface
-            equation should be evaluated.
+            equation should be evaluated. Many points can be evaluated at once
+            by passing an array with shape (N, 3).
 
         Returns
         -------
-        float
+        float or numpy.ndarray
             :math:`(x' - x_0)^2 + (y' - y_0)^2 - R^2(z' - z_0)^2`
 
         """
+        point = _coordinates(point)
         x = point[0] - self.x0
         y = point[1] - self.y0
         z = point[2] - self.z0
@@ -1779,22 +1807,23 @@ class Quadric(Surface):
         self._coefficients['k'] = k
 
     def evaluate(self, point):
-        """Evaluate the surface equation at a given point.
+        """Evaluate the surface equation at a given point or array of points.
 
         Parameters
         ----------
-        point : 3-tuple of float
+        point : 3-tuple of float or numpy.ndarray
             The Cartesian coordinates, :math:`(x',y',z')`, at which the surface
-            equation should be evaluated.
+            equation should be evaluated. Many points can be evaluated at once
+            by passing an array with shape (N, 3).
 
         Returns
         -------
-        float
+        float or numpy.ndarray
             :math:`Ax'^2 + By'^2 + Cz'^2 + Dx'y' + Ey'z' + Fx'z' + Gx' + Hy' +
             Jz' + K = 0`
 
         """
-        x, y, z = point
+        x, y, z = _coordinates(point)
         return x*(self.a*x + self.d*y + self.g) + \
             y*(self.b*y + self.e*z + self.h) + \
             z*(self.c*z + self.f*x + self.j) + self.k
@@ -1838,8 +1867,10 @@ class Halfspace(Region):
     """
 
     def __init__(self, surface, side):
-        self.surface = surface
-        self.side = side
+        check_type('surface', surface, Surface)
+        check_value('side', side, ('+', '-'))
+        self._surface = surface
+        self._side = side
 
     def __and__(self, other):
         if isinstance(other, Intersection):
@@ -1874,6 +1905,23 @@ class Halfspace(Region):
         val = self.surface.evaluate(point)
         return val >= 0. if self.side == '+' else val < 0.
 
+    def contains_points(self, points):
+        """Check which of many points are contained in the half-space.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array indicating whether each point is in the half-space
+
+        """
+        val = self.surface.evaluate(np.asarray(points, dtype=float))
+        return val >= 0. if self.side == '+' else val < 0.
+
     @property
     def surface(self):
         return self._surface
@@ -1882,6 +1930,8 @@ class Halfspace(Region):
     def surface(self, surface):
         check_type('surface', surface, Surface)
         self._surface = surface
+        self._version += 1
+        Region._modifications += 1
 
     @property
     def side(self):
@@ -1891,6 +1941,8 @@ class Halfspace(Region):
     def side(self, side):
         check_value('side', side, ('+', '-'))
         self._side = side
+        self._version += 1
+        Region._modifications += 1
 
     @property
     def bounding_box(self):
@@ -1942,7 +1994,7 @@ class Halfspace(Region):
             memo = dict
 
         clone = deepcopy(self)
-        clone.surface = self.surface.clone(memo)
+        clone._surface = self.surface.clone(memo)
         return clone
 
 
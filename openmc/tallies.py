@@ -38,6 +38,580 @@ _FILTER_CLASSES = (openmc.Filter, openmc.CrossFilter, openmc.AggregateFilter)
 # Valid types of estimators
 ESTIMATOR_TYPES = ['tracklength', 'collision', 'analog']
 
+# Number of tally bins for which the data of derived tallies is computed at a
+# time from the operands in tally arithmetic
+_BLOCK_SIZE = 2**20
+
+# Maximum number of nested tally arithmetic operations whose data are computed
+# together. The data of an operand nested deeper are computed when it is used
+# so that evaluating long chains of operations does not exhaust the stack.
+_MAX_OPERATION_DEPTH = 50
+
+
+def _std_dev(mean, sum_sq, n):
+    """Compute the sample standard deviation of the mean for tally bins.
+
+    Parameters
+    ----------
+    mean : numpy.ndarray
+        Sample mean for each bin
+    sum_sq : numpy.ndarray
+        Sum of each independent realization squared for each bin
+    n : Integral
+        Number of realizations
+
+    Returns
+    -------
+    numpy.ndarray
+        Sample standard deviation of the mean for each bin, which is zero
+        wherever the mean is zero
+
+    """
+
+    nonzero = np.abs(mean) > 0
+    std_dev = np.zeros_like(mean)
+    std_dev[nonzero] = np.sqrt((sum_sq[nonzero]/n - mean[nonzero]**2)/(n - 1))
+    return std_dev
+
+
+def _multiindex_columns(columns):
+    """Convert DataFrame columns to a Pandas MultiIndex.
+
+    Parameters
+    ----------
+    columns : Iterable
+        Column labels, each of which is a string or a tuple of strings
+
+    Returns
+    -------
+    pandas.MultiIndex
+        Columns with each label padded with empty strings to the same number
+        of levels
+
+    """
+
+    # Convert all elements in columns list to tuples
+    columns = [column if isinstance(column, tuple) else (column,)
+               for column in columns]
+
+    # Make each tuple the same length
+    max_len_column = len(max(columns, key=len))
+    for i, column in enumerate(columns):
+        delta_len = max_len_column - len(column)
+        if delta_len > 0:
+            new_column = list(column)
+            new_column.extend(['']*delta_len)
+            columns[i] = tuple(new_column)
+
+    # Create a MultiIndex for the DataFrame's columns
+    return pd.MultiIndex.from_tuples(columns)
+
+
+def _flatten_columns(columns):
+    """Join the levels of DataFrame column labels with spaces.
+
+    Parameters
+    ----------
+    columns : Iterable
+        Column labels, each of which is a string or a tuple of strings
+
+    Returns
+    -------
+    list of str
+        Column labels for on-disk formats which only support flat columns
+
+    """
+
+    flat = []
+    for column in columns:
+        if isinstance(column, tuple):
+            column = ' '.join(str(c) for c in column if c != '')
+        flat.append(str(column))
+    return flat
+
+
+def _to_sparse(data):
+    """Convert tally data to the sparse format used by sparse tallies.
+
+    Sparse tally data is stored as a SciPy CSR matrix with a single row whose
+    columns are the flattened indices of the tally's filter, nuclide and score
+    bins.
+
+    Parameters
+    ----------
+    data : numpy.ndarray or scipy.sparse.spmatrix
+        Tally data
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        Tally data with one column per tally bin
+
+    """
+
+    if sps.issparse(data):
+        data = sps.csr_matrix(data.reshape((1, -1)))
+    else:
+        data = sps.csr_matrix(np.reshape(data, (1, -1)))
+    data.sum_duplicates()
+    return data
+
+
+def _elementwise(func, data):
+    """Apply an elementwise function which maps zero to zero to tally data.
+
+    Parameters
+    ----------
+    func : callable
+        Function applied to the values of the tally data
+    data : numpy.ndarray or scipy.sparse.csr_matrix
+        Tally data
+
+    Returns
+    -------
+    numpy.ndarray or scipy.sparse.csr_matrix
+        Tally data in the same format with the function applied, which for
+        sparse data is only evaluated for the stored values
+
+    """
+
+    if sps.issparse(data):
+        return sps.csr_matrix((func(data.data), data.indices.copy(),
+                               data.indptr.copy()), shape=data.shape)
+    else:
+        return func(data)
+
+
+def _sparse_lookup(data, flat_indices):
+    """Return the values of sparse tally data for flattened bin indices.
+
+    Parameters
+    ----------
+    data : scipy.sparse.csr_matrix
+        Sparse tally data as created by :func:`_to_sparse`
+    flat_indices : numpy.ndarray
+        Flattened indices of the tally bins
+
+    Returns
+    -------
+    numpy.ndarray
+        Values of the tally data with the same shape as the indices
+
+    """
+
+    flat_indices = np.asarray(flat_indices)
+    values = np.zeros(flat_indices.shape)
+    if data.nnz > 0:
+        i = np.searchsorted(data.indices, flat_indices)
+        i[i == data.nnz] = 0
+        found = data.indices[i] == flat_indices
+        values[found] = data.data[i[found]]
+    return values
+
+
+def _sparse_std_dev(mean, sum_sq, n):
+    """Compute the sample standard deviation of the mean for sparse tally data.
+
+    Parameters
+    ----------
+    mean : scipy.sparse.csr_matrix
+        Sample mean for each bin
+    sum_sq : scipy.sparse.csr_matrix
+        Sum of each independent realization squared for each bin
+    n : Integral
+        Number of realizations
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        Sample standard deviation of the mean for each bin, which is only
+        stored where the mean is nonzero
+
+    """
+
+    nonzero = np.abs(mean.data) > 0
+    columns = mean.indices[nonzero]
+    values = mean.data[nonzero]
+    values = np.sqrt((_sparse_lookup(sum_sq, columns)/n - values**2)/(n - 1))
+    return sps.csr_matrix((values, columns, [0, values.size]),
+                          shape=mean.shape)
+
+
+def _sparse_sum(data, shape, axis, indices):
+    """Sum sparse tally data across some of the bins along one axis.
+
+    This is equivalent to taking the bins along the axis from the tally data
+    reshaped to the given shape, and summing them while keeping the axis.
+
+    Parameters
+    ----------
+    data : scipy.sparse.csr_matrix
+        Sparse tally data as created by :func:`_to_sparse`
+    shape : tuple of Integral
+        Shape of the tally data with one dimension per filter, followed by
+        the nuclide and score dimensions
+    axis : Integral
+        Axis to sum across
+    indices : Iterable of Integral
+        Indices of the bins along the axis which are summed
+
+    Returns
+    -------
+    data : scipy.sparse.csr_matrix
+        Sparse summed data
+    shape : tuple of Integral
+        Shape of the summed data, which is one along the summed axis
+
+    """
+
+    counts = np.bincount(np.ravel(indices), minlength=shape[axis])
+    coords = list(np.unravel_index(data.indices, shape))
+    values = data.data * counts[coords[axis]]
+
+    shape = shape[:axis] + (1,) + shape[axis+1:]
+    coords[axis] = np.zeros_like(coords[axis])
+    columns = np.ravel_multi_index(coords, shape)
+
+    data = sps.csr_matrix((values, (np.zeros_like(columns), columns)),
+                          shape=(1, int(np.prod(shape))))
+    data.sum_duplicates()
+    return data, shape
+
+
+def _bin_indices(tally_bins, aligned_bins):
+    """Find the index of each aligned nuclide or score bin in a tally.
+
+    Parameters
+    ----------
+    tally_bins : list
+        The nuclides or scores of a tally
+    aligned_bins : list
+        The nuclides or scores of the tally after alignment for tally
+        arithmetic
+
+    Returns
+    -------
+    None or numpy.ndarray
+        None if the bins are the same, otherwise the index of each aligned bin
+        in the tally's bins, or -1 if the tally does not contain the bin
+
+    """
+
+    if list(tally_bins) == list(aligned_bins):
+        return None
+
+    return np.array([tally_bins.index(aligned_bin)
+                     if aligned_bin in tally_bins else -1
+                     for aligned_bin in aligned_bins], dtype=int)
+
+
+def _take_bins(data, indices, axis):
+    """Select the aligned nuclide or score bins from tally data.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Tally data indexed by filter bin, nuclide bin and score bin
+    indices : None or numpy.ndarray
+        Index of each aligned bin in the data, or -1 for bins which are not in
+        the data and are set to zero
+    axis : Integral
+        The axis of the data for the bins
+
+    Returns
+    -------
+    numpy.ndarray
+        The aligned data
+
+    """
+
+    if indices is None:
+        return data
+
+    # Append zeros to the data for bins missing from the tally, which are
+    # then selected by the index of -1
+    if np.any(indices < 0):
+        data = np.insert(data, data.shape[axis], 0, axis=axis)
+
+    return np.take(data, indices, axis=axis)
+
+
+def _snapshot(tally):
+    """Return a shallow copy of a tally which shares the tally's data.
+
+    Copies of the lists of filters, nuclides and scores are made so that
+    changes to the tally's bins do not affect the copy. Data arrays which
+    have not been handed out through :attr:`Tally.mean`, :attr:`Tally.std_dev`,
+    :attr:`Tally.sum` or :attr:`Tally.sum_sq` are shared copy-on-write: they
+    are marked read-only, and the tally replaces an array by a private copy
+    the next time it is accessed, so in-place changes to the tally's data
+    never affect the copy. Arrays which have been handed out may be changed
+    in place by their holder and are copied.
+
+    Parameters
+    ----------
+    tally : openmc.Tally
+        The tally to copy
+
+    Returns
+    -------
+    openmc.Tally
+        A copy of the tally
+
+    """
+
+    # Operations shared by several expressions cache their results
+    if tally._operation is not None:
+        tally._operation.num_consumers += 1
+
+    snapshot = copy.copy(tally)
+    snapshot._filters = copy.copy(tally._filters)
+    snapshot._nuclides = copy.copy(tally._nuclides)
+    snapshot._scores = copy.copy(tally._scores)
+    snapshot._exposed = set()
+
+    for value in ('sum', 'sum_sq', 'mean', 'std_dev'):
+        data = getattr(tally, '_' + value)
+        if isinstance(data, np.ndarray):
+            if value in tally._exposed:
+                setattr(snapshot, '_' + value, data.copy())
+            else:
+                data.flags.writeable = False
+    return snapshot
+
+
+def _operation_depth(operand):
+    """Return the number of nested operations computing an operand's data."""
+    if isinstance(operand, Tally) and operand._operation is not None:
+        return operand._operation.depth
+    return 0
+
+
+class _TallyOperation(object):
+    """An arithmetic operation which computes the data of a derived tally.
+
+    Tally arithmetic records the operation and its operands rather than
+    immediately computing the data of the derived tally. Since the operands
+    may themselves be derived tallies whose data have not been computed, an
+    arithmetic expression forms a graph of operations. The data for any set
+    of filter bins are computed by evaluating the graph for only those bins,
+    so the data of intermediate tallies in an expression are never stored
+    in full. An operation whose tally is an operand of several operations,
+    however, caches the data of the filter bins it has computed so that
+    shared sub-expressions are only evaluated once.
+
+    Parameters
+    ----------
+    binary_op : {'+', '-', '*', '/', '^', 'abs'}
+        The operation
+    left : openmc.Tally
+        The tally on the left hand side of the operation
+    right : openmc.Tally or Real or None
+        The tally or scalar value on the right hand side of the operation
+    bins : dict or None
+        The aligned bins of two tally operands from
+        :meth:`Tally._align_tally_bins`
+
+    Attributes
+    ----------
+    num_consumers : int
+        Number of operations which use the derived tally as an operand
+    depth : int
+        Number of nested operations computing the derived tally's data
+
+    """
+
+    def __init__(self, binary_op, left, right=None, bins=None):
+        # Compute the data of operands at the end of long chains of
+        # operations, e.g. sums accumulated in a loop
+        for operand in (left, right):
+            if _operation_depth(operand) >= _MAX_OPERATION_DEPTH:
+                operand._evaluate_operation()
+        self.depth = 1 + max(_operation_depth(left), _operation_depth(right))
+
+        self.binary_op = binary_op
+        self.left = _snapshot(left)
+        if isinstance(right, Tally):
+            self.right = _snapshot(right)
+        else:
+            self.right = right
+        self.bins = bins
+        self.num_consumers = 0
+
+        if bins is not None:
+            self.num_bins = tuple(f.num_bins for f in bins['self']['filters'])
+            self.num_filter_bins = int(np.prod(self.num_bins))
+        else:
+            self.num_filter_bins = self.left.num_filter_bins
+
+        # Data computed so far for operations with several consumers
+        self._cache = None
+        self._computed = None
+
+    def _get_operand_data(self, operand, key, filter_indices):
+        """Return the aligned data of an operand for a set of filter bins.
+
+        Parameters
+        ----------
+        operand : openmc.Tally
+            The tally operand
+        key : {'self', 'other'}
+            The operand's key in the aligned bins
+        filter_indices : numpy.ndarray
+            Indices into the filter axis of the derived tally's data
+
+        Returns
+        -------
+        mean : numpy.ndarray
+            The aligned mean of the operand indexed by filter bin, by nuclide
+            bin and score bin for each operand, where the length of the axes
+            for the other operand's bins is one for tensor products
+        std_dev : numpy.ndarray
+            The aligned standard deviation of the operand indexed like the
+            mean
+
+        """
+
+        if self.bins is None:
+            return operand._get_rows_data(filter_indices)
+
+        bins = self.bins[key]
+        positions = bins['filter positions']
+
+        # Find the filter bin of the operand for each requested filter bin
+        if positions == tuple(range(len(self.num_bins))):
+            rows = filter_indices
+        elif len(positions) == 0:
+            rows = np.zeros_like(filter_indices)
+        else:
+            filter_bins = np.unravel_index(filter_indices, self.num_bins)
+            rows = np.ravel_multi_index(
+                [filter_bins[i] for i in positions],
+                [self.num_bins[i] for i in positions])
+
+        # Derived operands only evaluate each of their filter bins once
+        if operand._operation is not None and rows is not filter_indices:
+            rows, inverse = np.unique(rows, return_inverse=True)
+            mean, std_dev = operand._get_rows_data(rows)
+            mean, std_dev = mean[inverse], std_dev[inverse]
+        else:
+            mean, std_dev = operand._get_rows_data(rows)
+
+        # Split the nuclide and score axes such that the data of the two
+        # operands broadcast against each other
+        shape = mean.shape[:1] + bins['nuclide shape'] + bins['score shape']
+        mean = _take_bins(mean, bins['nuclide indices'], 1)
+        mean = np.reshape(_take_bins(mean, bins['score indices'], 2), shape)
+        std_dev = _take_bins(std_dev, bins['nuclide indices'], 1)
+        std_dev = np.reshape(_take_bins(std_dev, bins['score indices'], 2),
+                             shape)
+        return mean, std_dev
+
+    def evaluate(self, filter_indices):
+        """Compute the data of the derived tally for a set of filter bins.
+
+        Parameters
+        ----------
+        filter_indices : numpy.ndarray
+            Indices into the filter axis of the derived tally's data
+
+        Returns
+        -------
+        mean : numpy.ndarray
+            The mean of the derived tally for the filter bins indexed by
+            filter bin, nuclide bin and score bin
+        std_dev : numpy.ndarray
+            The standard deviation of the derived tally for the filter bins
+            indexed by filter bin, nuclide bin and score bin
+
+        """
+
+        filter_indices = np.asarray(filter_indices, dtype=int)
+        if self.num_consumers < 2:
+            return self._evaluate(filter_indices)
+
+        # Only compute the filter bins which have not been computed before
+        if self._computed is None:
+            self._computed = np.zeros(self.num_filter_bins, dtype=bool)
+        missing = np.unique(filter_indices[~self._computed[filter_indices]])
+        if missing.size > 0:
+            mean, std_dev = self._evaluate(missing)
+            if self._cache is None:
+                shape = (self.num_filter_bins,) + mean.shape[1:]
+                self._cache = (np.empty(shape), np.empty(shape))
+            self._cache[0][missing] = mean
+            self._cache[1][missing] = std_dev
+            self._computed[missing] = True
+
+        if self._cache is None:
+            return self._evaluate(filter_indices)
+        return self._cache[0][filter_indices], self._cache[1][filter_indices]
+
+    def _evaluate(self, filter_indices):
+        """Compute the data of the derived tally for a set of filter bins
+        without using the cache."""
+
+        self_mean, self_std_dev = \
+            self._get_operand_data(self.left, 'self', filter_indices)
+        binary_op = self.binary_op
+
+        # Perform tally arithmetic operation with a scalar value
+        if not isinstance(self.right, Tally):
+            other = self.right
+            if binary_op == '+':
+                return self_mean + other, self_std_dev
+            elif binary_op == '-':
+                return self_mean - other, self_std_dev
+            elif binary_op == '*':
+                return self_mean * other, self_std_dev * np.abs(other)
+            elif binary_op == '/':
+                return self_mean / other, self_std_dev * np.abs(1. / other)
+            elif binary_op == '^':
+                mean = self_mean ** other
+                self_rel_err = self_std_dev / self_mean
+                return mean, np.abs(mean * other * self_rel_err)
+            else:
+                return abs(self_mean), self_std_dev
+
+        other_mean, other_std_dev = \
+            self._get_operand_data(self.right, 'other', filter_indices)
+
+        # Perform tally arithmetic operation
+        if binary_op == '+':
+            mean = self_mean + other_mean
+            std_dev = np.sqrt(self_std_dev**2 + other_std_dev**2)
+        elif binary_op == '-':
+            mean = self_mean - other_mean
+            std_dev = np.sqrt(self_std_dev**2 + other_std_dev**2)
+        elif binary_op in ('*', '/'):
+            self_rel_err = self_std_dev / self_mean
+            other_rel_err = other_std_dev / other_mean
+            if binary_op == '*':
+                mean = self_mean * other_mean
+            else:
+                mean = self_mean / other_mean
+
+            # Compute the standard deviation in place to avoid temporary
+            # arrays the size of the derived tally's data
+            std_dev = self_rel_err**2 + other_rel_err**2
+            np.sqrt(std_dev, out=std_dev)
+            std_dev *= np.abs(mean)
+        elif binary_op == '^':
+            mean_ratio = other_mean / self_mean
+            first_term = mean_ratio * self_std_dev
+            second_term = np.log(self_mean) * other_std_dev
+            mean = self_mean ** other_mean
+            std_dev = np.abs(mean) * np.sqrt(first_term**2 + second_term**2)
+
+        # Convert any infs and nans to zero
+        mean[~np.isfinite(mean)] = 0
+        std_dev[~np.isfinite(std_dev)] = 0
+
+        # Merge the broadcast nuclide and score axes of the operands
+        shape = (mean.shape[0], mean.shape[1] * mean.shape[2],
+                 mean.shape[3] * mean.shape[4])
+        return np.reshape(mean, shape), np.reshape(std_dev, shape)
+
 
 class Tally(IDManagerMixin):
     """A tally defined by a set of scores that are accumulated for a list of
@@ -94,7 +668,7 @@ class Tally(IDManagerMixin):
     derived : bool
         Whether or not the tally is derived from one or more other tallies
     sparse : bool
-        Whether or not the tally uses SciPy's LIL sparse matrix format for
+        Whether or not the tally uses SciPy's CSR sparse matrix format for
         compressed data storage
     derivative : openmc.TallyDerivative
         A material perturbation derivative to apply to all scores in the tally.
@@ -128,6 +702,10 @@ class Tally(IDManagerMixin):
 
         self._sp_filename = None
         self._results_read = False
+        self._operation = None
+
+        # Data arrays which may be held outside of the tally
+        self._exposed = set()
 
     def __eq__(self, other):
         if not isinstance(other, Tally):
@@ -265,100 +843,19 @@ class Tally(IDManagerMixin):
 
     @property
     def sum(self):
-        if not self._sp_filename or self.derived:
-            return None
-
-        if not self._results_read:
-            # Open the HDF5 statepoint file
-            f = h5py.File(self._sp_filename, 'r')
-
-            # Extract Tally data from the file
-            data = f['tallies/tally {0}/results'.format(
-                self.id)].value
-            sum = data[:,:,0]
-            sum_sq = data[:,:,1]
-
-            # Reshape the results arrays
-            sum = np.reshape(sum, self.shape)
-            sum_sq = np.reshape(sum_sq, self.shape)
-
-            # Set the data for this Tally
-            self._sum = sum
-            self._sum_sq = sum_sq
-
-            # Convert NumPy arrays to SciPy sparse LIL matrices
-            if self.sparse:
-                self._sum = \
-                    sps.lil_matrix(self._sum.flatten(), self._sum.shape)
-                self._sum_sq = \
-                    sps.lil_matrix(self._sum_sq.flatten(), self._sum_sq.shape)
-
-            # Indicate that Tally results have been read
-            self._results_read = True
-
-            # Close the HDF5 statepoint file
-            f.close()
-
-        if self.sparse:
-            return np.reshape(self._sum.toarray(), self.shape)
-        else:
-            return self._sum
+        return self._dense(self._get_own_data('sum'))
 
     @property
     def sum_sq(self):
-        if not self._sp_filename:
-            return None
-
-        if not self._results_read:
-            # Force reading of sum and sum_sq
-            self.sum
-
-        if self.sparse:
-            return np.reshape(self._sum_sq.toarray(), self.shape)
-        else:
-            return self._sum_sq
+        return self._dense(self._get_own_data('sum_sq'))
 
     @property
     def mean(self):
-        if self._mean is None:
-            if not self._sp_filename:
-                return None
-
-            self._mean = self.sum / self.num_realizations
-
-            # Convert NumPy array to SciPy sparse LIL matrix
-            if self.sparse:
-                self._mean = \
-                    sps.lil_matrix(self._mean.flatten(), self._mean.shape)
-
-        if self.sparse:
-            return np.reshape(self._mean.toarray(), self.shape)
-        else:
-            return self._mean
+        return self._dense(self._get_own_data('mean'))
 
     @property
     def std_dev(self):
-        if self._std_dev is None:
-            if not self._sp_filename:
-                return None
-
-            n = self.num_realizations
-            nonzero = np.abs(self.mean) > 0
-            self._std_dev = np.zeros_like(self.mean)
-            self._std_dev[nonzero] = np.sqrt((self.sum_sq[nonzero]/n -
-                                              self.mean[nonzero]**2)/(n - 1))
-
-            # Convert NumPy array to SciPy sparse LIL matrix
-            if self.sparse:
-                self._std_dev = \
-                    sps.lil_matrix(self._std_dev.flatten(), self._std_dev.shape)
-
-            self.with_batch_statistics = True
-
-        if self.sparse:
-            return np.reshape(self._std_dev.toarray(), self.shape)
-        else:
-            return self._std_dev
+        return self._dense(self._get_own_data('std_dev'))
 
     @property
     def with_batch_statistics(self):
@@ -562,54 +1059,297 @@ class Tally(IDManagerMixin):
     def sum(self, sum):
         cv.check_type('sum', sum, Iterable)
         self._sum = sum
+        self._exposed.add('sum')
 
     @sum_sq.setter
     def sum_sq(self, sum_sq):
         cv.check_type('sum_sq', sum_sq, Iterable)
         self._sum_sq = sum_sq
+        self._exposed.add('sum_sq')
+
+    @sparse.setter
+    def sparse(self, sparse):
+        """Convert tally data from NumPy arrays to SciPy compressed sparse row
+        (CSR) matrices, and vice versa.
+
+        This property may be used to reduce the amount of data in memory during
+        tally data processing. The tally data will be stored internally within
+        the Tally object as SciPy CSR matrices with one column per tally bin.
+        Tally slicing, summation and arithmetic with scalars operate directly
+        on the sparse data. The :attr:`Tally.sum`, :attr:`Tally.sum_sq`,
+        :attr:`Tally.mean` and :attr:`Tally.std_dev` properties return the full
+        data as dense NumPy arrays, while :meth:`Tally.get_values` only
+        converts the requested bins.
+
+        """
+
+        cv.check_type('sparse', sparse, bool)
+
+        # Convert NumPy arrays to SciPy sparse CSR matrices
+        if sparse and not self.sparse:
+            if self._sum is not None:
+                self._sum = _to_sparse(self._sum)
+            if self._sum_sq is not None:
+                self._sum_sq = _to_sparse(self._sum_sq)
+            if self._mean is not None:
+                self._mean = _to_sparse(self._mean)
+            if self._std_dev is not None:
+                self._std_dev = _to_sparse(self._std_dev)
+            self._sparse = True
+
+        # Convert SciPy sparse CSR matrices to NumPy arrays
+        elif not sparse and self.sparse:
+            self._sum = self._dense(self._sum)
+            self._sum_sq = self._dense(self._sum_sq)
+            self._mean = self._dense(self._mean)
+            self._std_dev = self._dense(self._std_dev)
+            self._sparse = False
+
+    def _dense(self, data):
+        """Return tally data as a dense NumPy array shaped like the tally.
+
+        Parameters
+        ----------
+        data : None or numpy.ndarray or scipy.sparse.spmatrix
+            Tally data as stored internally
+
+        Returns
+        -------
+        None or numpy.ndarray
+            The tally data indexed by filter bin, nuclide bin and score bin
+
+        """
+
+        if sps.issparse(data):
+            return np.reshape(data.toarray(), self.shape)
+        else:
+            return data
+
+    def _get_data(self, value):
+        """Return tally data as it is stored internally.
+
+        The results are read from the statepoint and the batch statistics are
+        computed the first time they are needed. Data for sparse tallies is
+        returned as SciPy CSR matrices without being converted to dense
+        arrays.
+
+        Parameters
+        ----------
+        value : {'sum', 'sum_sq', 'mean', 'std_dev'}
+            The type of data to return
+
+        Returns
+        -------
+        None or numpy.ndarray or scipy.sparse.csr_matrix
+            The tally data, or None if the tally does not have any
+
+        """
+
+        # Compute the data of a derived tally from its operands
+        if value in ('mean', 'std_dev') and self._operation is not None:
+            self._evaluate_operation()
+
+        if value == 'sum':
+            if not self._sp_filename or self.derived:
+                return None
+
+            if not self._results_read:
+                # Extract Tally data from the file
+                self._sum, self._sum_sq = self._read_results()
+
+                # Convert NumPy arrays to SciPy sparse CSR matrices
+                if self.sparse:
+                    self._sum = _to_sparse(self._sum)
+                    self._sum_sq = _to_sparse(self._sum_sq)
+
+                # Indicate that Tally results have been read
+                self._results_read = True
+
+            return self._sum
+
+        elif value == 'sum_sq':
+            if not self._sp_filename:
+                return None
+
+            if not self._results_read:
+                # Force reading of sum and sum_sq
+                self._get_data('sum')
+
+            return self._sum_sq
+
+        elif value == 'mean':
+            if self._mean is None:
+                if not self._sp_filename:
+                    return None
+
+                n = self.num_realizations
+                self._mean = _elementwise(lambda x: x / n,
+                                          self._get_data('sum'))
+
+                # Convert NumPy array to SciPy sparse CSR matrix
+                if self.sparse:
+                    self._mean = _to_sparse(self._mean)
+
+            return self._mean
+
+        elif value == 'std_dev':
+            if self._std_dev is None:
+                if not self._sp_filename:
+                    return None
+
+                mean = self._get_data('mean')
+                sum_sq = self._get_data('sum_sq')
+                if sps.issparse(mean):
+                    self._std_dev = _sparse_std_dev(
+                        mean, _to_sparse(sum_sq), self.num_realizations)
+                else:
+                    self._std_dev = _std_dev(self._dense(mean),
+                                             self._dense(sum_sq),
+                                             self.num_realizations)
+
+                self.with_batch_statistics = True
+
+            return self._std_dev
+
+    def _get_own_data(self, value):
+        """Return tally data which is not shared with any tally operation.
+
+        Data arrays shared with the operands of tally arithmetic are
+        read-only, and are replaced by a private copy before they are
+        returned so that in-place changes do not affect derived tallies.
+        Arrays which have been returned are copied rather than shared by
+        later operations.
+
+        Parameters
+        ----------
+        value : {'sum', 'sum_sq', 'mean', 'std_dev'}
+            The type of data to return
+
+        Returns
+        -------
+        None or numpy.ndarray or scipy.sparse.csr_matrix
+            The tally data, or None if the tally does not have any
+
+        """
+
+        data = self._get_data(value)
+        if isinstance(data, np.ndarray):
+            if not data.flags.writeable:
+                data = data.copy()
+                setattr(self, '_' + value, data)
+            self._exposed.add(value)
+        return data
+
+    def _evaluate_operation(self):
+        """Compute the data of a derived tally from the tally arithmetic
+        operation which created it.
+
+        The data are computed in blocks of filter bins so that the data of
+        intermediate tallies in an arithmetic expression are never stored in
+        full. The operation and its operands are released afterwards.
+
+        """
+
+        mean = np.empty(self.shape)
+        std_dev = np.empty(self.shape)
+
+        num_filter_bins = self.num_filter_bins
+        step = max(1, _BLOCK_SIZE // (self.num_nuclides * self.num_scores))
+        for start in range(0, num_filter_bins, step):
+            stop = min(start + step, num_filter_bins)
+            mean[start:stop], std_dev[start:stop] = \
+                self._operation.evaluate(np.arange(start, stop))
+
+        # Data which was explicitly assigned to the tally takes precedence
+        if self._mean is None:
+            self._mean = _to_sparse(mean) if self.sparse else mean
+        if self._std_dev is None:
+            self._std_dev = _to_sparse(std_dev) if self.sparse else std_dev
+        self._operation = None
+
+    @property
+    def _lazy_results(self):
+        """Whether results must still be sliced directly from the statepoint.
+
+        This is True for tallies loaded from a statepoint whose results have
+        not yet been read into memory, in which case individual bins can be
+        read from the HDF5 dataset without loading the full results array.
+
+        """
+
+        return (bool(self._sp_filename) and not self.derived and
+                not self._results_read and self._mean is None and
+                self._std_dev is None)
+
+    def _read_results(self, filter_indices=None):
+        """Read the sum and sum_sq arrays from the statepoint file.
+
+        Only the hyperslab of the HDF5 results dataset spanned by the
+        requested filter bins is read from disk. The sum and sum_sq
+        components are read directly into their own arrays so that the full
+        interleaved results dataset is never copied in memory.
 
-    @sparse.setter
-    def sparse(self, sparse):
-        """Convert tally data from NumPy arrays to SciPy list of lists (LIL)
-        sparse matrices, and vice versa.
+        Parameters
+        ----------
+        filter_indices : Iterable of Integral, optional
+            Indices into the filter axis of the tally's data arrays. If not
+            specified, the results for all filter bins are read.
 
-        This property may be used to reduce the amount of data in memory during
-        tally data processing. The tally data will be stored as SciPy LIL
-        matrices internally within the Tally object. All tally data access
-        properties and methods will return data as a dense NumPy array.
+        Returns
+        -------
+        sum : numpy.ndarray
+            The sum of each realization for each requested filter bin
+            indexed by filter bin, nuclide bin and score bin
+        sum_sq : numpy.ndarray
+            The sum of each realization squared for each requested filter
+            bin indexed by filter bin, nuclide bin and score bin
 
         """
 
-        cv.check_type('sparse', sparse, bool)
+        with h5py.File(self._sp_filename, 'r') as f:
+            dataset = f['tallies/tally {0}/results'.format(self.id)]
 
-        # Convert NumPy arrays to SciPy sparse LIL matrices
-        if sparse and not self.sparse:
-            if self._sum is not None:
-                self._sum = \
-                    sps.lil_matrix(self._sum.flatten(), self._sum.shape)
-            if self._sum_sq is not None:
-                self._sum_sq = \
-                    sps.lil_matrix(self._sum_sq.flatten(), self._sum_sq.shape)
-            if self._mean is not None:
-                self._mean = \
-                    sps.lil_matrix(self._mean.flatten(), self._mean.shape)
-            if self._std_dev is not None:
-                self._std_dev = \
-                    sps.lil_matrix(self._std_dev.flatten(), self._std_dev.shape)
+            if filter_indices is None:
+                rows = np.s_[:]
+                num_rows = dataset.shape[0]
+                order = None
+            else:
+                filter_indices = np.asarray(filter_indices, dtype=int)
+                if filter_indices.size == 0:
+                    shape = (0,) + self.shape[1:]
+                    return np.zeros(shape), np.zeros(shape)
+
+                # HDF5 point selections must be sorted and unique
+                unique, order = np.unique(filter_indices, return_inverse=True)
+                start, stop = unique[0], unique[-1] + 1
+
+                # Read a single contiguous hyperslab when the requested bins
+                # are densely packed since this reads whole chunks at a time,
+                # and fall back to a point selection for scattered bins
+                if stop - start <= 2*unique.size:
+                    rows = np.s_[start:stop]
+                    num_rows = stop - start
+                    order = unique[order] - start
+                else:
+                    rows = unique.tolist()
+                    num_rows = unique.size
 
-            self._sparse = True
+            sum = np.empty((num_rows, dataset.shape[1]))
+            sum_sq = np.empty((num_rows, dataset.shape[1]))
+            if num_rows > 0:
+                dataset.read_direct(sum, np.s_[rows, :, 0])
+                dataset.read_direct(sum_sq, np.s_[rows, :, 1])
 
-        # Convert SciPy sparse LIL matrices to NumPy arrays
-        elif not sparse and self.sparse:
-            if self._sum is not None:
-                self._sum = np.reshape(self._sum.toarray(), self.shape)
-            if self._sum_sq is not None:
-                self._sum_sq = np.reshape(self._sum_sq.toarray(), self.shape)
-            if self._mean is not None:
-                self._mean = np.reshape(self._mean.toarray(), self.shape)
-            if self._std_dev is not None:
-                self._std_dev = np.reshape(self._std_dev.toarray(), self.shape)
-            self._sparse = False
+        # Reshape the results arrays
+        sum = np.reshape(sum, (num_rows,) + self.shape[1:])
+        sum_sq = np.reshape(sum_sq, (num_rows,) + self.shape[1:])
+
+        # Restore the user-requested ordering of the filter bins
+        if order is not None:
+            sum = sum[order]
+            sum_sq = sum_sq[order]
+
+        return sum, sum_sq
 
     def remove_score(self, score):
         """Remove a score from the tally
@@ -1307,64 +2047,30 @@ class Tally(IDManagerMixin):
         cv.check_type('filters', filters, Iterable, openmc.FilterMeta)
         cv.check_type('filter_bins', filter_bins, Iterable, tuple)
 
-        # Determine the score indices from any of the requested scores
+        # Determine the filter indices from any of the requested filters
         if filters:
-            # Initialize empty list of indices for each bin in each Filter
-            filter_indices = []
+            # Flattened indices for all combinations of the filters processed
+            # so far, starting from the single empty combination
+            filter_indices = np.zeros(1, dtype=int)
 
             # Loop over all of the Tally's Filters
-            for i, self_filter in enumerate(self.filters):
-                user_filter = False
+            for self_filter in self.filters:
 
                 # If a user-requested Filter, get the user-requested bins
                 for j, test_filter in enumerate(filters):
                     if type(self_filter) is test_filter:
-                        bins = filter_bins[j]
-                        user_filter = True
+                        filter_found = self.find_filter(test_filter)
+                        indices = filter_found.get_bin_indices(filter_bins[j])
                         break
 
                 # If not a user-requested Filter, get all bins
-                if not user_filter:
-                    # Create list of 2- or 3-tuples tuples for mesh cell bins
-                    if isinstance(self_filter, openmc.MeshFilter):
-                        dimension = self_filter.mesh.dimension
-                        xyz = [range(1, x+1) for x in dimension]
-                        bins = list(itertools.product(*xyz))
-
-                    # Create list of 2-tuples for energy boundary bins
-                    elif isinstance(self_filter, (openmc.EnergyFilter,
-                        openmc.EnergyoutFilter, openmc.MuFilter,
-                        openmc.PolarFilter, openmc.AzimuthalFilter)):
-                        bins = []
-                        for k in range(self_filter.num_bins):
-                            bins.append((self_filter.bins[k], self_filter.bins[k+1]))
-
-                    # Create list of cell instance IDs for distribcell Filters
-                    elif isinstance(self_filter, openmc.DistribcellFilter):
-                        bins = [b for b in range(self_filter.num_bins)]
-
-                    # EnergyFunctionFilters don't have bins so just add a None
-                    elif isinstance(self_filter, openmc.EnergyFunctionFilter):
-                        bins = [None]
-
-                    # Create list of IDs for bins for all other filter types
-                    else:
-                        bins = self_filter.bins
-
-                # Initialize a NumPy array for the Filter bin indices
-                filter_indices.append(np.zeros(len(bins), dtype=np.int))
-
-                # Add indices for each bin in this Filter to the list
-                for j, bin in enumerate(bins):
-                    filter_index = self.get_filter_index(type(self_filter), bin)
-                    filter_indices[i][j] = filter_index
-
-                # Account for stride in each of the previous filters
-                for indices in filter_indices[:i]:
-                    indices *= self_filter.num_bins
+                else:
+                    indices = np.arange(self_filter.num_bins)
 
-            # Apply outer product sum between all filter bin indices
-            filter_indices = list(map(sum, itertools.product(*filter_indices)))
+                # Account for the stride of this filter in the indices of
+                # the previous filters and form the outer sum with its bins
+                filter_indices = (filter_indices[:, np.newaxis] *
+                                  self_filter.num_bins + indices).ravel()
 
         # If user did not specify any specific Filters, use them all
         else:
@@ -1496,12 +2202,22 @@ class Tally(IDManagerMixin):
 
         """
 
+        # Results which have not yet been loaded are sliced from the
+        # statepoint so that only the requested filter bins are read
+        lazy = self._lazy_results
+
+        # Derived tallies whose data have not yet been computed only evaluate
+        # the requested filter bins of their operands
+        pending = (self._operation is not None and
+                   value in ('mean', 'std_dev', 'rel_err'))
+
         # Ensure that the tally has data
-        if (value == 'mean' and self.mean is None) or \
-           (value == 'std_dev' and self.std_dev is None) or \
-           (value == 'rel_err' and self.mean is None) or \
-           (value == 'sum' and self.sum is None) or \
-           (value == 'sum_sq' and self.sum_sq is None):
+        if not lazy and not pending and \
+           ((value == 'mean' and self._get_data('mean') is None) or
+            (value == 'std_dev' and self._get_data('std_dev') is None) or
+            (value == 'rel_err' and self._get_data('mean') is None) or
+            (value == 'sum' and self._get_data('sum') is None) or
+            (value == 'sum_sq' and self._get_data('sum_sq') is None)):
             msg = 'The Tally ID="{0}" has no data to return'.format(self.id)
             raise ValueError(msg)
 
@@ -1510,20 +2226,63 @@ class Tally(IDManagerMixin):
         nuclide_indices = self.get_nuclide_indices(nuclides)
         score_indices = self.get_score_indices(scores)
 
+        if pending:
+            mean, std_dev = self._operation.evaluate(filter_indices)
+            indices = np.ix_(np.arange(len(filter_indices)),
+                             nuclide_indices, score_indices)
+            if value == 'mean':
+                return mean[indices]
+            elif value == 'std_dev':
+                return std_dev[indices]
+            else:
+                return std_dev[indices] / mean[indices]
+
+        if lazy and value in ('mean', 'std_dev', 'rel_err', 'sum', 'sum_sq'):
+            sum, sum_sq = self._read_results(filter_indices)
+            indices = np.ix_(np.arange(len(filter_indices)),
+                             nuclide_indices, score_indices)
+            sum = sum[indices]
+            sum_sq = sum_sq[indices]
+
+            if value == 'sum':
+                return sum
+            elif value == 'sum_sq':
+                return sum_sq
+
+            n = self.num_realizations
+            mean = sum / n
+            if value == 'mean':
+                return mean
+
+            std_dev = _std_dev(mean, sum_sq, n)
+            if value == 'std_dev':
+                return std_dev
+            else:
+                return std_dev / mean
+
         # Construct outer product of all three index types with each other
         indices = np.ix_(filter_indices, nuclide_indices, score_indices)
 
+        # Only the requested bins of sparse data are converted to dense arrays
+        def take(data):
+            if sps.issparse(data):
+                flat_indices = np.ravel_multi_index(indices, self.shape)
+                return _sparse_lookup(data, flat_indices)
+            else:
+                return data[indices]
+
         # Return the desired result from Tally
         if value == 'mean':
-            data = self.mean[indices]
+            data = take(self._get_data('mean'))
         elif value == 'std_dev':
-            data = self.std_dev[indices]
+            data = take(self._get_data('std_dev'))
         elif value == 'rel_err':
-            data = self.std_dev[indices] / self.mean[indices]
+            data = take(self._get_data('std_dev')) / \
+                take(self._get_data('mean'))
         elif value == 'sum':
-            data = self.sum[indices]
+            data = take(self._get_data('sum'))
         elif value == 'sum_sq':
-            data = self.sum_sq[indices]
+            data = take(self._get_data('sum_sq'))
         else:
             msg = 'Unable to return results from Tally ID="{0}" since the ' \
                   'the requested value "{1}" is not \'mean\', \'std_dev\', ' \
@@ -1598,47 +2357,24 @@ class Tally(IDManagerMixin):
                     data_size, paths=paths)
                 df = pd.concat([df, filter_df], axis=1)
 
+        nuclide_column, nuclide_names, score_column, score_names = \
+            self._get_bin_labels()
+
         # Include DataFrame column for nuclides if user requested it
         if nuclides:
-            nuclides = []
-            column_name = 'nuclide'
-
-            for nuclide in self.nuclides:
-                if isinstance(nuclide, openmc.Nuclide):
-                    nuclides.append(nuclide.name)
-                elif isinstance(nuclide, openmc.AggregateNuclide):
-                    nuclides.append(nuclide.name)
-                    column_name = '{0}(nuclide)'.format(nuclide.aggregate_op)
-                else:
-                    nuclides.append(nuclide)
-
             # Tile the nuclide bins into a DataFrame column
-            nuclides = np.repeat(nuclides, len(self.scores))
-            tile_factor = data_size / len(nuclides)
-            df[column_name] = np.tile(nuclides, int(tile_factor))
+            nuclide_names = np.repeat(nuclide_names, len(self.scores))
+            tile_factor = data_size / len(nuclide_names)
+            df[nuclide_column] = np.tile(nuclide_names, int(tile_factor))
 
         # Include column for scores if user requested it
         if scores:
-            scores = []
-            column_name = 'score'
-
-            for score in self.scores:
-                if isinstance(score, string_types + (openmc.CrossScore,)):
-                    scores.append(str(score))
-                elif isinstance(score, openmc.AggregateScore):
-                    scores.append(score.name)
-                    column_name = '{0}(score)'.format(score.aggregate_op)
-
             tile_factor = data_size / len(self.scores)
-            df[column_name] = np.tile(scores, int(tile_factor))
+            df[score_column] = np.tile(score_names, int(tile_factor))
 
         # Include columns for derivatives if user requested it
-        if derivative and (self.derivative is not None):
-            df['d_variable'] = self.derivative.variable
-            if self.derivative.material is not None:
-                df['d_material'] = self.derivative.material
-            if self.derivative.nuclide is not None:
-                df['d_nuclide'] = self.derivative.nuclide
+        if derivative:
+            self._add_derivative_columns(df)
 
         # Append columns with mean, std. dev. for each tally bin
         df['mean'] = self.mean.ravel()
@@ -1648,24 +2384,7 @@ class Tally(IDManagerMixin):
 
         # Expand the columns into Pandas MultiIndices for readability
         if pd.__version__ >= '0.16':
-            columns = copy.deepcopy(df.columns.values)
-
-            # Convert all elements in columns list to tuples
-            for i, column in enumerate(columns):
-                if not isinstance(column, tuple):
-                    columns[i] = (column,)
-
-            # Make each tuple the same length
-            max_len_column = len(max(columns, key=len))
-            for i, column in enumerate(columns):
-                delta_len = max_len_column - len(column)
-                if delta_len > 0:
-                    new_column = list(column)
-                    new_column.extend(['']*delta_len)
-                    columns[i] = tuple(new_column)
-
-            # Create and set a MultiIndex for the DataFrame's columns
-            df.columns = pd.MultiIndex.from_tuples(columns)
+            df.columns = _multiindex_columns(df.columns)
 
         # Modify the df.to_string method so that it prints formatted strings.
         # Credit to http://stackoverflow.com/users/3657742/chrisb for this trick
@@ -1673,6 +2392,327 @@ class Tally(IDManagerMixin):
 
         return df
 
+    def iter_pandas_dataframes(self, chunk_size=1000000, filters=True,
+                               nuclides=True, scores=True, derivative=True,
+                               paths=True, float_format='{:.2e}'):
+        """Build Pandas DataFrames for consecutive blocks of the Tally data.
+
+        This method yields the rows of the DataFrame built by
+        :meth:`Tally.get_pandas_dataframe` in blocks of filter bins, so that
+        tallies with more bins than fit in memory can be processed one block
+        at a time. Every block has the same columns, and the row index of each
+        block continues from the previous one. Results which have not yet been
+        loaded from a statepoint are read one block at a time.
+
+        Parameters
+        ----------
+        chunk_size : Integral
+            Approximate number of rows in each DataFrame. Each block contains
+            all of the nuclide and score bins for a range of filter bins
+            (default is 1000000).
+        filters : bool
+            Include columns with filter bin information (default is True).
+        nuclides : bool
+            Include columns with nuclide bin information (default is True).
+        scores : bool
+            Include columns with score bin information (default is True).
+        derivative : bool
+            Include columns with differential tally info (default is True).
+        paths : bool, optional
+            Construct columns for distribcell tally filters (default is True).
+            The geometric information in the Summary object is embedded into a
+            Multi-index column with a geometric "path" to each distribcell
+            instance.
+        float_format : str
+            All floats in the DataFrames will be formatted using the given
+            format string before printing.
+
+        Yields
+        ------
+        pandas.DataFrame
+            A Pandas DataFrame for a block of filter bins with each column
+            annotated by filter, nuclide and score bin information (if these
+            parameters are True), and the mean and standard deviation of the
+            Tally's data.
+
+        Raises
+        ------
+        KeyError
+            When this method is called before the Tally is populated with data
+
+        See also
+        --------
+        Tally.get_pandas_dataframe(), Tally.export_to_csv(),
+        Tally.export_to_hdf5()
+
+        """
+
+        cv.check_type('chunk_size', chunk_size, Integral)
+        cv.check_greater_than('chunk_size', chunk_size, 0)
+
+        # Ensure that the tally has data
+        if not self._lazy_results and self._operation is None and \
+           (self._get_data('mean') is None or
+            self._get_data('std_dev') is None):
+            msg = 'The Tally ID="{0}" has no data to return'.format(self.id)
+            raise KeyError(msg)
+
+        num_filter_bins = self.num_filter_bins
+        num_nuclides = self.num_nuclides
+        num_scores = self.num_scores
+        stride = num_nuclides * num_scores
+
+        # Build a DataFrame with one row per bin for each filter
+        filter_dfs = []
+        if filters:
+            for self_filter in self.filters:
+                bin_filter = copy.copy(self_filter)
+                bin_filter.stride = 1
+                filter_df = bin_filter.get_pandas_dataframe(
+                    bin_filter.num_bins, paths=paths)
+                filter_dfs.append((self_filter, filter_df))
+
+        # Find the name of each nuclide and score bin
+        nuclide_column, nuclide_names, score_column, score_names = \
+            self._get_bin_labels()
+
+        step = max(1, chunk_size // stride)
+        for start in range(0, num_filter_bins, step):
+            stop = min(start + step, num_filter_bins)
+            rows = np.arange(start*stride, stop*stride)
+
+            df = pd.DataFrame(index=rows)
+
+            # Select the rows of each filter's DataFrame for this block
+            if filters:
+                filter_indices = np.repeat(np.arange(start, stop), stride)
+                for self_filter, filter_df in filter_dfs:
+                    bin_stride = self_filter.stride // stride
+                    bin_indices = filter_indices // bin_stride
+                    bin_indices %= self_filter.num_bins
+                    block_df = filter_df.iloc[bin_indices]
+                    block_df.index = rows
+                    df = pd.concat([df, block_df], axis=1)
+
+            if nuclides:
+                df[nuclide_column] = \
+                    nuclide_names[(rows // num_scores) % num_nuclides]
+
+            if scores:
+                df[score_column] = score_names[rows % num_scores]
+
+            # Include columns for derivatives if user requested it
+            if derivative:
+                self._add_derivative_columns(df)
+
+            # Append columns with mean, std. dev. for each tally bin
+            mean, std_dev = self._get_rows_data(np.arange(start, stop))
+            df['mean'] = mean.ravel()
+            df['std. dev.'] = std_dev.ravel()
+
+            # Expand the columns into Pandas MultiIndices for readability
+            if pd.__version__ >= '0.16':
+                df.columns = _multiindex_columns(df.columns)
+
+            df.to_string = partial(df.to_string,
+                                   float_format=float_format.format)
+
+            yield df
+
+    def _get_bin_labels(self):
+        """Return the DataFrame column names and labels for the nuclide and
+        score bins.
+
+        This is a helper method for :meth:`Tally.get_pandas_dataframe` and
+        :meth:`Tally.iter_pandas_dataframes`, which must build the same
+        columns.
+
+        Returns
+        -------
+        nuclide_column : str
+            Name of the nuclide column
+        nuclide_names : numpy.ndarray
+            Name of each nuclide bin
+        score_column : str
+            Name of the score column
+        score_names : numpy.ndarray
+            Name of each score bin
+
+        """
+
+        nuclide_names = []
+        nuclide_column = 'nuclide'
+        for nuclide in self.nuclides:
+            if isinstance(nuclide, openmc.Nuclide):
+                nuclide_names.append(nuclide.name)
+            elif isinstance(nuclide, openmc.AggregateNuclide):
+                nuclide_names.append(nuclide.name)
+                nuclide_column = '{0}(nuclide)'.format(nuclide.aggregate_op)
+            else:
+                nuclide_names.append(nuclide)
+
+        score_names = []
+        score_column = 'score'
+        for score in self.scores:
+            if isinstance(score, string_types + (openmc.CrossScore,)):
+                score_names.append(str(score))
+            elif isinstance(score, openmc.AggregateScore):
+                score_names.append(score.name)
+                score_column = '{0}(score)'.format(score.aggregate_op)
+
+        return (nuclide_column, np.array(nuclide_names), score_column,
+                np.array(score_names))
+
+    def _add_derivative_columns(self, df):
+        """Add columns describing the tally derivative, if any, to a
+        DataFrame.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            DataFrame of tally data
+
+        """
+
+        if self.derivative is not None:
+            df['d_variable'] = self.derivative.variable
+            if self.derivative.material is not None:
+                df['d_material'] = self.derivative.material
+            if self.derivative.nuclide is not None:
+                df['d_nuclide'] = self.derivative.nuclide
+
+    def _get_rows_data(self, filter_indices):
+        """Return the mean and standard deviation for a set of filter bins.
+
+        Only the requested filter bins are read from the statepoint, converted
+        from sparse matrices or computed from the operands of a derived tally.
+
+        Parameters
+        ----------
+        filter_indices : numpy.ndarray
+            Indices into the filter axis of the tally's data arrays
+
+        Returns
+        -------
+        mean : numpy.ndarray
+            The sample mean for the filter bins indexed by filter bin, nuclide
+            bin and score bin
+        std_dev : numpy.ndarray
+            The sample standard deviation for the filter bins indexed by filter
+            bin, nuclide bin and score bin
+
+        """
+
+        # Compute the data of a derived tally for the filter bins only
+        if self._operation is not None and \
+           (self._mean is None or self._std_dev is None):
+            return self._operation.evaluate(filter_indices)
+
+        # Only read the results for the filter bins from the statepoint
+        if self._lazy_results:
+            sum, sum_sq = self._read_results(filter_indices)
+            mean = sum / self.num_realizations
+            std_dev = _std_dev(mean, sum_sq, self.num_realizations)
+            return mean, std_dev
+
+        shape = (len(filter_indices),) + self.shape[1:]
+        stride = self.num_nuclides * self.num_scores
+        flat_indices = None
+
+        data = []
+        for value in (self._get_data('mean'), self._get_data('std_dev')):
+            if sps.issparse(value):
+                if flat_indices is None:
+                    flat_indices = np.add.outer(filter_indices * stride,
+                                                np.arange(stride))
+                data.append(np.reshape(_sparse_lookup(value, flat_indices),
+                                       shape))
+            else:
+                data.append(value[filter_indices])
+
+        return data[0], data[1]
+
+    def export_to_csv(self, path, chunk_size=1000000, **kwargs):
+        """Write the Tally data to CSV files one block at a time.
+
+        The DataFrame blocks yielded by :meth:`Tally.iter_pandas_dataframes`
+        are written without ever building the full DataFrame. The levels of
+        the Multi-index columns are joined with spaces to form the column
+        names in the header.
+
+        Parameters
+        ----------
+        path : str
+            Path to the CSV file to write. If the path contains a '{}'
+            placeholder, each block is written to its own file (shard) whose
+            path is formed by substituting the block number, starting at 0.
+        chunk_size : Integral
+            Approximate number of rows in each block (default is 1000000).
+        **kwargs
+            Keyword arguments passed to :meth:`Tally.iter_pandas_dataframes`,
+            e.g. to omit the filter, nuclide or score columns.
+
+        Returns
+        -------
+        list of str
+            Paths of the files written
+
+        """
+
+        cv.check_type('path', path, string_types)
+
+        sharded = '{}' in path
+        filenames = []
+        for i, df in enumerate(self.iter_pandas_dataframes(chunk_size,
+                                                           **kwargs)):
+            df.columns = _flatten_columns(df.columns)
+            if sharded:
+                filenames.append(path.format(i))
+                df.to_csv(filenames[-1], index=False)
+            else:
+                if i == 0:
+                    filenames.append(path)
+                df.to_csv(path, mode='w' if i == 0 else 'a',
+                          header=(i == 0), index=False)
+
+        return filenames
+
+    def export_to_hdf5(self, path, key=None, chunk_size=1000000, **kwargs):
+        """Write the Tally data to a table in an HDF5 file one block at a time.
+
+        The DataFrame blocks yielded by :meth:`Tally.iter_pandas_dataframes`
+        are appended to a Pandas HDFStore table, which requires PyTables, so
+        that the data can later be queried or read in blocks with
+        :func:`pandas.read_hdf`. The levels of the Multi-index columns are
+        joined with spaces to form the column names of the table.
+
+        Parameters
+        ----------
+        path : str
+            Path to the HDF5 file to write to
+        key : str, optional
+            Key of the table in the HDF5 file. Defaults to 'tally_<ID>'. An
+            existing table with the same key is replaced.
+        chunk_size : Integral
+            Approximate number of rows in each block (default is 1000000).
+        **kwargs
+            Keyword arguments passed to :meth:`Tally.iter_pandas_dataframes`,
+            e.g. to omit the filter, nuclide or score columns.
+
+        """
+
+        cv.check_type('path', path, string_types)
+        if key is None:
+            key = 'tally_{}'.format(self.id)
+        cv.check_type('key', key, string_types)
+
+        with pd.HDFStore(path) as store:
+            if key in store:
+                store.remove(key)
+            for df in self.iter_pandas_dataframes(chunk_size, **kwargs):
+                df.columns = _flatten_columns(df.columns)
+                store.append(key, df, format='table', index=False)
+
     def get_reshaped_data(self, value='mean'):
         """Returns an array of tally data with one dimension per filter.
 
@@ -1733,6 +2773,18 @@ class Tally(IDManagerMixin):
         performed across scores; else the tensor product is performed. Users
         can also call the method explicitly and specify the desired product.
 
+        The data of the new tally is not computed until it is first needed,
+        at which point it is computed from the data of the two tallies. When
+        the new tally is itself used in tally arithmetic, only the data of the
+        final result is computed and stored. Slicing the new tally with
+        :meth:`Tally.get_values` or :meth:`Tally.get_slice` before its data
+        has been computed only computes the requested filter bins. The data
+        of the two tallies are shared with the new tally copy-on-write:
+        accessing them through :attr:`Tally.mean`, :attr:`Tally.std_dev`,
+        :attr:`Tally.sum` or :attr:`Tally.sum_sq` afterwards returns a private
+        copy, so changing it in place does not affect the new tally, while
+        arrays obtained before the product was taken become read-only.
+
         Parameters
         ----------
         other : openmc.Tally
@@ -1796,7 +2848,7 @@ class Tally(IDManagerMixin):
         cv.check_value('score product', score_product, _PRODUCT_TYPES)
 
         # Check that results have been read
-        if not other.derived and other.sum is None:
+        if not other.derived and other._get_data('sum') is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(other.id)
             raise ValueError(msg)
@@ -1815,71 +2867,34 @@ class Tally(IDManagerMixin):
             new_tally.name = new_name
 
         # Query the mean and std dev so the tally data is read in from file
-        # if it has not already been read in.
-        self.mean, self.std_dev, other.mean, other.std_dev
+        # if it has not already been read in. The data of derived operands
+        # which have not yet been computed are evaluated with the new tally.
+        for tally in (self, other):
+            if tally._operation is None:
+                tally._get_data('mean'), tally._get_data('std_dev')
 
-        # Create copies of self and other tallies to rearrange for tally
-        # arithmetic
-        self_copy = copy.deepcopy(self)
-        other_copy = copy.deepcopy(other)
-
-        self_copy.sparse = False
-        other_copy.sparse = False
-
-        # Align the tally data based on desired hybrid product
-        data = self_copy._align_tally_data(other_copy, filter_product,
-                                           nuclide_product, score_product)
-
-        # Perform tally arithmetic operation
-        if binary_op == '+':
-            new_tally._mean = data['self']['mean'] + data['other']['mean']
-            new_tally._std_dev = np.sqrt(data['self']['std. dev.']**2 +
-                                         data['other']['std. dev.']**2)
-        elif binary_op == '-':
-            new_tally._mean = data['self']['mean'] - data['other']['mean']
-            new_tally._std_dev = np.sqrt(data['self']['std. dev.']**2 +
-                                         data['other']['std. dev.']**2)
-        elif binary_op == '*':
-            self_rel_err = data['self']['std. dev.'] / data['self']['mean']
-            other_rel_err = data['other']['std. dev.'] / data['other']['mean']
-            new_tally._mean = data['self']['mean'] * data['other']['mean']
-            new_tally._std_dev = np.abs(new_tally.mean) * \
-                                 np.sqrt(self_rel_err**2 + other_rel_err**2)
-        elif binary_op == '/':
-            self_rel_err = data['self']['std. dev.'] / data['self']['mean']
-            other_rel_err = data['other']['std. dev.'] / data['other']['mean']
-            new_tally._mean = data['self']['mean'] / data['other']['mean']
-            new_tally._std_dev = np.abs(new_tally.mean) * \
-                                 np.sqrt(self_rel_err**2 + other_rel_err**2)
-        elif binary_op == '^':
-            mean_ratio = data['other']['mean'] / data['self']['mean']
-            first_term = mean_ratio * data['self']['std. dev.']
-            second_term = \
-                np.log(data['self']['mean']) * data['other']['std. dev.']
-            new_tally._mean = data['self']['mean'] ** data['other']['mean']
-            new_tally._std_dev = np.abs(new_tally.mean) * \
-                                 np.sqrt(first_term**2 + second_term**2)
+        # Align the filter, nuclide and score bins based on desired product
+        bins = self._align_tally_bins(other, filter_product, nuclide_product,
+                                      score_product)
 
-        # Convert any infs and nans to zero
-        new_tally._mean[np.isinf(new_tally._mean)] = 0
-        new_tally._mean = np.nan_to_num(new_tally._mean)
-        new_tally._std_dev[np.isinf(new_tally._std_dev)] = 0
-        new_tally._std_dev = np.nan_to_num(new_tally._std_dev)
+        # Record the operation so that the tally data is only computed when
+        # it is first needed
+        new_tally._operation = _TallyOperation(binary_op, self, other, bins)
 
         # Set tally attributes
-        if self_copy.estimator == other_copy.estimator:
-            new_tally.estimator = self_copy.estimator
-        if self_copy.with_summary and other_copy.with_summary:
-            new_tally.with_summary = self_copy.with_summary
-        if self_copy.num_realizations == other_copy.num_realizations:
-            new_tally.num_realizations = self_copy.num_realizations
+        if self.estimator == other.estimator:
+            new_tally.estimator = self.estimator
+        if self.with_summary and other.with_summary:
+            new_tally.with_summary = self.with_summary
+        if self.num_realizations == other.num_realizations:
+            new_tally.num_realizations = self.num_realizations
 
         # Add filters to the new tally
         if filter_product == 'entrywise':
-            for self_filter in self_copy.filters:
+            for self_filter in bins['self']['filters']:
                 new_tally.filters.append(self_filter)
         else:
-            all_filters = [self_copy.filters, other_copy.filters]
+            all_filters = [bins['self']['filters'], bins['other']['filters']]
             for self_filter, other_filter in itertools.product(*all_filters):
                 new_filter = openmc.CrossFilter(self_filter, other_filter,
                                                 binary_op)
@@ -1887,10 +2902,11 @@ class Tally(IDManagerMixin):
 
         # Add nuclides to the new tally
         if nuclide_product == 'entrywise':
-            for self_nuclide in self_copy.nuclides:
+            for self_nuclide in bins['self']['nuclides']:
                 new_tally.nuclides.append(self_nuclide)
         else:
-            all_nuclides = [self_copy.nuclides, other_copy.nuclides]
+            all_nuclides = [bins['self']['nuclides'],
+                            bins['other']['nuclides']]
             for self_nuclide, other_nuclide in itertools.product(*all_nuclides):
                 new_nuclide = \
                     openmc.CrossNuclide(self_nuclide, other_nuclide, binary_op)
@@ -1898,10 +2914,10 @@ class Tally(IDManagerMixin):
 
         # Add scores to the new tally
         if score_product == 'entrywise':
-            for self_score in self_copy.scores:
+            for self_score in bins['self']['scores']:
                 new_tally.scores.append(self_score)
         else:
-            all_scores = [self_copy.scores, other_copy.scores]
+            all_scores = [bins['self']['scores'], bins['other']['scores']]
             for self_score, other_score in itertools.product(*all_scores):
                 new_score = openmc.CrossScore(self_score, other_score,
                                               binary_op)
@@ -1912,6 +2928,46 @@ class Tally(IDManagerMixin):
 
         return new_tally
 
+    def _lazy_operation(self, binary_op, scalar=None):
+        """Build a derived tally for an operation with a scalar value whose
+        data is only computed when it is first needed.
+
+        This is a helper method for the tally arithmetic operator overloaded
+        methods, which is used when this tally is itself a derived tally whose
+        data have not yet been computed so that its data is never stored.
+
+        Parameters
+        ----------
+        binary_op : {'+', '-', '*', '/', '^', 'abs'}
+            The operation to perform with the scalar value
+        scalar : Real or None
+            The scalar value on the right hand side of the operation
+
+        Returns
+        -------
+        openmc.Tally
+            A new derived tally for the operation
+
+        """
+
+        new_tally = Tally(name='derived')
+        new_tally._derived = True
+        new_tally.with_batch_statistics = True
+        new_tally.name = self.name
+        new_tally.estimator = self.estimator
+        new_tally.with_summary = self.with_summary
+        new_tally.num_realizations = self.num_realizations
+
+        new_tally.filters = copy.deepcopy(self.filters)
+        new_tally.nuclides = copy.deepcopy(self.nuclides)
+        new_tally.scores = copy.deepcopy(self.scores)
+
+        new_tally._operation = _TallyOperation(binary_op, self, scalar)
+
+        # If this tally operand is sparse, sparsify the new tally
+        new_tally.sparse = self.sparse
+        return new_tally
+
     def _update_filter_strides(self):
         """Update each filter's stride based on the tally's nuclides and scores
         for derived tallies created by tally arithmetic.
@@ -1922,18 +2978,21 @@ class Tally(IDManagerMixin):
             self_filter.stride = stride
             stride *= self_filter.num_bins
 
-    def _align_tally_data(self, other, filter_product, nuclide_product,
+    def _align_tally_bins(self, other, filter_product, nuclide_product,
                           score_product):
-        """Aligns data from two tallies for tally arithmetic.
-
-        This is a helper method to construct a dict of dicts of the "aligned"
-        data arrays from each tally for tally arithmetic. The method analyzes
-        the filters, scores and nuclides in both tallies and determines how to
-        appropriately align the data for vectorized arithmetic. For example,
-        if the two tallies have different filters, this method will use NumPy
-        'tile' and 'repeat' operations to the new data arrays such that all
-        possible combinations of the data in each tally's bins will be made
-        when the arithmetic operation is applied to the arrays.
+        """Aligns the bins of two tallies for tally arithmetic.
+
+        This is a helper method to construct a dict of dicts describing how
+        the data from each tally is "aligned" for tally arithmetic. The method
+        analyzes the filters, scores and nuclides in both tallies and
+        determines which bin of each tally's data corresponds to each bin of
+        the derived tally, such that all possible combinations of the data in
+        each tally's bins are made when the arithmetic operation is applied to
+        the aligned data. Tensor products are performed by broadcasting rather
+        than by repeating and tiling the data, so that only the data of the
+        derived tally is allocated. Filters, nuclides and scores which are
+        missing from one tally are added to it with data set to zero (nuclides
+        and scores) or repeated for each bin (filters).
 
         Parameters
         ----------
@@ -1952,137 +3011,88 @@ class Tally(IDManagerMixin):
         Returns
         -------
         dict
-            A dictionary of dictionaries to "aligned" 'mean' and 'std. dev'
-            NumPy arrays for each tally's data.
+            A dictionary of dictionaries for each tally with the aligned
+            'filters', 'nuclides' and 'scores', and the 'filter positions' of
+            each of the tally's filters in the aligned filters, and the
+            'nuclide indices' and 'score indices' into the tally's data for
+            each aligned bin (None if the data is already aligned, or -1 for
+            bins missing from the tally). The 'nuclide shape' and 'score
+            shape' give the shape of the two axes each of the tally's nuclide
+            and score axes are reshaped to such that the data broadcast
+            against each other, with a length of one along the other tally's
+            axis for tensor products.
 
         """
 
-        # Get the set of filters that each tally is missing
-        other_missing_filters = \
-            set(self.filters).difference(set(other.filters))
+        bins = {'self': {}, 'other': {}}
+
+        # Add filters present in other but not in self to the self filters
         self_missing_filters = \
             set(other.filters).difference(set(self.filters))
+        filters = copy.deepcopy(self.filters)
+        filters.extend(copy.deepcopy(list(self_missing_filters)))
 
-        # Add filters present in self but not in other to other
-        for other_filter in other_missing_filters:
-            filter_copy = copy.deepcopy(other_filter)
-            other._mean = np.repeat(other.mean, filter_copy.num_bins, axis=0)
-            other._std_dev = np.repeat(other.std_dev, filter_copy.num_bins, axis=0)
-            other.filters.append(filter_copy)
-
-        # Add filters present in other but not in self to self
-        for self_filter in self_missing_filters:
-            filter_copy = copy.deepcopy(self_filter)
-            self._mean = np.repeat(self.mean, filter_copy.num_bins, axis=0)
-            self._std_dev = np.repeat(self.std_dev, filter_copy.num_bins, axis=0)
-            self.filters.append(filter_copy)
-
-        # Align other filters with self filters
-        for i, self_filter in enumerate(self.filters):
-            other_index = other.filters.index(self_filter)
-
-            # If necessary, swap other filter
-            if other_index != i:
-                other._swap_filters(self_filter, other.filters[i])
-
-        # Repeat and tile the data by nuclide in preparation for performing
-        # the tensor product across nuclides.
+        bins['self']['filters'] = filters
+        bins['other']['filters'] = filters
+        bins['self']['filter positions'] = tuple(range(self.num_filters))
+        bins['other']['filter positions'] = tuple(
+            filters.index(other_filter) for other_filter in other.filters)
+
+        # Broadcast the data across a separate axis for each tally's nuclides
+        # in preparation for performing the tensor product across nuclides.
         if nuclide_product == 'tensor':
-            self._mean = \
-                np.repeat(self.mean, other.num_nuclides, axis=1)
-            self._std_dev = \
-                np.repeat(self.std_dev, other.num_nuclides, axis=1)
-            other._mean = \
-                np.tile(other.mean, (1, self.num_nuclides, 1))
-            other._std_dev = \
-                np.tile(other.std_dev, (1, self.num_nuclides, 1))
+            bins['self']['nuclides'] = copy.deepcopy(self.nuclides)
+            bins['other']['nuclides'] = copy.deepcopy(other.nuclides)
+            bins['self']['nuclide indices'] = None
+            bins['other']['nuclide indices'] = None
+            bins['self']['nuclide shape'] = (self.num_nuclides, 1)
+            bins['other']['nuclide shape'] = (1, other.num_nuclides)
 
         # Add nuclides to each tally such that each tally contains the complete
         # set of nuclides necessary to perform an entrywise product. New
         # nuclides added to a tally will have all their scores set to zero.
         else:
-
-            # Get the set of nuclides that each tally is missing
-            other_missing_nuclides = \
-                set(self.nuclides).difference(set(other.nuclides))
             self_missing_nuclides = \
                 set(other.nuclides).difference(set(self.nuclides))
-
-            # Add nuclides present in self but not in other to other
-            for nuclide in other_missing_nuclides:
-                other._mean = \
-                    np.insert(other.mean, other.num_nuclides, 0, axis=1)
-                other._std_dev = \
-                    np.insert(other.std_dev, other.num_nuclides, 0, axis=1)
-                other.nuclides.append(nuclide)
-
-            # Add nuclides present in other but not in self to self
-            for nuclide in self_missing_nuclides:
-                self._mean = \
-                    np.insert(self.mean, self.num_nuclides, 0, axis=1)
-                self._std_dev = \
-                    np.insert(self.std_dev, self.num_nuclides, 0, axis=1)
-                self.nuclides.append(nuclide)
-
-            # Align other nuclides with self nuclides
-            for i, nuclide in enumerate(self.nuclides):
-                other_index = other.get_nuclide_index(nuclide)
-
-                # If necessary, swap other nuclide
-                if other_index != i:
-                    other._swap_nuclides(nuclide, other.nuclides[i])
-
-        # Repeat and tile the data by score in preparation for performing
-        # the tensor product across scores.
+            nuclides = copy.deepcopy(self.nuclides)
+            nuclides.extend(copy.deepcopy(list(self_missing_nuclides)))
+
+            bins['self']['nuclides'] = nuclides
+            bins['other']['nuclides'] = nuclides
+            bins['self']['nuclide indices'] = \
+                _bin_indices(self.nuclides, nuclides)
+            bins['other']['nuclide indices'] = \
+                _bin_indices(other.nuclides, nuclides)
+            bins['self']['nuclide shape'] = (len(nuclides), 1)
+            bins['other']['nuclide shape'] = (len(nuclides), 1)
+
+        # Broadcast the data across a separate axis for each tally's scores
+        # in preparation for performing the tensor product across scores.
         if score_product == 'tensor':
-            self._mean = np.repeat(self.mean, other.num_scores, axis=2)
-            self._std_dev = np.repeat(self.std_dev, other.num_scores, axis=2)
-            other._mean = np.tile(other.mean, (1, 1, self.num_scores))
-            other._std_dev = np.tile(other.std_dev, (1, 1, self.num_scores))
+            bins['self']['scores'] = copy.deepcopy(self.scores)
+            bins['other']['scores'] = copy.deepcopy(other.scores)
+            bins['self']['score indices'] = None
+            bins['other']['score indices'] = None
+            bins['self']['score shape'] = (self.num_scores, 1)
+            bins['other']['score shape'] = (1, other.num_scores)
 
         # Add scores to each tally such that each tally contains the complete set
         # of scores necessary to perform an entrywise product. New scores added
         # to a tally will be set to zero.
         else:
-
-            # Get the set of scores that each tally is missing
-            other_missing_scores = \
-                set(self.scores).difference(set(other.scores))
             self_missing_scores = \
                 set(other.scores).difference(set(self.scores))
+            scores = copy.deepcopy(self.scores)
+            scores.extend(copy.deepcopy(list(self_missing_scores)))
 
-            # Add scores present in self but not in other to other
-            for score in other_missing_scores:
-                other._mean = np.insert(other.mean, other.num_scores, 0, axis=2)
-                other._std_dev = np.insert(other.std_dev, other.num_scores, 0, axis=2)
-                other.scores.append(score)
-
-            # Add scores present in other but not in self to self
-            for score in self_missing_scores:
-                self._mean = np.insert(self.mean, self.num_scores, 0, axis=2)
-                self._std_dev = np.insert(self.std_dev, self.num_scores, 0, axis=2)
-                self.scores.append(score)
-
-            # Align other scores with self scores
-            for i, score in enumerate(self.scores):
-                other_index = other.scores.index(score)
+            bins['self']['scores'] = scores
+            bins['other']['scores'] = scores
+            bins['self']['score indices'] = _bin_indices(self.scores, scores)
+            bins['other']['score indices'] = _bin_indices(other.scores, scores)
+            bins['self']['score shape'] = (len(scores), 1)
+            bins['other']['score shape'] = (len(scores), 1)
 
-                # If necessary, swap other score
-                if other_index != i:
-                    other._swap_scores(score, other.scores[i])
-
-        # Update the tallies' filter strides
-        other._update_filter_strides()
-        self._update_filter_strides()
-
-        data = {}
-        data['self'] = {}
-        data['other'] = {}
-        data['self']['mean'] = self.mean
-        data['other']['mean'] = other.mean
-        data['self']['std. dev.'] = self.std_dev
-        data['other']['std. dev.'] = other.std_dev
-        return data
+        return bins
 
     def _swap_filters(self, filter1, filter2):
         """Reverse the ordering of two filters in this tally
@@ -2197,7 +3207,7 @@ class Tally(IDManagerMixin):
         """
 
         # Check that results have been read
-        if not self.derived and self.sum is None:
+        if not self.derived and self._get_data('sum') is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2264,7 +3274,7 @@ class Tally(IDManagerMixin):
         """
 
         # Check that results have been read
-        if not self.derived and self.sum is None:
+        if not self.derived and self._get_data('sum') is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2348,7 +3358,7 @@ class Tally(IDManagerMixin):
         """
 
         # Check that results have been read
-        if not self.derived and self.sum is None:
+        if not self.derived and self._get_data('sum') is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2360,6 +3370,11 @@ class Tally(IDManagerMixin):
             if self.sparse and other.sparse:
                 new_tally.sparse = True
 
+        # Derived tallies whose data have not been computed are combined
+        # lazily with the scalar value
+        elif isinstance(other, Real) and self._operation is not None:
+            new_tally = self._lazy_operation('+', other)
+
         elif isinstance(other, Real):
             new_tally = Tally(name='derived')
             new_tally._derived = True
@@ -2367,6 +3382,7 @@ class Tally(IDManagerMixin):
             new_tally.name = self.name
             new_tally._mean = self.mean + other
             new_tally._std_dev = self.std_dev
+            new_tally._exposed.add('std_dev')
             new_tally.estimator = self.estimator
             new_tally.with_summary = self.with_summary
             new_tally.num_realizations = self.num_realizations
@@ -2420,7 +3436,7 @@ class Tally(IDManagerMixin):
         """
 
         # Check that results have been read
-        if not self.derived and self.sum is None:
+        if not self.derived and self._get_data('sum') is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2432,12 +3448,18 @@ class Tally(IDManagerMixin):
             if self.sparse and other.sparse:
                 new_tally.sparse = True
 
+        # Derived tallies whose data have not been computed are combined
+        # lazily with the scalar value
+        elif isinstance(other, Real) and self._operation is not None:
+            new_tally = self._lazy_operation('-', other)
+
         elif isinstance(other, Real):
             new_tally = Tally(name='derived')
             new_tally._derived = True
             new_tally.name = self.name
             new_tally._mean = self.mean - other
             new_tally._std_dev = self.std_dev
+            new_tally._exposed.add('std_dev')
             new_tally.estimator = self.estimator
             new_tally.with_summary = self.with_summary
             new_tally.num_realizations = self.num_realizations
@@ -2492,7 +3514,7 @@ class Tally(IDManagerMixin):
         """
 
         # Check that results have been read
-        if not self.derived and self.sum is None:
+        if not self.derived and self._get_data('sum') is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2504,12 +3526,19 @@ class Tally(IDManagerMixin):
             if self.sparse and other.sparse:
                 new_tally.sparse = True
 
+        # Derived tallies whose data have not been computed are combined
+        # lazily with the scalar value
+        elif isinstance(other, Real) and self._operation is not None:
+            new_tally = self._lazy_operation('*', other)
+
         elif isinstance(other, Real):
             new_tally = Tally(name='derived')
             new_tally._derived = True
             new_tally.name = self.name
-            new_tally._mean = self.mean * other
-            new_tally._std_dev = self.std_dev * np.abs(other)
+            new_tally._mean = _elementwise(lambda x: x * other,
+                                           self._get_data('mean'))
+            new_tally._std_dev = _elementwise(lambda x: x * np.abs(other),
+                                              self._get_data('std_dev'))
             new_tally.estimator = self.estimator
             new_tally.with_summary = self.with_summary
             new_tally.num_realizations = self.num_realizations
@@ -2564,7 +3593,7 @@ class Tally(IDManagerMixin):
         """
 
         # Check that results have been read
-        if not self.derived and self.sum is None:
+        if not self.derived and self._get_data('sum') is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2576,12 +3605,19 @@ class Tally(IDManagerMixin):
             if self.sparse and other.sparse:
                 new_tally.sparse = True
 
+        # Derived tallies whose data have not been computed are combined
+        # lazily with the scalar value
+        elif isinstance(other, Real) and self._operation is not None:
+            new_tally = self._lazy_operation('/', other)
+
         elif isinstance(other, Real):
             new_tally = Tally(name='derived')
             new_tally._derived = True
             new_tally.name = self.name
-            new_tally._mean = self.mean / other
-            new_tally._std_dev = self.std_dev * np.abs(1. / other)
+            new_tally._mean = _elementwise(lambda x: x / other,
+                                           self._get_data('mean'))
+            new_tally._std_dev = _elementwise(lambda x: x * np.abs(1. / other),
+                                              self._get_data('std_dev'))
             new_tally.estimator = self.estimator
             new_tally.with_summary = self.with_summary
             new_tally.num_realizations = self.num_realizations
@@ -2639,7 +3675,7 @@ class Tally(IDManagerMixin):
         """
 
         # Check that results have been read
-        if not self.derived and self.sum is None:
+        if not self.derived and self._get_data('sum') is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2651,11 +3687,16 @@ class Tally(IDManagerMixin):
             if self.sparse:
                 new_tally.sparse = True
 
+        # Derived tallies whose data have not been computed are combined
+        # lazily with the scalar value
+        elif isinstance(power, Real) and self._operation is not None:
+            new_tally = self._lazy_operation('^', power)
+
         elif isinstance(power, Real):
             new_tally = Tally(name='derived')
             new_tally._derived = True
             new_tally.name = self.name
-            new_tally._mean = self._mean ** power
+            new_tally._mean = self.mean ** power
             self_rel_err = self.std_dev / self.mean
             new_tally._std_dev = np.abs(new_tally._mean * power * self_rel_err)
             new_tally.estimator = self.estimator
@@ -2762,8 +3803,13 @@ class Tally(IDManagerMixin):
 
         """
 
+        # Derived tallies whose data have not been computed are evaluated
+        # lazily
+        if self._operation is not None:
+            return self._lazy_operation('abs')
+
         new_tally = copy.deepcopy(self)
-        new_tally._mean = np.abs(new_tally.mean)
+        new_tally._mean = abs(new_tally._get_data('mean'))
         return new_tally
 
     def __neg__(self):
@@ -2825,7 +3871,7 @@ class Tally(IDManagerMixin):
         """
 
         # Ensure that the tally has data
-        if not self.derived and self.sum is None:
+        if not self.derived and not self._sp_filename:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2837,24 +3883,58 @@ class Tally(IDManagerMixin):
         # Differentiate Tally with a new auto-generated Tally ID
         new_tally.id = None
 
-        new_tally.sparse = False
-
-        if not self.derived and self.sum is not None:
+        # The sliced data is assigned as dense arrays below, so the copied
+        # sparse data is discarded rather than converted to dense arrays
+        if self.sparse:
+            new_tally._sum = None
+            new_tally._sum_sq = \
+                self._dense(new_tally._sum_sq) if self.derived else None
+            new_tally._mean = None
+            new_tally._std_dev = None
+            new_tally._sparse = False
+
+        # If the results have not been loaded, only read the sliced bins
+        # from the statepoint and derive the batch statistics from them
+        if self._lazy_results:
             new_sum = self.get_values(scores, filters, filter_bins,
                                       nuclides, 'sum')
-            new_tally.sum = new_sum
-        if not self.derived and self.sum_sq is not None:
             new_sum_sq = self.get_values(scores, filters, filter_bins,
                                          nuclides, 'sum_sq')
+            new_tally.sum = new_sum
             new_tally.sum_sq = new_sum_sq
-        if self.mean is not None:
-            new_mean = self.get_values(scores, filters, filter_bins,
-                                       nuclides, 'mean')
-            new_tally._mean = new_mean
-        if self.std_dev is not None:
-            new_std_dev = self.get_values(scores, filters, filter_bins,
-                                          nuclides, 'std_dev')
-            new_tally._std_dev = new_std_dev
+            new_tally._mean = new_sum / self.num_realizations
+            new_tally._std_dev = _std_dev(new_tally._mean, new_sum_sq,
+                                          self.num_realizations)
+
+        # If the data of a derived tally have not been computed, only
+        # evaluate the sliced filter bins
+        elif self._operation is not None:
+            filter_indices = self.get_filter_indices(filters, filter_bins)
+            mean, std_dev = self._operation.evaluate(filter_indices)
+            indices = np.ix_(np.arange(len(filter_indices)),
+                             self.get_nuclide_indices(nuclides),
+                             self.get_score_indices(scores))
+            new_tally._operation = None
+            new_tally._mean = mean[indices]
+            new_tally._std_dev = std_dev[indices]
+
+        else:
+            if not self.derived and self._get_data('sum') is not None:
+                new_sum = self.get_values(scores, filters, filter_bins,
+                                          nuclides, 'sum')
+                new_tally.sum = new_sum
+            if not self.derived and self._get_data('sum_sq') is not None:
+                new_sum_sq = self.get_values(scores, filters, filter_bins,
+                                             nuclides, 'sum_sq')
+                new_tally.sum_sq = new_sum_sq
+            if self._get_data('mean') is not None:
+                new_mean = self.get_values(scores, filters, filter_bins,
+                                           nuclides, 'mean')
+                new_tally._mean = new_mean
+            if self._get_data('std_dev') is not None:
+                new_std_dev = self.get_values(scores, filters, filter_bins,
+                                              nuclides, 'std_dev')
+                new_tally._std_dev = new_std_dev
 
         # SCORES
         if scores:
@@ -2969,9 +4049,18 @@ class Tally(IDManagerMixin):
         tally_sum._sp_filename = self._sp_filename
         tally_sum._results_read = self._results_read
 
+        # Sparse data is summed without converting it to dense arrays. The
+        # variance is summed and the standard deviation is taken at the end.
+        if self.sparse:
+            shape = tuple(f.num_bins for f in self.filters)
+            shape += (self.num_nuclides, self.num_scores)
+            mean = _to_sparse(self._get_data('mean'))
+            variance = _to_sparse(self._get_data('std_dev')).power(2)
+
         # Get tally data arrays reshaped with one dimension per filter
-        mean = self.get_reshaped_data(value='mean')
-        std_dev = self.get_reshaped_data(value='std_dev')
+        else:
+            mean = self.get_reshaped_data(value='mean')
+            std_dev = self.get_reshaped_data(value='std_dev')
 
         # Sum across any filter bins specified by the user
         if isinstance(filter_type, openmc.FilterMeta):
@@ -2992,25 +4081,30 @@ class Tally(IDManagerMixin):
 
             # Only sum across bins specified by the user
             else:
-                bin_indices = \
-                    [find_filter.get_bin_index(bin) for bin in filter_bins]
+                bin_indices = find_filter.get_bin_indices(filter_bins)
 
             # Sum across the bins in the user-specified filter
             for i, self_filter in enumerate(self.filters):
                 if isinstance(self_filter, filter_type):
-                    shape = mean.shape
-                    mean = np.take(mean, indices=bin_indices, axis=i)
-                    std_dev = np.take(std_dev, indices=bin_indices, axis=i)
+                    if self.sparse:
+                        mean, _ = _sparse_sum(mean, shape, i, bin_indices)
+                        variance, shape = \
+                            _sparse_sum(variance, shape, i, bin_indices)
 
-                    # NumPy take introduces a new dimension in output array
-                    # for some special cases that must be removed
-                    if len(mean.shape) > len(shape):
-                        mean = np.squeeze(mean, axis=i)
-                        std_dev = np.squeeze(std_dev, axis=i)
+                    else:
+                        shape = mean.shape
+                        mean = np.take(mean, indices=bin_indices, axis=i)
+                        std_dev = np.take(std_dev, indices=bin_indices, axis=i)
 
-                    mean = np.sum(mean, axis=i, keepdims=True)
-                    std_dev = np.sum(std_dev**2, axis=i, keepdims=True)
-                    std_dev = np.sqrt(std_dev)
+                        # NumPy take introduces a new dimension in output
+                        # array for some special cases that must be removed
+                        if len(mean.shape) > len(shape):
+                            mean = np.squeeze(mean, axis=i)
+                            std_dev = np.squeeze(std_dev, axis=i)
+
+                        mean = np.sum(mean, axis=i, keepdims=True)
+                        std_dev = np.sum(std_dev**2, axis=i, keepdims=True)
+                        std_dev = np.sqrt(std_dev)
 
                     # Add AggregateFilter to the tally sum
                     if not remove_filter:
@@ -3030,11 +4124,17 @@ class Tally(IDManagerMixin):
         if len(nuclides) != 0:
             nuclide_bins = [self.get_nuclide_index(nuclide) for nuclide in nuclides]
             axis_index = self.num_filters
-            mean = np.take(mean, indices=nuclide_bins, axis=axis_index)
-            std_dev = np.take(std_dev, indices=nuclide_bins, axis=axis_index)
-            mean = np.sum(mean, axis=axis_index, keepdims=True)
-            std_dev = np.sum(std_dev**2, axis=axis_index, keepdims=True)
-            std_dev = np.sqrt(std_dev)
+            if self.sparse:
+                mean, _ = _sparse_sum(mean, shape, axis_index, nuclide_bins)
+                variance, shape = \
+                    _sparse_sum(variance, shape, axis_index, nuclide_bins)
+            else:
+                mean = np.take(mean, indices=nuclide_bins, axis=axis_index)
+                std_dev = np.take(std_dev, indices=nuclide_bins,
+                                  axis=axis_index)
+                mean = np.sum(mean, axis=axis_index, keepdims=True)
+                std_dev = np.sum(std_dev**2, axis=axis_index, keepdims=True)
+                std_dev = np.sqrt(std_dev)
 
             # Add AggregateNuclide to the tally sum
             nuclide_sum = openmc.AggregateNuclide(nuclides, 'sum')
@@ -3048,11 +4148,17 @@ class Tally(IDManagerMixin):
         if len(scores) != 0:
             score_bins = [self.get_score_index(score) for score in scores]
             axis_index = self.num_filters + 1
-            mean = np.take(mean, indices=score_bins, axis=axis_index)
-            std_dev = np.take(std_dev, indices=score_bins, axis=axis_index)
-            mean = np.sum(mean, axis=axis_index, keepdims=True)
-            std_dev = np.sum(std_dev**2, axis=axis_index, keepdims=True)
-            std_dev = np.sqrt(std_dev)
+            if self.sparse:
+                mean, _ = _sparse_sum(mean, shape, axis_index, score_bins)
+                variance, shape = \
+                    _sparse_sum(variance, shape, axis_index, score_bins)
+            else:
+                mean = np.take(mean, indices=score_bins, axis=axis_index)
+                std_dev = np.take(std_dev, indices=score_bins,
+                                  axis=axis_index)
+                mean = np.sum(mean, axis=axis_index, keepdims=True)
+                std_dev = np.sum(std_dev**2, axis=axis_index, keepdims=True)
+                std_dev = np.sqrt(std_dev)
 
             # Add AggregateScore to the tally sum
             score_sum = openmc.AggregateScore(scores, 'sum')
@@ -3066,8 +4172,11 @@ class Tally(IDManagerMixin):
         tally_sum._update_filter_strides()
 
         # Reshape condensed data arrays with one dimension for all filters
-        mean = np.reshape(mean, tally_sum.shape)
-        std_dev = np.reshape(std_dev, tally_sum.shape)
+        if self.sparse:
+            std_dev = variance.sqrt()
+        else:
+            mean = np.reshape(mean, tally_sum.shape)
+            std_dev = np.reshape(std_dev, tally_sum.shape)
 
         # Assign tally sum's data with the new arrays
         tally_sum._mean = mean
@@ -3149,8 +4258,7 @@ class Tally(IDManagerMixin):
 
             # Only average across bins specified by the user
             else:
-                bin_indices = \
-                    [find_filter.get_bin_index(bin) for bin in filter_bins]
+                bin_indices = find_filter.get_bin_indices(filter_bins)
 
             # Average across the bins in the user-specified filter
             for i, self_filter in enumerate(self.filters):
@@ -2,6 +2,7 @@ from __future__ import division
 from collections import OrderedDict, Iterable
 from copy import copy, deepcopy
 from numbers import Integral, Real
+import multiprocessing
 import random
 import sys
 
@@ -12,6 +13,15 @@ import openmc
 import openmc.checkvalue as cv
 from openmc.plots import _SVG_COLORS
 from openmc.mixin import IDManagerMixin
+from openmc.region import Region, _RegionVersions
+
+
+# Approximate number of pixels classified at once by Universe.plot
+_PLOT_TILE_SIZE = 2**16
+
+# Universe plotted and lattice tables computed by each worker process
+_plot_universe = None
+_plot_memo = None
 
 
 class Universe(IDManagerMixin):
@@ -49,6 +59,9 @@ class Universe(IDManagerMixin):
     next_id = 1
     used_ids = set()
 
+    # Number of times the cells of the universe have been changed
+    _version = 0
+
     def __init__(self, universe_id=None, name='', cells=None):
         # Initialize Cell class attributes
         self.id = universe_id
@@ -59,6 +72,7 @@ class Universe(IDManagerMixin):
         # Keys     - Cell IDs
         # Values - Cells
         self._cells = OrderedDict()
+        self._search_grid = None
 
         if cells is not None:
             self.add_cells(cells)
@@ -109,7 +123,7 @@ class Universe(IDManagerMixin):
             return openmc.Union(regions).bounding_box
         else:
             # Infinite bounding box
-            return openmc.Intersection().bounding_box
+            return openmc.Intersection([]).bounding_box
 
     @name.setter
     def name(self, name):
@@ -188,7 +202,12 @@ class Universe(IDManagerMixin):
 
         """
         p = np.asarray(point)
-        for cell in self._cells.values():
+        grid = self._current_search_grid()
+        if grid is None:
+            cells = self._cells.values()
+        else:
+            cells = grid.cells_in_bin(grid.find_bins(p[np.newaxis])[0])
+        for cell in cells:
             if p in cell:
                 if cell.fill_type in ('material', 'distribmat', 'void'):
                     return [self, cell]
@@ -202,11 +221,294 @@ class Universe(IDManagerMixin):
                     return [self, cell] + cell.fill.find(p)
         return []
 
+    def build_search_grid(self, shape=None):
+        """Build a uniform grid of candidate cells to speed up finding cells.
+
+        The bounding box of each cell is used to determine which grid bins
+        the cell overlaps. Once the grid has been built, :meth:`Universe.find`,
+        :meth:`Universe.find_many`, and :meth:`Universe.plot` only test the
+        cells overlapping the grid bin containing a point rather than every
+        cell in the universe, which greatly reduces the cost of finding points
+        in universes with many cells. The grid is rebuilt automatically when
+        cells are added or removed or a region is modified, but not when
+        surface coefficients are changed.
+
+        Parameters
+        ----------
+        shape : Iterable of int, optional
+            Number of grid bins in the x, y, and z directions. By default, the
+            number of bins is chosen to be comparable to the number of cells.
+            Directions in which no cell is bounded have a single bin.
+
+        """
+        if shape is not None:
+            cv.check_type('search grid shape', shape, Iterable, Integral)
+            cv.check_length('search grid shape', shape, 3)
+        self._search_grid = _SearchGrid(list(self._cells.values()), shape)
+
+    def _current_search_grid(self):
+        """Return the search grid, rebuilding it if it is out of date, or None
+        if no search grid has been built."""
+        grid = self._search_grid
+        if grid is not None and (grid.stale or not grid.is_current()):
+            self.build_search_grid(grid.requested_shape)
+            grid = self._search_grid
+        return grid
+
+    def find_many(self, points):
+        """Find the cells, materials and cell instances containing many points
+
+        The points are classified all at once by evaluating the surfaces and
+        regions of each cell and the lattice element indices for arrays of
+        points rather than one point at a time.
+
+        Parameters
+        ----------
+        points : Iterable of 3-tuple of float
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        cell_ids : numpy.ndarray
+            ID of the lowest-level cell containing each point, or -1 if the
+            point is not contained in any cell
+        material_ids : numpy.ndarray
+            ID of the material filling the cell containing each point, or -1
+            if the cell is void or the point is not contained in any cell
+        instances : numpy.ndarray
+            Instance of the cell containing each point, as used by
+            distribcell tally filters and distributed materials, or -1 if the
+            point is not contained in any cell
+
+        """
+        points = np.array(points, dtype=float)
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError('Points must be given as an array with shape '
+                             '(N, 3).')
+
+        return self._find_many_memo(points, {'cells': {}})
+
+    def _find_many_memo(self, points, memo):
+        """Find the cells, materials and cell instances containing many points
+        reusing the lattice element tables and instance counts in a memo
+
+        This allows tables computed for one batch of points, e.g. one tile of
+        a plot, to be reused for the next.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+        memo : dict
+            Cells found and instance counts computed so far
+
+        Returns
+        -------
+        cell_ids : numpy.ndarray
+            ID of the lowest-level cell containing each point
+        material_ids : numpy.ndarray
+            ID of the material filling the cell containing each point
+        instances : numpy.ndarray
+            Instance of the cell containing each point
+
+        """
+        num_points = len(points)
+        cell_ids = np.full(num_points, -1, dtype=int)
+        instances = np.zeros(num_points, dtype=int)
+        self._find_many(points, np.arange(num_points), (cell_ids, instances),
+                        memo)
+
+        # Determine the material in each cell instance
+        material_ids = np.full(num_points, -1, dtype=int)
+        for cell_id, cell in memo['cells'].items():
+            in_cell = (cell_ids == cell_id)
+            if cell.fill_type == 'material':
+                material_ids[in_cell] = cell.fill.id
+            elif cell.fill_type == 'distribmat':
+                fill_ids = np.array([-1 if m is None else m.id
+                                     for m in cell.fill])
+                material_ids[in_cell] = fill_ids[instances[in_cell]]
+
+        instances[cell_ids == -1] = -1
+        return cell_ids, material_ids, instances
+
+    def _find_many(self, points, indices, results, memo):
+        """Find the cells containing points in local coordinates
+
+        This is a helper method for :meth:`Universe.find_many` which is called
+        recursively for the universes and lattices filling cells.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points in the universe's coordinate
+            system with shape (N, 3)
+        indices : numpy.ndarray
+            Indices of the points in the results arrays
+        results : 2-tuple of numpy.ndarray
+            Arrays of the cell IDs and instances of all points, which are
+            updated in place
+        memo : dict
+            Cells found and instance counts computed so far
+
+        """
+        cell_ids, instances = results
+        grid = self._current_search_grid()
+        if grid is not None:
+            sorted_points = grid.sort_points(points)
+
+        if grid is None:
+            remaining = np.arange(len(points))
+        else:
+            unclaimed = np.ones(len(points), dtype=bool)
+        num_remaining = len(points)
+        for i, cell in enumerate(self._cells.values()):
+            if num_remaining == 0:
+                break
+
+            if grid is None:
+                in_cell = cell.contains_points(points[remaining])
+                found = remaining[in_cell]
+                remaining = remaining[~in_cell]
+            else:
+                # Only test the unclaimed points in grid bins overlapping the
+                # cell
+                tested = grid.points_near(sorted_points, i)
+                tested = tested[unclaimed[tested]]
+                if tested.size == 0:
+                    continue
+                found = tested[cell.contains_points(points[tested])]
+                unclaimed[found] = False
+            num_remaining -= found.size
+            if found.size == 0:
+                continue
+
+            p = points[found]
+            if cell.fill_type in ('material', 'distribmat', 'void'):
+                cell_ids[indices[found]] = cell.id
+                memo['cells'][cell.id] = cell
+                continue
+            elif cell.fill_type == 'universe':
+                if cell.translation is not None:
+                    p = p - cell.translation
+                if cell.rotation is not None:
+                    p = p.dot(cell.rotation_matrix.T)
+            cell.fill._find_many(p, indices[found], results, memo)
+
+            # Count the instances of the cells found in preceding cells
+            if i > 0:
+                _add_instance_offsets(self, np.full(found.size, i),
+                                      indices[found], results, memo)
+
+    def _check_overlaps(self, points, indices, results, memo):
+        """Find points contained in more than one cell or in no cell
+
+        This is a helper method for :meth:`Geometry.check_overlaps` which is
+        called recursively for the universes and lattices filling cells. Each
+        point is followed into the fill of the first cell containing it, as is
+        done when tracking particles.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points in the universe's coordinate
+            system with shape (N, 3)
+        indices : numpy.ndarray
+            Indices of the sampled points
+        results : 2-tuple of dict
+            Indices of the points found in each pair of overlapping cells,
+            keyed by the pair of cell IDs, and of the points not contained in
+            any cell, keyed by the kind and ID of the universe or lattice,
+            which are updated in place
+        memo : dict
+            Lattice element tables computed so far
+
+        """
+        overlaps, voids = results
+        cells = list(self._cells.values())
+        grid = self._current_search_grid()
+        if grid is not None:
+            sorted_points = grid.sort_points(points)
+
+        # Index of the first cell containing each point
+        first = np.full(len(points), -1, dtype=int)
+        for i, cell in enumerate(cells):
+            if grid is None:
+                found = np.flatnonzero(cell.contains_points(points))
+            else:
+                # Only test the points in grid bins overlapping the cell
+                tested = grid.points_near(sorted_points, i)
+                if tested.size == 0:
+                    continue
+                found = tested[cell.contains_points(points[tested])]
+            if found.size == 0:
+                continue
+
+            # Points already found in preceding cells are in an overlap
+            prior = first[found]
+            for j in np.unique(prior[prior >= 0]):
+                key = (cells[j].id, cell.id)
+                overlaps.setdefault(key, []).append(
+                    indices[found[prior == j]])
+            first[found[prior == -1]] = i
+
+        missing = (first == -1)
+        if missing.any():
+            voids.setdefault(('universe', self.id), []).append(
+                indices[missing])
+
+        for i in np.unique(first[~missing]):
+            cell = cells[i]
+            if cell.fill_type not in ('universe', 'lattice'):
+                continue
+
+            found = (first == i)
+            p = points[found]
+            if cell.fill_type == 'universe':
+                if cell.translation is not None:
+                    p = p - cell.translation
+                if cell.rotation is not None:
+                    p = p.dot(cell.rotation_matrix.T)
+            cell.fill._check_overlaps(p, indices[found], results, memo)
+
+    def _instance_counts(self, memo):
+        """Count the instances of each cell within the universe
+
+        Parameters
+        ----------
+        memo : dict
+            Instance counts computed so far
+
+        Returns
+        -------
+        list of dict
+            Number of instances of each cell, keyed by cell ID, within each
+            cell of the universe (including the cell itself)
+
+        """
+        key = ('counts', id(self))
+        if key not in memo:
+            counts = []
+            for cell in self._cells.values():
+                cell_counts = {cell.id: 1}
+                if cell.fill_type in ('universe', 'lattice'):
+                    for fill_counts in cell.fill._instance_counts(memo):
+                        for cell_id, n in fill_counts.items():
+                            cell_counts[cell_id] = \
+                                cell_counts.get(cell_id, 0) + n
+                counts.append(cell_counts)
+            memo[key] = counts
+        return memo[key]
+
     def plot(self, origin=(0., 0., 0.), width=(1., 1.), pixels=(200, 200),
              basis='xy', color_by='cell', colors=None, filename=None, seed=None,
-             **kwargs):
+             processes=1, **kwargs):
         """Display a slice plot of the universe.
 
+        The cells and materials at the pixel centers are determined for tiles
+        of pixel rows at a time using :meth:`Universe.find_many`. The tiles
+        may optionally be distributed over a pool of worker processes.
+
         Parameters
         ----------
         origin : Iterable of float
@@ -238,6 +540,10 @@ class Universe(IDManagerMixin):
             Hashable object which is used to seed the random number generator
             used to select colors. If None, the generator is seeded from the
             current time.
+        processes : Integral or None, optional
+            Number of worker processes used to classify the tiles of pixels.
+            If None, the number of CPUs is used. Defaults to 1, i.e. the
+            pixels are classified in the calling process.
         **kwargs
             All keyword arguments are passed to
             :func:`matplotlib.pyplot.imshow`.
@@ -290,33 +596,48 @@ class Universe(IDManagerMixin):
         y_coords = np.linspace(y_max, y_min, pixels[1], endpoint=False) - \
                    0.5*(y_max - y_min)/pixels[1]
 
-        # Initialize output image in RGBA format.  Flip the pixels from
-        # traditional (x, y) to (y, x) used in graphics.
-        img = np.zeros((pixels[1], pixels[0], 4))
-        for i, x in enumerate(x_coords):
-            for j, y in enumerate(y_coords):
-                if basis == 'xy':
-                    path = self.find((x, y, origin[2]))
-                elif basis == 'yz':
-                    path = self.find((origin[0], x, y))
-                elif basis == 'xz':
-                    path = self.find((x, origin[1], y))
-
-                if len(path) > 0:
-                    try:
-                        if color_by == 'cell':
-                            obj = path[-1]
-                        elif color_by == 'material':
-                            if path[-1].fill_type == 'material':
-                                obj = path[-1].fill
-                            else:
-                                continue
-                    except AttributeError:
-                        continue
-                    if obj not in colors:
-                        colors[obj] = (random.random(), random.random(),
-                                       random.random(), 1.0)
-                    img[j, i, :] = colors[obj]
+        # Divide the rows of pixels into tiles of roughly equal size
+        rows = max(1, _PLOT_TILE_SIZE // pixels[0])
+        tiles = [(basis, origin, x_coords, y_coords[j:j + rows])
+                 for j in range(0, pixels[1], rows)]
+
+        if processes == 1:
+            memo = {'cells': {}}
+            results = [self._find_many_memo(_tile_points(*tile), memo)
+                       for tile in tiles]
+        else:
+            pool = multiprocessing.Pool(processes, _init_plot_worker, (self,))
+            try:
+                results = pool.map(_plot_tile, tiles)
+            finally:
+                pool.close()
+                pool.join()
+
+        # Flip the pixels from traditional (x, y) to (y, x) used in graphics
+        if color_by == 'cell':
+            ids = np.concatenate([r[0] for r in results])
+            objects = self.get_all_cells()
+        elif color_by == 'material':
+            ids = np.concatenate([r[1] for r in results])
+            objects = self.get_all_materials()
+        ids = ids.reshape(pixels[1], pixels[0])
+
+        # Assign colors to cells/materials in the order in which they are
+        # encountered going through the pixels column by column
+        unique_ids, first, inverse = np.unique(
+            ids.T, return_index=True, return_inverse=True)
+        table = np.zeros((len(unique_ids), 4))
+        for i in np.argsort(first):
+            if unique_ids[i] == -1:
+                continue
+            obj = objects[unique_ids[i]]
+            if obj not in colors:
+                colors[obj] = (random.random(), random.random(),
+                               random.random(), 1.0)
+            table[i] = colors[obj]
+
+        # Initialize output image in RGBA format
+        img = table[inverse.reshape(pixels[0], pixels[1]).T]
 
         # Display image
         plt.imshow(img, extent=(x_min, x_max, y_min, y_max),
@@ -347,6 +668,9 @@ class Universe(IDManagerMixin):
 
         if cell_id not in self._cells:
             self._cells[cell_id] = cell
+            if self._search_grid is not None:
+                self._search_grid.stale = True
+            openmc.geometry._modified(self)
 
     def add_cells(self, cells):
         """Add multiple cells to the universe.
@@ -384,11 +708,17 @@ class Universe(IDManagerMixin):
         # If the Cell is in the Universe's list of Cells, delete it
         if cell.id in self._cells:
             del self._cells[cell.id]
+            if self._search_grid is not None:
+                self._search_grid.stale = True
+            openmc.geometry._modified(self)
 
     def clear_cells(self):
         """Remove all cells from the universe."""
 
         self._cells.clear()
+        if self._search_grid is not None:
+            self._search_grid.stale = True
+        openmc.geometry._modified(self)
 
     def get_nuclides(self):
         """Returns all nuclides in the universe
@@ -545,44 +875,312 @@ class Universe(IDManagerMixin):
                 cell_element.set("universe", str(self._id))
                 xml_element.append(cell_element)
 
-    def _determine_paths(self, path='', instances_only=False):
-        """Count the number of instances for each cell in the universe, and
-        record the count in the :attr:`Cell.num_instances` properties."""
 
-        univ_path = path + 'u{}'.format(self.id)
+def _add_instance_offsets(fill, positions, indices, results, memo):
+    """Add the instances of cells found within a universe or lattice which
+    precede the cells or lattice elements containing the points.
 
-        for cell in self.cells.values():
-            cell_path = '{}->c{}'.format(univ_path, cell.id)
+    The instances of a cell are numbered in the order in which the CSG tree
+    is traversed by :meth:`Geometry.determine_paths`, so the instance of a
+    cell is offset by the number of instances of the same cell within the
+    cells or lattice elements traversed before the one containing a point.
 
-            # If universe-filled, recursively count cells in filling universe
-            if cell.fill_type == 'universe':
-                cell.fill._determine_paths(cell_path + '->', instances_only)
+    Parameters
+    ----------
+    fill : openmc.Universe or openmc.Lattice
+        Universe or lattice containing the points
+    positions : numpy.ndarray
+        Position of the cell or lattice element containing each point in the
+        traversal order
+    indices : numpy.ndarray
+        Indices of the points in the results arrays
+    results : 2-tuple of numpy.ndarray
+        Arrays of the cell IDs and instances of all points, which are updated
+        in place
+    memo : dict
+        Instance counts computed so far
 
-            # If lattice-filled, recursively call for all universes in lattice
-            elif cell.fill_type == 'lattice':
-                latt = cell.fill
+    """
+    cell_ids, instances = results
+    targets = cell_ids[indices]
+    for cell_id in np.unique(targets):
+        if cell_id == -1:
+            continue
 
-                # Count instances in each universe in the lattice
-                for index in latt._natural_indices:
-                    latt_path = '{}->l{}({})->'.format(
-                        cell_path, latt.id, ",".join(str(x) for x in index))
-                    univ = latt.get_universe(index)
-                    univ._determine_paths(latt_path, instances_only)
+        # Cumulative number of instances of the cell before each position
+        key = ('offsets', id(fill), cell_id)
+        if key not in memo:
+            counts = [c.get(cell_id, 0) for c in fill._instance_counts(memo)]
+            memo[key] = np.cumsum([0] + counts[:-1])
 
-            else:
-                if cell.fill_type == 'material':
-                    mat = cell.fill
-                elif cell.fill_type == 'distribmat':
-                    mat = cell.fill[cell._num_instances]
-                else:
-                    mat = None
+        found = (targets == cell_id)
+        instances[indices[found]] += memo[key][positions[found]]
+
+
+def _tile_points(basis, origin, x_coords, y_coords):
+    """Return the coordinates of the pixel centers in one tile of a plot
+
+    Parameters
+    ----------
+    basis : {'xy', 'xz', 'yz'}
+        The basis directions for the plot
+    origin : Iterable of float
+        Coordinates at the origin of the plot
+    x_coords : numpy.ndarray
+        Horizontal coordinates of the pixel columns
+    y_coords : numpy.ndarray
+        Vertical coordinates of the pixel rows in the tile
+
+    Returns
+    -------
+    numpy.ndarray
+        Cartesian coordinates of the pixel centers, row by row, with shape
+        (N, 3)
+
+    """
+    x, y = np.meshgrid(x_coords, y_coords)
+    x, y = x.ravel(), y.ravel()
+    points = np.empty((x.size, 3))
+    if basis == 'xy':
+        points[:, 0], points[:, 1], points[:, 2] = x, y, origin[2]
+    elif basis == 'yz':
+        points[:, 0], points[:, 1], points[:, 2] = origin[0], x, y
+    elif basis == 'xz':
+        points[:, 0], points[:, 1], points[:, 2] = x, origin[1], y
+    return points
+
+
+def _init_plot_worker(universe):
+    global _plot_universe, _plot_memo
+    _plot_universe = universe
+    _plot_memo = {'cells': {}}
+
+
+def _plot_tile(tile):
+    cell_ids, material_ids, _ = _plot_universe._find_many_memo(
+        _tile_points(*tile), _plot_memo)
+    return cell_ids, material_ids
+
+
+def _offsets(bins, num_bins):
+    """Return the offsets of each bin in a sorted array of bin indices
+
+    Parameters
+    ----------
+    bins : numpy.ndarray
+        Unsorted flat indices of grid bins
+    num_bins : int
+        Total number of grid bins
+
+    Returns
+    -------
+    numpy.ndarray
+        Positions in the sorted bin indices at which each bin starts, with an
+        extra entry for the end of the last bin
+
+    """
+    offsets = np.zeros(num_bins + 1, dtype=int)
+    offsets[1:] = np.cumsum(np.bincount(bins, minlength=num_bins))
+    return offsets
+
+
+class _SearchGrid(object):
+    """Uniform grid of the cells whose bounding boxes overlap each bin
 
-                if mat is not None:
-                    mat._num_instances += 1
-                    if not instances_only:
-                        mat._paths.append('{}->m{}'.format(cell_path, mat.id))
+    Parameters
+    ----------
+    cells : list of openmc.Cell
+        Cells of the universe, in the order in which they are searched
+    shape : Iterable of int or None
+        Number of grid bins in each direction, or None to choose the shape
+        based on the number of cells
+
+    Attributes
+    ----------
+    lower_left : numpy.ndarray
+        Lower-left coordinates of the grid
+    width : numpy.ndarray
+        Width of the grid bins in each direction
+    shape : tuple of int
+        Number of grid bins in each direction
+    bins : numpy.ndarray
+        Flat indices of the grid bins overlapped by the bounding box of each
+        cell, such that the bins overlapped by cell j are given by
+        ``bins[bin_offsets[j]:bin_offsets[j + 1]]``
+    bin_offsets : numpy.ndarray
+        Position in :attr:`bins` of the bins overlapped by each cell
+    offsets : numpy.ndarray
+        Position in :attr:`indices` of the cells overlapping each grid bin,
+        such that the cells overlapping bin i are given by
+        ``indices[offsets[i]:offsets[i + 1]]``
+    indices : numpy.ndarray
+        Indices in :attr:`cells_ordered` of the cells overlapping each grid
+        bin in search order
+    cells_ordered : list of openmc.Cell
+        Cells of the universe in search order
+    regions : list of openmc.Region
+        Regions of the cells when the grid was built
+    versions : openmc.region._RegionVersions
+        Versions of the nodes of the regions when the grid was built
+    requested_shape : Iterable of int or None
+        Shape passed when the grid was built
+    stale : bool
+        Whether cells have been added to or removed from the universe since
+        the grid was built
+
+    """
+
+    def __init__(self, cells, shape=None):
+        self.cells_ordered = cells
+        self.requested_shape = shape
+        self.stale = False
+        self.regions = [cell.region for cell in cells]
+        self.versions = _RegionVersions(self.regions)
+
+        boxes = [cell.bounding_box for cell in cells]
+        lower = np.array([b[0] for b in boxes]).reshape(-1, 3)
+        upper = np.array([b[1] for b in boxes]).reshape(-1, 3)
+
+        # Extend the grid over the finite bounds of the cells in each direction
+        self.lower_left = np.zeros(3)
+        upper_right = np.ones(3)
+        bounded = np.zeros(3, dtype=bool)
+        for i in range(3):
+            bounds = np.concatenate((lower[:, i], upper[:, i]))
+            bounds = bounds[np.isfinite(bounds)]
+            if bounds.size > 0 and bounds.max() > bounds.min():
+                self.lower_left[i] = bounds.min()
+                upper_right[i] = bounds.max()
+                bounded[i] = True
+
+        if shape is None:
+            num_bounded = np.count_nonzero(np.any(
+                np.isfinite(lower) | np.isfinite(upper), axis=1))
+            n = int(np.ceil(max(num_bounded, 1)**(1./max(bounded.sum(), 1))))
+            shape = np.where(bounded, n, 1)
+        self.shape = tuple(int(n) for n in shape)
+        self.width = (upper_right - self.lower_left)/self.shape
+
+        # Determine the range of bins overlapped by each cell
+        bins = []
+        for lo, hi in zip(self.bin_indices(lower), self.bin_indices(upper)):
+            box = np.mgrid[lo[0]:hi[0] + 1, lo[1]:hi[1] + 1, lo[2]:hi[2] + 1]
+            bins.append(np.ravel_multi_index(box.reshape(3, -1), self.shape))
+        sizes = [b.size for b in bins]
+        self.bins = np.concatenate(bins) if bins else np.empty(0, dtype=int)
+        self.bin_offsets = np.concatenate(([0], np.cumsum(sizes, dtype=int)))
+
+        # Store the cells overlapping each bin in compressed sparse row form
+        order = np.argsort(self.bins, kind='mergesort')
+        self.indices = np.repeat(np.arange(len(cells)), sizes)[order]
+        self.offsets = _offsets(self.bins, np.prod(self.shape))
+
+    def cells_in_bin(self, index):
+        """Return the cells overlapping a grid bin in search order
+
+        Parameters
+        ----------
+        index : int
+            Flat index of the grid bin
+
+        Returns
+        -------
+        list of openmc.Cell
+            Cells overlapping the grid bin
 
-            # Append current path
-            cell._num_instances += 1
-            if not instances_only:
-                cell._paths.append(cell_path)
+        """
+        cells = self.cells_ordered
+        return [cells[j] for j in
+                self.indices[self.offsets[index]:self.offsets[index + 1]]]
+
+    def sort_points(self, points):
+        """Group many points by the grid bin containing them
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        order : numpy.ndarray
+            Indices of the points sorted by grid bin
+        offsets : numpy.ndarray
+            Position in `order` of the points in each grid bin
+
+        """
+        bins = self.find_bins(points)
+        return (np.argsort(bins, kind='mergesort'),
+                _offsets(bins, np.prod(self.shape)))
+
+    def points_near(self, sorted_points, j):
+        """Return the points in grid bins overlapped by a cell
+
+        Parameters
+        ----------
+        sorted_points : 2-tuple of numpy.ndarray
+            Points grouped by grid bin as returned by :meth:`sort_points`
+        j : int
+            Index of the cell in :attr:`cells_ordered`
+
+        Returns
+        -------
+        numpy.ndarray
+            Sorted indices of the points in grid bins overlapped by the cell
+
+        """
+        order, offsets = sorted_points
+        bins = self.bins[self.bin_offsets[j]:self.bin_offsets[j + 1]]
+        start = offsets[bins]
+        counts = offsets[bins + 1] - start
+
+        # Concatenate the ranges of sorted points in each bin
+        total = counts.sum()
+        shift = np.repeat(start - np.cumsum(counts) + counts, counts)
+        return np.sort(order[shift + np.arange(total)])
+
+    def bin_indices(self, points):
+        """Determine the indices in each direction of the grid bins
+        containing many points
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Indices of the grid bins with shape (N, 3)
+
+        """
+        # Points outside of the grid are assigned to the nearest bin
+        with np.errstate(invalid='ignore'):
+            idx = np.floor((points - self.lower_left)/self.width)
+        idx = np.clip(np.nan_to_num(idx), 0, np.array(self.shape) - 1)
+        return idx.astype(int)
+
+    def is_current(self):
+        """Return whether the regions of the cells are unchanged since the
+        grid was built."""
+        if self.versions.modifications == Region._modifications:
+            return True
+        return (all(cell.region is region for cell, region in
+                    zip(self.cells_ordered, self.regions)) and
+                self.versions.is_current())
+
+    def find_bins(self, points):
+        """Determine the grid bin containing each of many points
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Flat index of the grid bin containing each point
+
+        """
+        return np.ravel_multi_index(self.bin_indices(points).T, self.shape)
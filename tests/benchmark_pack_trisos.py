@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+"""Benchmark the TRISO packing algorithms in openmc.model.pack_trisos.
+
+For each combination of container shape, packing fraction, container size and
+close random packing method, particles are packed and the wall time, number of
+overlaps eliminated by close random packing, achieved packing fraction and
+minimum center-to-center distance relative to the particle diameter are
+reported.
+
+"""
+
+from __future__ import division, print_function
+
+import argparse
+from itertools import product
+from math import pi
+import time
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+import openmc
+import openmc.model
+
+
+def min_distance(points):
+    """Return the minimum distance between any two points."""
+    d, _ = cKDTree(points).query(points, k=2)
+    return d[:, 1].min()
+
+
+def domain_volume(shape, length, radius):
+    if shape == 'cube':
+        return length**3
+    elif shape == 'cylinder':
+        return pi*radius**2*length
+    else:
+        return 4/3*pi*radius**3
+
+
+def run(args):
+    # Dummy TRISO universe; only the particle positions matter here
+    fill = openmc.Universe(cells=[openmc.Cell()])
+
+    header = ('{:>8s} {:>6s} {:>9s} {:>6s} {:>9s} {:>9s} {:>10s} {:>11s} '
+              '{:>8s}'.format('shape', 'size', 'target pf', 'method',
+                              'particles', 'time [s]', 'iterations',
+                              'achieved pf', 'd_min/d'))
+    print(header)
+    print('-'*len(header))
+
+    for shape, size, pf, method in product(args.shapes, args.sizes,
+                                           args.packing_fractions,
+                                           args.methods):
+        # The container size is given in units of the particle radius
+        length = size*args.radius
+        radius = size*args.radius/2
+
+        iterations = [0]
+
+        def callback(iteration, inner_diameter, outer_diameter, n_rods):
+            iterations[0] = iteration
+
+        start = time.time()
+        trisos = openmc.model.pack_trisos(
+            radius=args.radius, fill=fill, domain_shape=shape,
+            domain_length=length, domain_radius=radius,
+            packing_fraction=pf, seed=args.seed, method=method,
+            batch_size=args.batch_size, callback=callback)
+        elapsed = time.time() - start
+
+        centers = np.array([t.center for t in trisos])
+        achieved = (len(trisos)*4/3*pi*args.radius**3 /
+                    domain_volume(shape, length, radius))
+        ratio = min_distance(centers)/(2*args.radius)
+
+        print('{:>8s} {:>6g} {:>9.3f} {:>6s} {:>9d} {:>9.2f} {:>10d} '
+              '{:>11.4f} {:>8.4f}'.format(shape, size, pf, method,
+                                          len(trisos), elapsed, iterations[0],
+                                          achieved, ratio))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-s', '--shapes', nargs='+',
+                        choices=['cube', 'cylinder', 'sphere'],
+                        default=['cube', 'cylinder', 'sphere'],
+                        help='Shapes of the container')
+    parser.add_argument('-l', '--sizes', nargs='+', type=float,
+                        default=[20., 40.],
+                        help='Lengths of the container in units of the '
+                        'particle radius')
+    parser.add_argument('-f', '--packing-fractions', nargs='+', type=float,
+                        default=[0.2, 0.4, 0.5],
+                        help='Packing fractions of particles')
+    parser.add_argument('-m', '--methods', nargs='+', choices=['grid', 'mesh'],
+                        default=['grid', 'mesh'],
+                        help='Close random packing methods')
+    parser.add_argument('-b', '--batch-size', type=int, default=64,
+                        help='Batch size of the grid method')
+    parser.add_argument('-r', '--radius', type=float, default=0.05,
+                        help='Outer radius of the particles')
+    parser.add_argument('--seed', type=int, default=1, help='RNG seed')
+    run(parser.parse_args())
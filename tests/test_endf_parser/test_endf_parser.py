@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+
+import io
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, os.pardir))
+from openmc.data.endf import (float_endf, get_list_record, get_tab1_record,
+                              get_evaluations, Evaluation, _read_fields,
+                              _fields_to_float)
+
+
+# Fields in the various notations found in ENDF files
+FIELDS = ['-1.23481+10', ' 1.23481-10', '  2.5000000', ' 1.000000+0',
+          '-0.00000+00', '     +1.5-3', '       .5-3', ' 9.87654321',
+          '       12.5', '1.2345678+1', '1.000000E+0', '-2.00000e-1',
+          '          0', '         -7', ' 6.0221-123', ' 3.14159265']
+
+
+def lines(fields, mat, mf, mt):
+    """Return the records holding the given 11-character fields"""
+    text = ''
+    for i in range(0, max(len(fields), 1), 6):
+        row = ''.join(fields[i:i + 6]).ljust(66)
+        text += '{}{:4d}{:2d}{:3d}{:5d}\n'.format(row, mat, mf, mt, 99999)
+    return text
+
+
+def fmt(value):
+    """Format an integer or float as an 11-character ENDF field"""
+    if isinstance(value, int):
+        return '{:11d}'.format(value)
+    mantissa, exponent = '{:.6e}'.format(value).split('e')
+    return '{}{:+d}'.format(mantissa, int(exponent)).rjust(11)
+
+
+def material(mat, za, x, y):
+    """Return the text of a material with a header and one TAB1 section"""
+    text = lines([fmt(float(za)), fmt(2.5), fmt(0), fmt(0), fmt(0), fmt(0)],
+                 mat, 1, 451)
+    text += lines([fmt(0.), fmt(0.), fmt(0), fmt(0), fmt(0), fmt(6)],
+                  mat, 1, 451)
+    text += lines([fmt(1.), fmt(2.e7), fmt(1), fmt(0), fmt(10), fmt(8)],
+                  mat, 1, 451)
+    text += lines([fmt(0.), fmt(0.), fmt(0), fmt(0), fmt(5), fmt(2)],
+                  mat, 1, 451)
+    for i in range(5):
+        text += lines(['Text record {}'.format(i).ljust(66)], mat, 1, 451)
+    nc = (2*x.size + 5)//6 + 2
+    text += lines([' '*11, ' '*11, fmt(1), fmt(451), fmt(11), fmt(0)],
+                  mat, 1, 451)
+    text += lines([' '*11, ' '*11, fmt(3), fmt(1), fmt(nc), fmt(0)],
+                  mat, 1, 451)
+    text += lines([], mat, 1, 0) + lines([], mat, 0, 0)
+
+    # Cross section with two interpolation regions
+    text += lines([fmt(float(za)), fmt(2.5), fmt(0), fmt(0), fmt(0), fmt(0)],
+                  mat, 3, 1)
+    text += lines([fmt(0.), fmt(0.), fmt(0), fmt(0), fmt(2), fmt(x.size)],
+                  mat, 3, 1)
+    text += lines([fmt(3), fmt(2), fmt(x.size), fmt(5)], mat, 3, 1)
+    pairs = np.column_stack((x, y)).ravel()
+    text += lines([fmt(float(v)) for v in pairs], mat, 3, 1)
+    text += lines([], mat, 3, 0) + lines([], mat, 0, 0)
+    return text + lines([], 0, 0, 0)
+
+
+if __name__ == '__main__':
+    # This test doesn't require an OpenMC run. We just need to make sure that
+    # the bulk conversion of records gives the same values as converting each
+    # field with float_endf and that materials read from a file object match
+    # the ones found in the whole file.
+
+    # Fields converted in bulk
+    fields = np.array([f.encode('ascii') for f in FIELDS], dtype='S11')
+    assert np.array_equal(_fields_to_float(fields),
+                          [float_endf(f) for f in FIELDS])
+
+    # Fields spread over several records, including a short last line
+    text = lines(FIELDS, 125, 3, 1).replace(' ' * 6 + '\n', '\n')
+    fields = _read_fields(io.StringIO(text), len(FIELDS))
+    assert [f.decode() for f in fields] == FIELDS
+
+    # LIST record
+    text = lines([fmt(1.5), fmt(2.), fmt(3), fmt(4), fmt(len(FIELDS)),
+                  fmt(0)], 125, 6, 5) + lines(FIELDS, 125, 6, 5)
+    items, values = get_list_record(io.StringIO(text))
+    assert items == [1.5, 2., 3, 4, len(FIELDS), 0]
+    assert values == [float_endf(f) for f in FIELDS]
+
+    # TAB1 record
+    rng = np.random.RandomState(1)
+    x = np.cumsum(rng.uniform(1.e-5, 1., 3001))
+    y = rng.uniform(-1.e3, 1.e3, x.size)
+    text = lines([fmt(0.), fmt(-1.e6), fmt(0), fmt(1), fmt(2), fmt(x.size)],
+                 125, 3, 1)
+    text += lines([fmt(3), fmt(2), fmt(x.size), fmt(5)], 125, 3, 1)
+    pairs = [fmt(float(v)) for v in np.column_stack((x, y)).ravel()]
+    text += lines(pairs, 125, 3, 1)
+    params, tab = get_tab1_record(io.StringIO(text))
+    assert params == [0., -1.e6, 0, 1]
+    assert np.array_equal(tab.breakpoints, [3, x.size])
+    assert np.array_equal(tab.interpolation, [2, 5])
+    assert np.array_equal(tab.x, [float_endf(f) for f in pairs[0::2]])
+    assert np.array_equal(tab.y, [float_endf(f) for f in pairs[1::2]])
+
+    # Materials read one after the other from a file object, the first of
+    # which is longer than the blocks in which binary files are read
+    filename = 'endf.txt'
+    with open(filename, 'w') as fh:
+        fh.write(lines(['Tape ID'.ljust(66)], 1, 0, 0))
+        fh.write(material(125, 1001, x, y))
+        fh.write(material(128, 1002, x[:10], y[:10]))
+        fh.write(lines([], -1, 0, 0))
+
+    evaluations = get_evaluations(filename)
+    assert [ev.material for ev in evaluations] == [125, 128]
+    assert evaluations[1].target['mass_number'] == 2
+    for mode in ('rb', 'r'):
+        with open(filename, mode) as fh:
+            for expected in evaluations:
+                ev = Evaluation(fh)
+                assert ev.material == expected.material
+                assert ev.reaction_list == expected.reaction_list
+                assert list(ev.section) == list(expected.section)
+                for key in ev.section:
+                    assert ev.section[key] == expected.section[key]
+    first = Evaluation(filename)
+    assert first.section[3, 1] == evaluations[0].section[3, 1]
+
+    # The TAB1 record of the first material gives back the tabulated values
+    file_obj = io.StringIO(evaluations[0].section[3, 1])
+    file_obj.readline()
+    params, tab = get_tab1_record(file_obj)
+    assert np.array_equal(tab.x, [float_endf(fmt(float(v))) for v in x])
+
+    os.remove(filename)
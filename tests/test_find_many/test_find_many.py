@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, os.pardir))
+import openmc
+
+
+def build_geometry():
+    fuel = openmc.Material()
+    water = openmc.Material()
+    clad = openmc.Material()
+
+    cyl = openmc.ZCylinder(R=0.4)
+    pin = openmc.Universe(cells=[openmc.Cell(fill=fuel, region=-cyl),
+                                 openmc.Cell(fill=water, region=+cyl)])
+    small_cyl = openmc.ZCylinder(R=0.3)
+    distrib_cell = openmc.Cell(fill=[fuel, None, clad, water]*40,
+                               region=-small_cyl)
+    distrib_pin = openmc.Universe(cells=[distrib_cell,
+                                         openmc.Cell(region=+small_cyl)])
+    outer = openmc.Universe(cells=[openmc.Cell(fill=water)])
+
+    rect = openmc.RectLattice()
+    rect.lower_left = (-2., -2.)
+    rect.pitch = (1., 1.)
+    rect.universes = [[pin, distrib_pin, pin, pin],
+                      [distrib_pin, pin, pin, distrib_pin],
+                      [pin, pin, distrib_pin, pin],
+                      [pin, pin, pin, pin]]
+    rect.outer = outer
+
+    hexagonal = openmc.HexLattice()
+    hexagonal.center = (0., 0.)
+    hexagonal.pitch = (1.5,)
+    hexagonal.universes = [[pin]*12, [distrib_pin]*6, [pin]]
+    hexagonal.outer = outer
+
+    hex_3d = openmc.HexLattice()
+    hex_3d.center = (0., 0., 0.)
+    hex_3d.pitch = (1.5, 2.)
+    hex_3d.universes = [[[pin]*6, [distrib_pin]], [[distrib_pin]*6, [pin]]]
+    hex_3d.outer = outer
+
+    rect_3d = openmc.RectLattice()
+    rect_3d.lower_left = (-1., -1., -1.)
+    rect_3d.pitch = (1., 1., 1.)
+    rect_3d.universes = [[[pin, distrib_pin], [distrib_pin, pin]],
+                         [[distrib_pin, distrib_pin], [pin, pin]]]
+    nested = openmc.Universe(cells=[
+        openmc.Cell(fill=rect_3d, region=-openmc.Sphere(R=1.4)),
+        openmc.Cell(fill=clad)])
+
+    x0 = openmc.XPlane(x0=-5.)
+    x1 = openmc.XPlane(x0=5.)
+    z0 = openmc.ZPlane(z0=-3.)
+    z1 = openmc.ZPlane(z0=3.)
+    y = [openmc.YPlane(y0=y0) for y0 in (-10., -5., 0., 5., 10.)]
+    box = +x0 & -x1 & +z0 & -z1
+    cells = [openmc.Cell(fill=rect, region=box & +y[2] & -y[3]),
+             openmc.Cell(fill=hexagonal, region=box & +y[1] & -y[2]),
+             openmc.Cell(fill=nested, region=box & +y[3] & -y[4]),
+             openmc.Cell(fill=hex_3d, region=box & +y[0] & -y[1])]
+    cells[2].translation = (0., 7., 0.)
+    cells[2].rotation = (10., 20., 30.)
+    cells[3].translation = (0., -7., 0.)
+    return openmc.Geometry(openmc.Universe(cells=cells))
+
+
+def path_string(path):
+    """Return the path of a cell instance found by Geometry.find"""
+    levels = []
+    for level in path:
+        if isinstance(level, openmc.Universe):
+            levels.append('u{}'.format(level.id))
+        elif isinstance(level, openmc.Cell):
+            levels.append('c{}'.format(level.id))
+        else:
+            lattice, idx = level
+            if isinstance(lattice, openmc.HexLattice) and \
+               lattice.num_axial is None:
+                idx = idx[:2]
+            levels.append('l{}({})'.format(
+                lattice.id, ','.join(str(i) for i in idx)))
+    return '->'.join(levels)
+
+
+def check_find_many(geometry, points):
+    """Compare Geometry.find_many with Geometry.find for each point"""
+    cell_ids, material_ids, instances = geometry.find_many(points)
+    for i, point in enumerate(points):
+        path = geometry.find(point.copy())
+
+        # Points outside of a lattice without an outer universe are not
+        # contained in any cell
+        if not path or not isinstance(path[-1], openmc.Cell) or \
+           path[-1].fill_type in ('universe', 'lattice'):
+            assert cell_ids[i] == -1 and material_ids[i] == -1
+            assert instances[i] == -1
+            continue
+
+        cell = path[-1]
+        assert cell_ids[i] == cell.id
+
+        # Instances are only defined for paths which do not pass through the
+        # outer universe of a lattice
+        path = path_string(path)
+        instance = cell.paths.index(path) if path in cell.paths else None
+        if instance is not None:
+            assert instances[i] == instance
+
+        if cell.fill_type == 'material':
+            assert material_ids[i] == cell.fill.id
+        elif cell.fill_type == 'distribmat' and instance is not None:
+            material = cell.fill[instance]
+            assert material_ids[i] == (-1 if material is None
+                                       else material.id)
+        elif cell.fill_type == 'void':
+            assert material_ids[i] == -1
+
+
+if __name__ == '__main__':
+    # This test doesn't require an OpenMC run. We just need to make sure that
+    # the cells, materials and instances found for many points at once agree
+    # with those found one point at a time.
+
+    np.random.seed(1)
+    geometry = build_geometry()
+    geometry.determine_paths()
+    points = np.random.uniform((-5.5, -10.5, -3.2), (5.5, 10.5, 3.2),
+                               (4000, 3))
+
+    # Without and with search grids for all universes
+    check_find_many(geometry, points)
+    for universe in geometry.get_all_universes().values():
+        universe.build_search_grid()
+    check_find_many(geometry, points)
+
+    # Regions and lattice elements of many points at once
+    for cell in geometry.get_all_cells().values():
+        if cell.region is not None:
+            inside = cell.contains_points(points)
+            assert all(inside[i] == (tuple(p) in cell.region)
+                       for i, p in enumerate(points))
+    for lattice in geometry.get_all_lattices().values():
+        indices, local = lattice.find_element(points)
+        for i, point in enumerate(points):
+            idx, p = lattice.find_element(tuple(point))
+            assert tuple(indices[i]) == tuple(idx)
+            assert np.allclose(local[i], p)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, os.pardir))
+import openmc
+
+
+if __name__ == '__main__':
+    # This test doesn't require an OpenMC run. We just need to make sure that
+    # the collections cached by a geometry are updated when the universes of a
+    # lattice or the materials of a distributed material cell are changed in
+    # place.
+
+    fuel = openmc.Material()
+    water = openmc.Material()
+    pin = openmc.Universe(cells=[openmc.Cell(fill=fuel)])
+
+    lattice = openmc.RectLattice()
+    lattice.lower_left = (-1., -1.)
+    lattice.pitch = (1., 1.)
+    lattice.universes = [[pin, pin], [pin, pin]]
+    root = openmc.Universe(cells=[openmc.Cell(fill=lattice)])
+    geometry = openmc.Geometry(root)
+
+    assert len(geometry.get_all_materials()) == 1
+    geometry.determine_paths()
+
+    # Replace one lattice element in place
+    water_cell = openmc.Cell(fill=water)
+    lattice.universes[0, 0] = openmc.Universe(cells=[water_cell])
+    assert len(geometry.get_all_materials()) == 2
+    assert len(geometry.get_all_universes()) == 3
+
+    geometry.determine_paths()
+    assert water_cell.num_instances == 1
+    assert fuel.num_instances == 3
+    assert geometry.get_instances(water_cell.paths[0]) == 0
+
+    # Replace one material of a distributed material cell in place
+    distrib_cell = openmc.Cell(fill=[fuel, fuel])
+    lattice.universes[1, 1] = openmc.Universe(cells=[distrib_cell])
+    assert len(geometry.get_all_materials()) == 2
+    distrib_cell.fill[1] = openmc.Material()
+    assert len(geometry.get_all_materials()) == 3
+
+    # Replace an element through a view of the universes and of a hexagonal
+    # lattice's rings
+    row = lattice.universes[1]
+    row[0] = openmc.Universe(cells=[openmc.Cell(fill=openmc.Material())])
+    assert len(geometry.get_all_materials()) == 4
+
+    hex_lattice = openmc.HexLattice()
+    hex_lattice.center = (0., 0.)
+    hex_lattice.pitch = (1.,)
+    hex_lattice.universes = [[pin]*6, [pin]]
+    hex_geometry = openmc.Geometry(
+        openmc.Universe(cells=[openmc.Cell(fill=hex_lattice)]))
+    assert len(hex_geometry.get_all_materials()) == 1
+    hex_lattice.universes[0][3] = openmc.Universe(cells=[water_cell])
+    assert len(hex_geometry.get_all_materials()) == 2
+
+    # Modifying one geometry must not discard what another one has cached
+    cells = geometry._cache['cells']
+    hex_lattice.universes[1][0] = openmc.Universe(cells=[distrib_cell])
+    assert len(geometry.get_all_cells()) == len(cells)
+    assert geometry._cache['cells'] is cells
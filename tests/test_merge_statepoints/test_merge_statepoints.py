@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+
+import os
+import shutil
+import sys
+import tempfile
+
+import h5py
+import numpy as np
+
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, os.pardir))
+import openmc
+from openmc.statepoint import _combined_keff
+
+
+def write_statepoint(path, seed, n_realizations, results_dtype=float):
+    """Write a small eigenvalue statepoint with a single cell tally."""
+    rng = np.random.RandomState(seed)
+    with h5py.File(path, 'w') as f:
+        f.attrs['filetype'] = np.bytes_('statepoint')
+        f.attrs['version'] = np.array([17, 0])
+        f.attrs['date_and_time'] = np.bytes_('')
+        f.attrs['path'] = np.bytes_('.')
+        f.attrs['source_present'] = 0
+        f.attrs['tallies_present'] = 1
+        f.attrs['cmfd_on'] = 0
+        f['seed'] = seed
+        f['run_mode'] = np.bytes_('eigenvalue')
+        f['n_particles'] = 100
+        f['n_batches'] = n_realizations
+        f['current_batch'] = n_realizations
+        f['n_inactive'] = 0
+        f['generations_per_batch'] = 1
+        f['n_realizations'] = n_realizations
+
+        # Sums and sums of squares of the three estimates of k-effective
+        k = 1. + 0.01*rng.randn(n_realizations, 3)
+        global_tallies = rng.rand(4, 3)
+        global_tallies[:3, 1] = k.sum(axis=0)
+        global_tallies[:3, 2] = (k**2).sum(axis=0)
+        f['global_tallies'] = global_tallies
+        f['k_col_abs'] = np.sum(k[:, 0]*k[:, 1])
+        f['k_col_tra'] = np.sum(k[:, 0]*k[:, 2])
+        f['k_abs_tra'] = np.sum(k[:, 1]*k[:, 2])
+        f['k_combined'] = np.zeros(2)
+
+        tallies = f.create_group('tallies')
+        tallies.attrs['n_tallies'] = 1
+        tallies.attrs['ids'] = [1]
+        meshes = tallies.create_group('meshes')
+        meshes.attrs['n_meshes'] = 0
+        filters = tallies.create_group('filters')
+        filters.attrs['n_filters'] = 1
+        filters.attrs['ids'] = [1]
+        group = filters.create_group('filter 1')
+        group['type'] = np.bytes_('cell')
+        group['n_bins'] = 5
+        group['bins'] = np.arange(1, 6)
+
+        group = tallies.create_group('tally 1')
+        group['name'] = np.bytes_('')
+        group['estimator'] = np.bytes_('tracklength')
+        group['n_realizations'] = n_realizations
+        group['n_filters'] = 1
+        group['filters'] = [1]
+        group['nuclides'] = np.array([np.bytes_('total')])
+        group['n_score_bins'] = 2
+        group['score_bins'] = np.array([b'flux', b'total'])
+        group['n_user_score_bins'] = 2
+        group['moment_orders'] = np.array([b'', b''])
+        results = rng.rand(5, 2, 2)
+        group['results'] = results.astype(results_dtype)
+
+
+if __name__ == '__main__':
+    # This test doesn't require an OpenMC run. We just need to make sure that
+    # the tally results, numbers of realizations and combined estimate of
+    # k-effective of several statepoints are pooled when they are merged.
+
+    directory = tempfile.mkdtemp()
+    try:
+        filenames = [os.path.join(directory, 'statepoint.{}.h5'.format(i))
+                     for i in range(3)]
+        for i, filename in enumerate(filenames):
+            write_statepoint(filename, i, 10 + i)
+        path = os.path.join(directory, 'statepoint.merged.h5')
+
+        statepoints = [openmc.StatePoint(f, autolink=False)
+                       for f in filenames]
+        n = sum(sp.n_realizations for sp in statepoints)
+        tallies = [sp.tallies[1] for sp in statepoints]
+        total = sum(t.sum for t in tallies)
+        total_sq = sum(t.sum_sq for t in tallies)
+        global_tallies = sum(sp._f['global_tallies'][()] for sp in statepoints)
+        k_cross = np.sum([[sp._f['k_col_abs'][()], sp._f['k_col_tra'][()],
+                           sp._f['k_abs_tra'][()]] for sp in statepoints],
+                         axis=0)
+        k_combined = _combined_keff(global_tallies[:3, 1],
+                                    global_tallies[:3, 2], k_cross, n)
+        for sp in statepoints:
+            sp._f.close()
+
+        # Merge in the calling process and with a pool of workers summing
+        # slices of a single filter bin
+        for chunk_size, processes in ((2**20, 1), (4, 2)):
+            merged = openmc.merge_statepoints(
+                filenames, path, chunk_size=chunk_size, processes=processes)
+            tally = merged.tallies[1]
+            assert merged.n_realizations == n
+            assert tally.num_realizations == n
+            assert np.allclose(tally.sum, total)
+            assert np.allclose(tally.sum_sq, total_sq)
+            assert np.allclose(tally.mean, total/n)
+            assert np.allclose(merged.global_tallies['sum'],
+                               global_tallies[:, 1])
+            assert np.allclose(merged.global_tallies['sum_sq'],
+                               global_tallies[:, 2])
+            assert np.allclose(merged.k_combined, k_combined)
+            merged._f.close()
+
+        # The merged statepoint may not overwrite one of the statepoints
+        size = os.path.getsize(filenames[1])
+        try:
+            openmc.merge_statepoints(filenames, filenames[1], processes=1)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('Merging into an input did not raise')
+        assert os.path.getsize(filenames[1]) == size
+
+        # No partially merged statepoint is left behind when summing fails
+        os.remove(path)
+        write_statepoint(filenames[2], 2, 12, results_dtype='S8')
+        try:
+            openmc.merge_statepoints(filenames, path, processes=1)
+        except Exception:
+            pass
+        else:
+            raise AssertionError('Merging unreadable results did not raise')
+        assert not os.path.exists(path)
+
+    finally:
+        shutil.rmtree(directory)